@@ -179,6 +179,97 @@ def _validate_features_for_import(
     return valid_features, errors, warnings
 
 
+def _build_feature_filters(
+    cur,
+    conn,
+    auth: Optional[AuthContext],
+    tileset_id: Optional[str],
+    layer: Optional[str],
+    bbox: Optional[str],
+) -> Tuple[str, list]:
+    """
+    Build the WHERE clause shared by the feature listing and stats queries.
+
+    Checks read access when a tileset is given; otherwise restricts the
+    query to public tilesets.
+
+    Args:
+        cur: Database cursor
+        conn: Database connection
+        auth: Auth context of the caller (None for anonymous)
+        tileset_id: Optional tileset filter
+        layer: Optional layer name filter
+        bbox: Optional bounding box filter (minx,miny,maxx,maxy)
+
+    Returns:
+        Tuple of (where_clause, params) for a query joining features f and tilesets t
+
+    Raises:
+        HTTPException: 401/403 when the tileset is not readable, 400 for a bad bbox
+    """
+    conditions = []
+    params = []
+
+    if tileset_id:
+        # Check access to tileset
+        cur.execute(
+            "SELECT id, is_public, user_id FROM tilesets WHERE id = %s",
+            (tileset_id,),
+        )
+        row = cur.fetchone()
+
+        if row:
+            tileset_for_access = {
+                "id": row[0],
+                "is_public": row[1],
+                "user_id": row[2],
+            }
+
+            if not check_tileset_access_v2(conn, tileset_for_access, auth):
+                if auth is None:
+                    # NOTE: Phase 2b では envelope 化を見送り。
+                    # api_error() は headers= を受けないため、
+                    # WWW-Authenticate を維持するために HTTPException を直書きしている (#106)。
+                    raise HTTPException(
+                        status_code=401,
+                        detail="Authentication required to access this tileset",
+                        headers={"WWW-Authenticate": "Bearer"},
+                    )
+                raise api_error(
+                    403,
+                    ErrorCode.TILESET_FORBIDDEN,
+                    "You do not have permission to access this tileset",
+                    details={"tileset_id": tileset_id},
+                )
+
+        conditions.append("f.tileset_id = %s")
+        params.append(tileset_id)
+    else:
+        # Only return features from public tilesets if no tileset_id specified
+        conditions.append("t.is_public = true")
+
+    if layer:
+        conditions.append("f.layer_name = %s")
+        params.append(layer)
+
+    if bbox:
+        try:
+            minx, miny, maxx, maxy = [float(x) for x in bbox.split(",")]
+            conditions.append("ST_Intersects(f.geom, ST_MakeEnvelope(%s, %s, %s, %s, 4326))")
+            params.extend([minx, miny, maxx, maxy])
+        except ValueError:
+            raise api_error(
+                400,
+                ErrorCode.VALIDATION_INVALID_VALUE,
+                "Invalid bbox format",
+                details={"bbox": bbox},
+            )
+
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+
+    return where_clause, params
+
+
 # ============================================================================
 # Create Feature
 # ============================================================================
@@ -504,68 +595,7 @@ def list_features(
     """
     try:
         with conn.cursor() as cur:
-            # Build query
-            conditions = []
-            params = []
-
-            if tileset_id:
-                # Check access to tileset
-                cur.execute(
-                    "SELECT id, is_public, user_id FROM tilesets WHERE id = %s",
-                    (tileset_id,),
-                )
-                row = cur.fetchone()
-
-                if row:
-                    tileset_for_access = {
-                        "id": row[0],
-                        "is_public": row[1],
-                        "user_id": row[2],
-                    }
-
-                    if not check_tileset_access_v2(conn, tileset_for_access, auth):
-                        if auth is None:
-                            # NOTE: Phase 2b では envelope 化を見送り。
-                            # api_error() は headers= を受けないため、
-                            # WWW-Authenticate を維持するために HTTPException を直書きしている (#106)。
-                            raise HTTPException(
-                                status_code=401,
-                                detail="Authentication required to access this tileset",
-                                headers={"WWW-Authenticate": "Bearer"},
-                            )
-                        raise api_error(
-                            403,
-                            ErrorCode.TILESET_FORBIDDEN,
-                            "You do not have permission to access this tileset",
-                            details={"tileset_id": tileset_id},
-                        )
-
-                conditions.append("f.tileset_id = %s")
-                params.append(tileset_id)
-            else:
-                # Only return features from public tilesets if no tileset_id specified
-                conditions.append("t.is_public = true")
-
-            if layer:
-                conditions.append("f.layer_name = %s")
-                params.append(layer)
-
-            if bbox:
-                try:
-                    minx, miny, maxx, maxy = [float(x) for x in bbox.split(",")]
-                    conditions.append(
-                        "ST_Intersects(f.geom, ST_MakeEnvelope(%s, %s, %s, %s, 4326))"
-                    )
-                    params.extend([minx, miny, maxx, maxy])
-                except ValueError:
-                    raise api_error(
-                        400,
-                        ErrorCode.VALIDATION_INVALID_VALUE,
-                        "Invalid bbox format",
-                        details={"bbox": bbox},
-                    )
-
-            where_clause = " AND ".join(conditions) if conditions else "1=1"
+            where_clause, params = _build_feature_filters(cur, conn, auth, tileset_id, layer, bbox)
 
             # Get total count
             cur.execute(
@@ -629,6 +659,127 @@ def list_features(
         )
 
 
+# ============================================================================
+# Feature Stats
+# ============================================================================
+
+# PostGIS GeometryType() names mapped to their GeoJSON spelling
+_GEOJSON_TYPE_NAMES = {
+    "POINT": "Point",
+    "LINESTRING": "LineString",
+    "POLYGON": "Polygon",
+    "MULTIPOINT": "MultiPoint",
+    "MULTILINESTRING": "MultiLineString",
+    "MULTIPOLYGON": "MultiPolygon",
+    "GEOMETRYCOLLECTION": "GeometryCollection",
+}
+
+
+# NOTE: "/{feature_id}" より前に登録すること（"stats" が feature_id として
+# マッチしてしまうため）。
+@router.get("/stats")
+def get_feature_stats(
+    tileset_id: str = Query(None, description="Filter by tileset ID"),
+    layer: str = Query(None, description="Filter by layer name"),
+    bbox: str = Query(None, description="Bounding box filter (minx,miny,maxx,maxy)"),
+    include_property_keys: bool = Query(
+        False, description="Include the distinct property keys of each layer"
+    ),
+    conn=Depends(get_connection),
+    auth: Optional[AuthContext] = Depends(get_auth_context_optional),
+):
+    """
+    Aggregate statistics for the features matching the filters.
+
+    Counts are computed in the database over every matching feature, so
+    clients get exact totals without downloading any geometries.
+    Filters and access checks are the same as for listing features.
+    """
+    try:
+        with conn.cursor() as cur:
+            where_clause, params = _build_feature_filters(cur, conn, auth, tileset_id, layer, bbox)
+
+            cur.execute(
+                f"""
+                SELECT f.tileset_id, f.layer_name, GeometryType(f.geom),
+                       COUNT(*), SUM(ST_NPoints(f.geom))
+                FROM features f
+                JOIN tilesets t ON f.tileset_id = t.id
+                WHERE {where_clause}
+                GROUP BY f.tileset_id, f.layer_name, GeometryType(f.geom)
+                """,
+                params,
+            )
+            rows = cur.fetchall()
+
+            total_features = 0
+            total_coordinates = 0
+            geometry_types: dict = {}
+            layers: dict = {}
+            tilesets = set()
+
+            for ts_id, layer_name, geom_type, count, coordinates in rows:
+                geom_type = _GEOJSON_TYPE_NAMES.get(geom_type, geom_type or "Unknown")
+                coordinates = int(coordinates or 0)
+
+                total_features += count
+                total_coordinates += coordinates
+                geometry_types[geom_type] = geometry_types.get(geom_type, 0) + count
+                tilesets.add(str(ts_id))
+
+                layer_stats = layers.setdefault(
+                    layer_name,
+                    {"feature_count": 0, "geometry_types": {}, "coordinate_count": 0},
+                )
+                layer_stats["feature_count"] += count
+                layer_stats["coordinate_count"] += coordinates
+                layer_stats["geometry_types"][geom_type] = (
+                    layer_stats["geometry_types"].get(geom_type, 0) + count
+                )
+
+            if include_property_keys and layers:
+                cur.execute(
+                    f"""
+                    SELECT f.layer_name, array_agg(DISTINCT k.key ORDER BY k.key)
+                    FROM features f
+                    JOIN tilesets t ON f.tileset_id = t.id
+                    CROSS JOIN LATERAL jsonb_object_keys(
+                        COALESCE(f.properties, '{{}}'::jsonb)
+                    ) AS k(key)
+                    WHERE {where_clause}
+                    GROUP BY f.layer_name
+                    """,
+                    params,
+                )
+                for layer_name, keys in cur.fetchall():
+                    if layer_name in layers:
+                        layers[layer_name]["property_keys"] = list(keys)
+                for layer_stats in layers.values():
+                    layer_stats.setdefault("property_keys", [])
+
+            return {
+                "total_features": total_features,
+                "geometry_types": geometry_types,
+                "layers": layers,
+                "coordinate_count": total_coordinates,
+                "tilesets_found": len(tilesets),
+                "query": {
+                    "tileset_id": tileset_id,
+                    "layer": layer,
+                    "bbox": bbox,
+                },
+            }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise api_error(
+            500,
+            ErrorCode.INTERNAL_DB_ERROR,
+            f"Error computing feature stats: {str(e)}",
+        )
+
+
 # ============================================================================
 # Get Feature
 # ============================================================================
@@ -0,0 +1,160 @@
+"""Integration tests for GET /api/features/stats.
+
+features を DB 側で集計して返すエンドポイントを HTTP レイヤで検証する。
+MCP サーバーの統計ツールが 1000 件の GeoJSON を取得して手元で数える代わりに
+使う想定なので、件数・ジオメトリ種別・レイヤー別集計・座標数と、
+一覧 API と同じアクセス制御が効いていることを確認する。
+
+seed は db_conn 上で未コミットのまま行い、test 終了時の rollback で消える
+（test_features_datasources_team_access.py と同じ方式）。
+"""
+
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from lib.auth import AuthContext, get_auth_context_optional
+from lib.database import get_connection
+from lib.routers.features import router as features_router
+
+
+@pytest.fixture
+def app(db_conn):
+    """features router だけを乗せた最小 FastAPI app。"""
+    app = FastAPI()
+    app.include_router(features_router)
+
+    def _get_conn():
+        yield db_conn
+
+    app.dependency_overrides[get_connection] = _get_conn
+    return app
+
+
+@pytest.fixture
+def client_for(app):
+    """`AuthContext` (or None) を渡して TestClient を作る factory。"""
+
+    def _make(ctx):
+        async def _override():
+            return ctx
+
+        app.dependency_overrides[get_auth_context_optional] = _override
+        return TestClient(app)
+
+    return _make
+
+
+@pytest.fixture
+def make_tileset(db_conn):
+    """tileset を 1 件作り、features を layer / WKT の組で投入する。"""
+
+    def _make(features, owner_id=None, is_public=False):
+        owner_id = owner_id or str(uuid.uuid4())
+        ts_id = str(uuid.uuid4())
+        with db_conn.cursor() as cur:
+            cur.execute(
+                """INSERT INTO tilesets (id, name, type, format, user_id, is_public)
+                   VALUES (%s, 'tx', 'vector', 'pbf', %s, %s)""",
+                (ts_id, owner_id, is_public),
+            )
+            for layer_name, wkt, properties in features:
+                cur.execute(
+                    """INSERT INTO features (id, tileset_id, layer_name, geom, properties)
+                       VALUES (%s, %s, %s, ST_GeomFromText(%s, 4326), %s::jsonb)""",
+                    (str(uuid.uuid4()), ts_id, layer_name, wkt, properties),
+                )
+        return {"tileset_id": ts_id, "owner_id": owner_id}
+
+    return _make
+
+
+def jwt_ctx(user_id):
+    return AuthContext(
+        user_id=user_id,
+        scopes=["read", "write", "delete", "admin"],
+        is_api_key=False,
+    )
+
+
+SAMPLE_FEATURES = [
+    ("stations", "POINT(139.70 35.69)", '{"name": "Shinjuku"}'),
+    ("stations", "POINT(139.77 35.68)", '{"name": "Tokyo", "lines": 10}'),
+    ("rails", "LINESTRING(139.70 35.69, 139.74 35.68, 139.77 35.68)", "{}"),
+    (
+        "parks",
+        "POLYGON((139.69 35.67, 139.70 35.67, 139.70 35.68, 139.69 35.67))",
+        '{"area": 1}',
+    ),
+]
+
+
+class TestFeatureStats:
+    def test_aggregates_counts(self, client_for, make_tileset):
+        ts = make_tileset(SAMPLE_FEATURES)
+        client = client_for(jwt_ctx(ts["owner_id"]))
+
+        res = client.get(f"/api/features/stats?tileset_id={ts['tileset_id']}")
+        assert res.status_code == 200, res.text
+        body = res.json()
+
+        assert body["total_features"] == 4
+        assert body["geometry_types"] == {"Point": 2, "LineString": 1, "Polygon": 1}
+        # 1 + 1 + 3 + 4 points
+        assert body["coordinate_count"] == 9
+        assert body["tilesets_found"] == 1
+        assert body["layers"]["stations"] == {
+            "feature_count": 2,
+            "geometry_types": {"Point": 2},
+            "coordinate_count": 2,
+        }
+
+    def test_property_keys_opt_in(self, client_for, make_tileset):
+        ts = make_tileset(SAMPLE_FEATURES)
+        client = client_for(jwt_ctx(ts["owner_id"]))
+
+        res = client.get(
+            f"/api/features/stats?tileset_id={ts['tileset_id']}&include_property_keys=true"
+        )
+        assert res.status_code == 200, res.text
+        layers = res.json()["layers"]
+
+        assert layers["stations"]["property_keys"] == ["lines", "name"]
+        assert layers["rails"]["property_keys"] == []
+
+    def test_bbox_filter(self, client_for, make_tileset):
+        ts = make_tileset(SAMPLE_FEATURES)
+        client = client_for(jwt_ctx(ts["owner_id"]))
+
+        res = client.get(
+            f"/api/features/stats?tileset_id={ts['tileset_id']}&bbox=139.76,35.67,139.78,35.69"
+        )
+        assert res.status_code == 200, res.text
+        body = res.json()
+
+        # Tokyo station and the rail line reach into the box
+        assert body["total_features"] == 2
+        assert set(body["layers"]) == {"stations", "rails"}
+
+    def test_invalid_bbox(self, client_for, make_tileset):
+        ts = make_tileset(SAMPLE_FEATURES)
+        client = client_for(jwt_ctx(ts["owner_id"]))
+
+        res = client.get(f"/api/features/stats?tileset_id={ts['tileset_id']}&bbox=oops")
+        assert res.status_code == 400
+
+    def test_outsider_denied(self, client_for, make_tileset):
+        ts = make_tileset(SAMPLE_FEATURES)
+        client = client_for(jwt_ctx(str(uuid.uuid4())))
+
+        res = client.get(f"/api/features/stats?tileset_id={ts['tileset_id']}")
+        assert res.status_code == 403
+
+    def test_anonymous_on_private_returns_401(self, client_for, make_tileset):
+        ts = make_tileset(SAMPLE_FEATURES)
+        client = client_for(None)
+
+        res = client.get(f"/api/features/stats?tileset_id={ts['tileset_id']}")
+        assert res.status_code == 401
@@ -0,0 +1,399 @@
+"""
+In-memory caching helpers for geo-base MCP Server.
+
+Provides:
+- TTLCache: caches responses of read-only lookups so that repeated
+  identical calls are answered without a network round-trip
+- DiskCache: a persistent SQLite-backed second level that survives
+  server restarts
+- SingleFlight: coalesces concurrent identical calls onto one request
+
+The server runs on a single event loop, so the in-memory structures need
+no locking. DiskCache runs its queries in worker threads and serializes
+them with a lock.
+
+Usage:
+    from cache import geocoding_cache, geocoding_flights
+
+    cached = geocoding_cache.get(key)
+    if cached is None:
+        cached = await geocoding_flights.do(key, lambda: fetch(...))
+        geocoding_cache.set(key, cached)
+"""
+
+import asyncio
+import copy
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from config import get_settings
+from logger import get_logger
+
+T = TypeVar("T")
+
+logger = get_logger(__name__)
+
+
+def _identity(value: T) -> T:
+    return value
+
+
+# Every TTLCache instance, so tests (and admin tooling) can reset them all
+_registry: list["TTLCache"] = []
+
+
+class TTLCache:
+    """
+    A bounded TTL (Time-To-Live) cache with LRU eviction.
+
+    Values are deep-copied on the way in and out by default, so callers can
+    freely mutate what they get back without corrupting the cached entry.
+    Caches whose callers treat values as read-only can skip the copies.
+
+    Usage:
+        cache = TTLCache(ttl=60, max_size=1000)
+        cache.set(("search", "tokyo"), {"results": [...]})
+        result = cache.get(("search", "tokyo"))  # Cached copy or None
+    """
+
+    def __init__(self, ttl: float = 60.0, max_size: int = 1000, copy_values: bool = True):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Time-to-live in seconds for cache entries (default: 60)
+            max_size: Maximum number of entries (default: 1000)
+            copy_values: Deep-copy values on set and get (default: True);
+                disable only when no caller mutates cached values
+        """
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._ttl = ttl
+        self._max_size = max_size
+        self._copy = copy.deepcopy if copy_values else _identity
+        _registry.append(self)
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Get a cached value (a copy unless copying is disabled).
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Copy of the cached value if found and not expired, None otherwise
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() > expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return self._copy(value)
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """
+        Store a value, evicting the least recently used entries when full.
+
+        Args:
+            key: Cache key
+            value: Value to cache (stored as a copy unless copying is disabled)
+            ttl: Optional custom TTL for this entry (defaults to cache TTL)
+        """
+        entry_ttl = ttl if ttl is not None else self._ttl
+        self._entries[key] = (time.monotonic() + entry_ttl, self._copy(value))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> bool:
+        """
+        Delete a value from the cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the key was found and deleted, False otherwise
+        """
+        return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Clear all entries from the cache."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCache:
+    """
+    A persistent TTL cache stored in a SQLite file.
+
+    Keys and values must be JSON-serializable (tuple keys are stored as
+    lists). Entries expire by wall-clock time so they stay valid across
+    restarts. The database is opened on first use; an empty path disables
+    the cache. SQLite errors are logged and treated as misses, so a broken
+    cache file never fails a lookup.
+
+    Usage:
+        cache = DiskCache("~/.cache/geo-base/geocoding.sqlite3", ttl=86400)
+        await cache.aset(("search", "tokyo"), {"results": [...]})
+        result = await cache.aget(("search", "tokyo"))  # Value or None
+    """
+
+    # Expired and excess entries are pruned once every this many writes
+    PRUNE_INTERVAL = 100
+
+    def __init__(self, path: str, ttl: float = 86400.0, max_size: int = 100_000):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file ("~" is expanded; "" disables the cache)
+            ttl: Time-to-live in seconds for cache entries (default: 86400)
+            max_size: Maximum number of entries (default: 100000)
+        """
+        self._path = path
+        self._ttl = ttl
+        self._max_size = max_size
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a database path is configured."""
+        return bool(self._path)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            path = Path(self._path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if found and not expired, None otherwise
+        """
+        if not self.enabled:
+            return None
+        try:
+            with self._lock:
+                row = (
+                    self._connect()
+                    .execute(
+                        "SELECT value FROM entries WHERE key = ? AND expires_at > ?",
+                        (json.dumps(key), time.time()),
+                    )
+                    .fetchone()
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Disk cache read failed: {e}")
+            return None
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """
+        Store a value, periodically pruning expired and excess entries.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Optional custom TTL for this entry (defaults to cache TTL)
+        """
+        if not self.enabled:
+            return
+        now = time.time()
+        entry_ttl = ttl if ttl is not None else self._ttl
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                    (json.dumps(key), json.dumps(value), now + entry_ttl),
+                )
+                self._writes += 1
+                if self._writes % self.PRUNE_INTERVAL == 0:
+                    self._prune(conn, now)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Disk cache write failed: {e}")
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        conn.execute(
+            "DELETE FROM entries WHERE key IN ("
+            "SELECT key FROM entries ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+            (self._max_size,),
+        )
+
+    async def aget(self, key: Hashable) -> Any | None:
+        """Like :meth:`get`, run in a worker thread."""
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Like :meth:`set`, run in a worker thread."""
+        if self.enabled:
+            await asyncio.to_thread(self.set, key, value, ttl)
+
+    def clear(self) -> None:
+        """Delete every entry from the database."""
+        if not self.enabled:
+            return
+        try:
+            with self._lock:
+                self._connect().execute("DELETE FROM entries")
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Disk cache clear failed: {e}")
+
+    def close(self) -> None:
+        """Close the database connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key onto a single in-flight call.
+
+    The first caller for a key starts the function as a task; callers
+    arriving while it is still running await the same outcome (a deep copy
+    of the result, or the same exception) instead of issuing a duplicate
+    request. Cancelling any caller, the first one included, leaves the
+    task running for the others.
+
+    Usage:
+        flights = SingleFlight()
+        data = await flights.do(("search", "tokyo"), lambda: fetch(url))
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``fn`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key: Key identifying identical calls
+            fn: Zero-argument function returning the awaitable to run
+
+        Returns:
+            Result of the (possibly shared) call
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            # shield: a cancelled follower must not cancel the shared call
+            return copy.deepcopy(await asyncio.shield(task))
+
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        # The leader awaits through shield too, so its cancellation does not
+        # reach the followers still waiting on the task
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished call, marking its exception as retrieved."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Callers re-raise it; don't warn when they were all cancelled
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
+def clear_all_caches() -> None:
+    """Clear every TTLCache instance in the process."""
+    for cache in _registry:
+        cache.clear()
+
+
+# =============================================================================
+# Global cache instances
+# =============================================================================
+
+# Geocoding responses (forward and reverse)
+# TTL: 24 hours - place names and addresses change rarely, and Nominatim's
+# usage policy asks clients to cache results
+geocoding_cache = TTLCache(ttl=86400.0, max_size=4096)
+
+# Persistent second level for geocoding responses, so a restarted server
+# does not re-query Nominatim. TTL: 7 days; GEOCODE_CACHE_PATH="" disables it
+geocoding_disk_cache = DiskCache(
+    get_settings().geocode_cache_path, ttl=7 * 86400.0, max_size=100_000
+)
+
+# In-flight Nominatim requests, shared by concurrent identical lookups
+geocoding_flights = SingleFlight()
+
+# Tileset listings (/api/tilesets), keyed by the query parameters; the type
+# and visibility filters leave only a handful of distinct keys. Cleared when a
+# tileset is created, updated or deleted through the CRUD tools
+# TTL: 30 seconds - catalogue queries repeat often within a session, and
+# list_tilesets only reads the response, so it is shared instead of copied
+tileset_list_cache = TTLCache(ttl=30.0, max_size=32, copy_values=False)
+
+# In-flight tileset listing requests, shared by concurrent identical calls
+tileset_list_flights = SingleFlight()
+
+# Tileset metadata (/api/tilesets/{id}), keyed by tileset ID; shared by
+# get_tileset and the stats tools, and dropped when a tileset is updated or
+# deleted through the CRUD tools
+# TTL: 60 seconds - names, bounds and zoom ranges change rarely, and a
+# minute-old snapshot is fine for browsing and statistics
+tileset_info_cache = TTLCache(ttl=60.0, max_size=256)
+
+# In-flight tileset metadata requests, shared by concurrent lookups
+tileset_info_flights = SingleFlight()
+
+# TileJSON documents (/api/tilesets/{id}/tilejson.json), keyed by tileset ID
+# TTL: 60 seconds - derived from the tileset metadata, so cached alike
+tilejson_cache = TTLCache(ttl=60.0, max_size=256)
+
+# In-flight TileJSON requests, shared by concurrent lookups
+tilejson_flights = SingleFlight()
+
+# Feature lists and aggregates fetched by the stats tools, keyed by (url, params)
+# TTL: 5 seconds - long enough for a client calling several stats tools on
+# the same tileset in a row to fetch the data once, short enough that
+# edits show up almost immediately. The tools only read the responses, so
+# the (large) values are shared instead of deep-copied
+stats_features_cache = TTLCache(ttl=5.0, max_size=64, copy_values=False)
+
+# In-flight feature fetches, shared by concurrent stats tool calls
+stats_features_flights = SingleFlight()
+
+# Tile servers found not to provide GET /api/features/stats, so the stats
+# tools aggregate features locally without probing it on every call.
+# TTL: 10 minutes - an upgraded tile server is picked up without a restart
+stats_endpoint_unsupported = TTLCache(ttl=600.0, max_size=16)
@@ -47,6 +47,45 @@ class Settings(BaseSettings):
         default=30.0,
         description="HTTP request timeout in seconds",
     )
+    http_max_connections: int = Field(
+        default=64,
+        ge=1,
+        description="Maximum concurrent connections of the shared HTTP client",
+    )
+    http_max_keepalive_connections: int = Field(
+        default=32,
+        ge=0,
+        description="Maximum idle connections the shared HTTP client keeps open for reuse",
+    )
+
+    # Geocoding configuration
+    nominatim_url: str = Field(
+        default="https://nominatim.openstreetmap.org",
+        description="Base URL of the Nominatim service used for geocoding",
+    )
+    nominatim_min_interval: float = Field(
+        default=1.0,
+        ge=0,
+        description=(
+            "Minimum seconds between Nominatim requests "
+            "(1.0 per the public usage policy; 0 disables pacing)"
+        ),
+    )
+    geocode_max_parallel: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Maximum concurrent Nominatim requests for batch geocoding "
+            "(keep at 1 for the public Nominatim service)"
+        ),
+    )
+    geocode_cache_path: str = Field(
+        default="~/.cache/geo-base/geocoding.sqlite3",
+        description=(
+            "SQLite file persisting geocoding results across restarts "
+            "(empty string disables the disk cache)"
+        ),
+    )
 
     # Environment
     environment: str = Field(
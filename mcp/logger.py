@@ -14,6 +14,7 @@ Usage:
 import logging
 import os
 import sys
+import time
 from functools import lru_cache
 from typing import Any
 
@@ -80,6 +81,9 @@ class ToolCallLogger:
     """
     Context manager for logging tool calls with timing and result tracking.
 
+    Whether the logger emits INFO is checked once on entry; when it doesn't,
+    timing and result summarization are skipped (failures are still logged).
+
     Usage:
         async def my_tool(param: str) -> dict:
             with ToolCallLogger(logger, "my_tool", param=param) as log:
@@ -100,9 +104,12 @@ class ToolCallLogger:
         self.result: Any = None
         self.error: Exception | None = None
         self._start_time: float = 0
+        self._enabled = False
 
     def __enter__(self) -> "ToolCallLogger":
-        import time
+        self._enabled = self.logger.isEnabledFor(logging.INFO)
+        if not self._enabled:
+            return self
 
         self._start_time = time.time()
 
@@ -114,9 +121,10 @@ class ToolCallLogger:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
-        import time
+        if exc_val is None and not self._enabled:
+            return False
 
-        elapsed_ms = (time.time() - self._start_time) * 1000
+        elapsed_ms = (time.time() - self._start_time) * 1000 if self._enabled else 0.0
 
         if exc_val is not None:
             # Log error
@@ -10,6 +10,10 @@ Features:
 - Configurable retry count and delays
 - Detailed logging of retry attempts
 - Support for both GET and POST requests
+- Item-by-item streaming of large JSON arrays (when ijson is installed)
+- A shared connection pool reused across requests (see get_shared_client),
+  speaking HTTP/2 when h2 is installed
+- Faster JSON decoding of response bodies (when orjson is installed)
 
 Usage:
     from retry import fetch_with_retry, post_with_retry
@@ -31,7 +35,12 @@ Configuration:
     - RETRY_MAX_WAIT: Maximum wait between retries in seconds (default: 10)
 """
 
+import asyncio
+import json
 import os
+from collections.abc import AsyncIterator, Callable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 import httpx
@@ -47,6 +56,32 @@ from tenacity import (
 from config import get_settings
 from logger import get_logger
 
+# ijson for incremental parsing of large JSON responses (optional)
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    ijson = None
+
+# h2 enables HTTP/2 on the shared client (optional, httpx[http2])
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# orjson for faster JSON decoding (optional)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 logger = get_logger(__name__)
 settings = get_settings()
 
@@ -66,33 +101,130 @@ RETRYABLE_EXCEPTIONS = (
 )
 
 
+# Bytes handed to ijson per read when stream-parsing a response body
+STREAM_CHUNK_SIZE = 8192
+
+# Connection pool limits for the shared client. max_connections caps
+# concurrent connections across all hosts (HTTP_MAX_CONNECTIONS, default 64),
+# so large fan-outs queue for a connection instead of flooding the tile
+# server or Nominatim (whose batch concurrency is further bounded by
+# GEOCODE_MAX_PARALLEL). Idle connections are kept for reuse up to
+# HTTP_MAX_KEEPALIVE_CONNECTIONS, so concurrent tool calls skip new
+# TCP/TLS handshakes
+SHARED_CLIENT_LIMITS = httpx.Limits(
+    max_keepalive_connections=settings.http_max_keepalive_connections,
+    max_connections=settings.http_max_connections,
+    keepalive_expiry=30.0,
+)
+
+# One client per event loop; connections cannot be shared across loops
+_shared_client: httpx.AsyncClient | None = None
+_shared_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client for the running event loop.
+
+    Reusing one client keeps connections (and their TLS sessions) alive
+    between requests instead of re-establishing them on every call. The
+    client is created lazily, and recreated if it was closed or belongs to
+    a different event loop. Creation does not await, so concurrent callers
+    on the same loop cannot race to build duplicates.
+
+    When h2 is installed the client negotiates HTTP/2, so concurrent
+    requests to one host are multiplexed over a single connection.
+    Response compression needs no setup: httpx advertises every encoding
+    it can decode (gzip, deflate, and br when brotli is installed).
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _shared_client, _shared_client_loop
+
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client_loop is not loop or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=settings.http_timeout,
+            limits=SHARED_CLIENT_LIMITS,
+            http2=HTTP2_AVAILABLE,
+        )
+        _shared_client_loop = loop
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client, if one is open on the running loop."""
+    global _shared_client, _shared_client_loop
+
+    client, client_loop = _shared_client, _shared_client_loop
+    _shared_client = None
+    _shared_client_loop = None
+
+    if client is not None and client_loop is asyncio.get_running_loop():
+        await client.aclose()
+
+
+async def warm_shared_client(url: str) -> None:
+    """Open a pooled connection to ``url``'s host ahead of the first tool call.
+
+    Issues one cheap GET through the shared client so DNS resolution and
+    the TCP/TLS handshake are done before a user is waiting on them. The
+    connection then stays in the pool until it has been idle for the
+    keepalive expiry. Failures are only logged: the server may not be up
+    yet, and the first real request simply connects as usual.
+
+    Args:
+        url: Lightweight endpoint on the host to connect to
+    """
+    try:
+        response = await get_shared_client().get(url)
+        logger.debug(f"Warmed connection to {url}: {response.status_code}")
+    except httpx.HTTPError as e:
+        logger.debug(f"Connection warm-up to {url} failed: {e}")
+
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def parse_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    return _json_loads(response.content)
+
+
+@lru_cache(maxsize=32)
 def _create_retry_config(
     max_attempts: int | None = None,
     min_wait: float | None = None,
     max_wait: float | None = None,
-) -> dict[str, Any]:
+) -> Mapping[str, Any]:
     """Create retry configuration for tenacity.
 
+    The strategy objects are stateless (per-call state lives in each
+    AsyncRetrying), so one read-only configuration is built per distinct
+    set of arguments and shared by every request.
+
     Args:
         max_attempts: Maximum number of retry attempts
         min_wait: Minimum wait time between retries (seconds)
         max_wait: Maximum wait time between retries (seconds)
 
     Returns:
-        Dictionary of tenacity retry parameters
+        Read-only mapping of tenacity retry parameters
     """
-    return {
-        "stop": stop_after_attempt(max_attempts or RETRY_MAX_ATTEMPTS),
-        "wait": wait_exponential(
-            multiplier=1,
-            min=min_wait or RETRY_MIN_WAIT,
-            max=max_wait or RETRY_MAX_WAIT,
-        ),
-        "retry": retry_if_exception_type(RETRYABLE_EXCEPTIONS),
-        "before_sleep": before_sleep_log(logger, log_level=20),  # INFO level
-        "after": after_log(logger, log_level=10),  # DEBUG level
-        "reraise": True,
-    }
+    return MappingProxyType(
+        {
+            "stop": stop_after_attempt(max_attempts or RETRY_MAX_ATTEMPTS),
+            "wait": wait_exponential(
+                multiplier=1,
+                min=min_wait or RETRY_MIN_WAIT,
+                max=max_wait or RETRY_MAX_WAIT,
+            ),
+            "retry": retry_if_exception_type(RETRYABLE_EXCEPTIONS),
+            "before_sleep": before_sleep_log(logger, log_level=20),  # INFO level
+            "after": after_log(logger, log_level=10),  # DEBUG level
+            "reraise": True,
+        }
+    )
 
 
 async def fetch_with_retry(
@@ -101,6 +233,7 @@ async def fetch_with_retry(
     headers: dict[str, str] | None = None,
     timeout: float | None = None,
     max_attempts: int | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any]:
     """Fetch data from a URL with automatic retry on transient failures.
 
@@ -114,6 +247,7 @@ async def fetch_with_retry(
         headers: Optional HTTP headers
         timeout: Request timeout in seconds (default: from settings)
         max_attempts: Maximum retry attempts (default: 3)
+        client: HTTP client to use (default: the shared client)
 
     Returns:
         Parsed JSON response as a dictionary
@@ -148,15 +282,110 @@ async def fetch_with_retry(
                 },
             )
 
-            async with httpx.AsyncClient(timeout=request_timeout) as client:
-                response = await client.get(url, params=params, headers=headers)
-                response.raise_for_status()
-                return response.json()
+            http_client = client or get_shared_client()
+            response = await http_client.get(
+                url, params=params, headers=headers, timeout=request_timeout
+            )
+            response.raise_for_status()
+            return parse_json(response)
 
     # This should never be reached due to reraise=True
     raise RuntimeError("Unexpected state: retry exhausted without exception")
 
 
+class _AsyncByteReader:
+    """Adapt an async byte iterator to the file-like interface ijson expects."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream type with read(0); don't consume a chunk for it
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
+
+def _items_at(data: Any, prefix: str) -> list[Any]:
+    """Resolve an ijson-style prefix (e.g. "features.item") on parsed JSON."""
+    for key in prefix.split(".")[:-1]:
+        data = (data.get(key) or []) if isinstance(data, dict) else []
+    return data if isinstance(data, list) else []
+
+
+async def fetch_items_with_retry(
+    url: str,
+    prefix: str,
+    transform: Callable[[Any], Any],
+    params: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None,
+    timeout: float | None = None,
+    max_attempts: int | None = None,
+    client: httpx.AsyncClient | None = None,
+) -> list[Any]:
+    """Fetch a JSON array and transform its items while the body streams in.
+
+    Items are parsed one at a time with ijson and passed to ``transform``,
+    so the raw parsed tree of a large response never exists in memory at
+    once. Falls back to :func:`fetch_with_retry` when ijson is not installed.
+
+    Args:
+        url: The URL to fetch
+        prefix: ijson prefix of the items to yield ("item" for a top-level
+            array, "features.item" for a FeatureCollection)
+        transform: Function applied to each parsed item
+        params: Optional query parameters
+        headers: Optional HTTP headers
+        timeout: Request timeout in seconds (default: from settings)
+        max_attempts: Maximum retry attempts (default: 3)
+        client: HTTP client to use (default: the shared client)
+
+    Returns:
+        List of transformed items
+
+    Raises:
+        httpx.HTTPStatusError: For HTTP error responses (4xx, 5xx)
+        httpx.TimeoutException: If all retries fail due to timeout
+        httpx.NetworkError: If all retries fail due to network issues
+    """
+    if not IJSON_AVAILABLE:
+        data = await fetch_with_retry(
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            max_attempts=max_attempts,
+            client=client,
+        )
+        return [transform(item) for item in _items_at(data, prefix)]
+
+    retry_config = _create_retry_config(max_attempts=max_attempts)
+    request_timeout = timeout or settings.http_timeout
+
+    async for attempt in AsyncRetrying(**retry_config):
+        with attempt:
+            logger.debug(
+                f"Streaming {url}",
+                extra={
+                    "attempt": attempt.retry_state.attempt_number,
+                    "params": str(params) if params else None,
+                },
+            )
+
+            http_client = client or get_shared_client()
+            async with http_client.stream(
+                "GET", url, params=params, headers=headers, timeout=request_timeout
+            ) as response:
+                response.raise_for_status()
+                reader = _AsyncByteReader(response.aiter_bytes(STREAM_CHUNK_SIZE))
+                return [
+                    transform(item)
+                    async for item in ijson.items_async(reader, prefix, use_float=True)
+                ]
+
+    raise RuntimeError("Unexpected state: retry exhausted without exception")
+
+
 async def post_with_retry(
     url: str,
     json: dict[str, Any] | None = None,
@@ -215,15 +444,16 @@ async def post_with_retry(
                 },
             )
 
-            async with httpx.AsyncClient(timeout=request_timeout) as client:
-                response = await client.post(
-                    url,
-                    json=json,
-                    data=data,
-                    headers=headers,
-                )
-                response.raise_for_status()
-                return response.json()
+            client = get_shared_client()
+            response = await client.post(
+                url,
+                json=json,
+                data=data,
+                headers=headers,
+                timeout=request_timeout,
+            )
+            response.raise_for_status()
+            return parse_json(response)
 
     raise RuntimeError("Unexpected state: retry exhausted without exception")
 
@@ -259,10 +489,10 @@ async def put_with_retry(
                 },
             )
 
-            async with httpx.AsyncClient(timeout=request_timeout) as client:
-                response = await client.put(url, json=json, headers=headers)
-                response.raise_for_status()
-                return response.json()
+            client = get_shared_client()
+            response = await client.put(url, json=json, headers=headers, timeout=request_timeout)
+            response.raise_for_status()
+            return parse_json(response)
 
     raise RuntimeError("Unexpected state: retry exhausted without exception")
 
@@ -296,15 +526,15 @@ async def delete_with_retry(
                 },
             )
 
-            async with httpx.AsyncClient(timeout=request_timeout) as client:
-                response = await client.delete(url, headers=headers)
-                response.raise_for_status()
+            client = get_shared_client()
+            response = await client.delete(url, headers=headers, timeout=request_timeout)
+            response.raise_for_status()
 
-                # Handle empty response (204 No Content)
-                if response.status_code == 204:
-                    return {"success": True, "message": "Deleted successfully"}
+            # Handle empty response (204 No Content)
+            if response.status_code == 204:
+                return {"success": True, "message": "Deleted successfully"}
 
-                return response.json()
+            return parse_json(response)
 
     raise RuntimeError("Unexpected state: retry exhausted without exception")
 
@@ -368,7 +598,7 @@ class RetryableClient:
             with attempt:
                 response = await self._client.get(url, params=params, headers=headers)
                 response.raise_for_status()
-                return response.json()
+                return parse_json(response)
 
         raise RuntimeError("Unexpected state")
 
@@ -388,7 +618,7 @@ class RetryableClient:
             with attempt:
                 response = await self._client.post(url, json=json, headers=headers)
                 response.raise_for_status()
-                return response.json()
+                return parse_json(response)
 
         raise RuntimeError("Unexpected state")
 
@@ -408,7 +638,7 @@ class RetryableClient:
             with attempt:
                 response = await self._client.put(url, json=json, headers=headers)
                 response.raise_for_status()
-                return response.json()
+                return parse_json(response)
 
         raise RuntimeError("Unexpected state")
 
@@ -431,6 +661,6 @@ class RetryableClient:
                 if response.status_code == 204:
                     return {"success": True, "message": "Deleted successfully"}
 
-                return response.json()
+                return parse_json(response)
 
         raise RuntimeError("Unexpected state")
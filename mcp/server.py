@@ -7,12 +7,19 @@ Provides tools to access geographic data through Claude Desktop.
 Supports both stdio (local) and HTTP/SSE (remote) transports.
 """
 
+import asyncio
 import os
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any
 
+import anyio
 from fastmcp import FastMCP
 
+from cache import geocoding_disk_cache
 from config import get_settings
 from logger import get_logger
+from retry import close_shared_client, parse_json, warm_shared_client
 from tools.analysis import (
     analyze_area,
     calculate_distance,
@@ -33,7 +40,9 @@ from tools.features import (
 )
 from tools.geocoding import (
     geocode,
+    geocode_batch,
     reverse_geocode,
+    reverse_geocode_batch,
 )
 from tools.stats import (
     get_area_stats,
@@ -44,17 +53,48 @@ from tools.stats import (
 from tools.tilesets import (
     get_tileset,
     get_tileset_tilejson,
+    get_tilesets_bulk,
     list_tilesets,
 )
 
+# uvloop: faster event loop for many concurrent requests (optional)
+try:
+    import uvloop  # noqa: F401  (selected through anyio's use_uvloop option)
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Initialize settings and logger
 settings = get_settings()
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Warm up the tile server connection; close shared resources on shutdown.
+
+    The shared HTTP client connects to the tile server in the background,
+    so the first tool call skips DNS and the TCP/TLS handshake. The client
+    and the disk cache are closed on shutdown; both are reopened on demand,
+    so this is safe even if the transport runs the lifespan once per session.
+    """
+    warm_up = asyncio.create_task(
+        warm_shared_client(f"{settings.tile_server_url.rstrip('/')}/api/health")
+    )
+    try:
+        yield
+    finally:
+        warm_up.cancel()
+        await close_shared_client()
+        geocoding_disk_cache.close()
+
+
 # Create MCP server instance
 mcp = FastMCP(
     name=settings.server_name,
     version=settings.server_version,
+    lifespan=lifespan,
 )
 
 
@@ -96,6 +136,24 @@ async def tool_get_tileset(tileset_id: str) -> dict:
     return await get_tileset(tileset_id=tileset_id)
 
 
+@mcp.tool()
+async def tool_get_tilesets_bulk(tileset_ids: list[str]) -> dict:
+    """
+    Get detailed information about several tilesets in one call.
+
+    Lookups run concurrently; duplicate IDs are looked up once.
+
+    Args:
+        tileset_ids: UUIDs of the tilesets (1-50 entries)
+
+    Returns:
+        Dictionary containing:
+        - tilesets: One get_tileset response per distinct ID, in first-seen order
+        - count: Number of tilesets looked up
+    """
+    return await get_tilesets_bulk(tileset_ids=tileset_ids)
+
+
 @mcp.tool()
 async def tool_get_tileset_tilejson(tileset_id: str) -> dict:
     """
@@ -240,7 +298,7 @@ async def tool_health_check() -> dict:
         try:
             response = await client.get(f"{tile_server_url}/api/health")
             response.raise_for_status()
-            result = response.json()
+            result = parse_json(response)
             logger.info(f"Health check completed: {result.get('status', 'unknown')}")
             return result
         except httpx.HTTPError as e:
@@ -312,6 +370,38 @@ async def tool_geocode(
     )
 
 
+@mcp.tool()
+async def tool_geocode_batch(
+    queries: list[str],
+    limit: int = 5,
+    country_codes: str | None = None,
+    language: str = "ja",
+) -> dict:
+    """
+    Convert multiple addresses or place names to coordinates in one call.
+
+    Queries are geocoded concurrently (bounded by GEOCODE_MAX_PARALLEL;
+    keep it at 1 for the public Nominatim service).
+
+    Args:
+        queries: Addresses or place names to search (1-50 entries)
+        limit: Maximum number of results per query (1-50, default: 5)
+        country_codes: Limit search to specific countries (comma-separated ISO 3166-1 codes)
+        language: Preferred language for results (default: "ja" for Japanese)
+
+    Returns:
+        Dictionary containing:
+        - results: One geocode response per query, in input order
+        - count: Number of queries processed
+    """
+    return await geocode_batch(
+        queries=queries,
+        limit=limit,
+        country_codes=country_codes,
+        language=language,
+    )
+
+
 @mcp.tool()
 async def tool_reverse_geocode(
     latitude: float,
@@ -352,6 +442,36 @@ async def tool_reverse_geocode(
     )
 
 
+@mcp.tool()
+async def tool_reverse_geocode_batch(
+    points: list[list[float]],
+    zoom: int = 18,
+    language: str = "ja",
+) -> dict:
+    """
+    Convert multiple coordinates to addresses in one call.
+
+    Points are reverse geocoded concurrently (bounded by GEOCODE_MAX_PARALLEL;
+    keep it at 1 for the public Nominatim service).
+
+    Args:
+        points: [latitude, longitude] pairs in decimal degrees (1-50 entries)
+                Example: [[35.6812, 139.7671], [34.7025, 135.4959]]
+        zoom: Level of detail for the addresses (0-18, default: 18)
+        language: Preferred language for results (default: "ja" for Japanese)
+
+    Returns:
+        Dictionary containing:
+        - results: One reverse geocode response per point, in input order
+        - count: Number of points processed
+    """
+    return await reverse_geocode_batch(
+        points=points,
+        zoom=zoom,
+        language=language,
+    )
+
+
 # ============================================================
 # CRUD Tools
 # ============================================================
@@ -819,7 +939,21 @@ async def tool_get_buffer_zone_features(
 # Entry Point
 # ============================================================
 
-if __name__ == "__main__":
+
+def _run(transport: str | None = None, **transport_kwargs: Any) -> None:
+    """Run the MCP server like mcp.run, on uvloop when it is installed.
+
+    The loop is chosen per run through anyio's loop factory rather than the
+    global policy that uvloop.install() sets, which is deprecated on 3.12+.
+    """
+    anyio.run(
+        partial(mcp.run_async, transport, **transport_kwargs),
+        backend_options={"use_uvloop": UVLOOP_AVAILABLE},
+    )
+
+
+def main() -> None:
+    """Entry point of both `python server.py` and the geo-base-mcp script."""
     # Log startup information
     logger.info(
         f"Starting {settings.server_name} v{settings.server_version}",
@@ -827,6 +961,7 @@ if __name__ == "__main__":
             "tile_server_url": settings.tile_server_url,
             "environment": settings.environment,
             "log_level": settings.log_level,
+            "event_loop": "uvloop" if UVLOOP_AVAILABLE else "asyncio",
         },
     )
 
@@ -844,17 +979,21 @@ if __name__ == "__main__":
 
     if transport == "stdio":
         # Run with stdio transport (default for Claude Desktop local)
-        mcp.run()
+        _run()
     elif transport == "sse":
         # Run with SSE transport (for remote connections)
         logger.info(f"Starting SSE server on {host}:{port}")
-        mcp.run(transport="sse", host=host, port=port)
+        _run(transport="sse", host=host, port=port)
     elif transport == "streamable-http":
         # Run with Streamable HTTP transport
         logger.info(f"Starting Streamable HTTP server on {host}:{port}")
-        mcp.run(transport="streamable-http", host=host, port=port)
+        _run(transport="streamable-http", host=host, port=port)
     else:
         logger.error(f"Unknown transport: {transport}")
         print(f"Unknown transport: {transport}")
         print("Valid options: stdio, sse, streamable-http")
         exit(1)
+
+
+if __name__ == "__main__":
+    main()
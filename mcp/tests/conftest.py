@@ -6,6 +6,8 @@ import os
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -13,11 +15,25 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 os.environ.setdefault("TILE_SERVER_URL", "https://geo-base-api.fly.dev")
 os.environ.setdefault("ENVIRONMENT", "test")
 os.environ.setdefault("LOG_LEVEL", "DEBUG")
+os.environ.setdefault("NOMINATIM_MIN_INTERVAL", "0")
+os.environ.setdefault("GEOCODE_CACHE_PATH", "")
 
 # Exclude live_test.py from pytest collection (it's a standalone script)
 collect_ignore = ["live_test.py"]
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_state():
+    """Drop process-wide client and cache state so tests don't leak into each other."""
+    import retry
+    from cache import clear_all_caches
+
+    retry._shared_client = None
+    retry._shared_client_loop = None
+    clear_all_caches()
+    yield
+
+
 def pytest_configure(config):
     """Configure pytest."""
     # Register asyncio marker to avoid warnings
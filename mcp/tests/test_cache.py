@@ -0,0 +1,286 @@
+"""
+Tests for the caching helpers.
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from cache import DiskCache, SingleFlight, TTLCache, clear_all_caches
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_set_and_get(self):
+        """Stored values should be returned until they expire."""
+        cache = TTLCache(ttl=60, max_size=10)
+        cache.set(("search", "tokyo"), {"count": 1})
+        assert cache.get(("search", "tokyo")) == {"count": 1}
+
+    def test_missing_key(self):
+        """Unknown keys should return None."""
+        cache = TTLCache()
+        assert cache.get("missing") is None
+
+    def test_expiry(self):
+        """Entries older than their TTL should be dropped."""
+        cache = TTLCache(ttl=10)
+        with patch("cache.time.monotonic", return_value=100.0):
+            cache.set("key", "value")
+        with patch("cache.time.monotonic", return_value=111.0):
+            assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_custom_ttl(self):
+        """A per-entry TTL should override the cache default."""
+        cache = TTLCache(ttl=10)
+        with patch("cache.time.monotonic", return_value=100.0):
+            cache.set("key", "value", ttl=60)
+        with patch("cache.time.monotonic", return_value=150.0):
+            assert cache.get("key") == "value"
+
+    def test_lru_eviction(self):
+        """The least recently used entry should be evicted when full."""
+        cache = TTLCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_returns_copies(self):
+        """Mutating a returned or stored value should not affect the cache."""
+        cache = TTLCache()
+        value = {"results": [1, 2]}
+        cache.set("key", value)
+        value["results"].append(3)
+
+        first = cache.get("key")
+        first["results"].clear()
+
+        assert cache.get("key") == {"results": [1, 2]}
+
+    def test_copy_values_disabled(self):
+        """With copying disabled, the stored object itself should be returned."""
+        cache = TTLCache(copy_values=False)
+        value = {"results": [1, 2]}
+        cache.set("key", value)
+
+        assert cache.get("key") is value
+
+    def test_delete(self):
+        """delete should report whether the key existed."""
+        cache = TTLCache()
+        cache.set("key", "value")
+        assert cache.delete("key") is True
+        assert cache.delete("key") is False
+
+    def test_clear_all_caches(self):
+        """clear_all_caches should empty every cache instance."""
+        first = TTLCache()
+        second = TTLCache()
+        first.set("a", 1)
+        second.set("b", 2)
+
+        clear_all_caches()
+
+        assert len(first) == 0
+        assert len(second) == 0
+
+
+class TestDiskCache:
+    """Tests for DiskCache."""
+
+    def test_set_and_get(self, tmp_path):
+        """Stored values should round-trip through the database."""
+        cache = DiskCache(str(tmp_path / "cache.sqlite3"), ttl=60)
+        cache.set(("search", "東京駅", 5), {"count": 1, "results": [{"name": "東京駅"}]})
+        assert cache.get(("search", "東京駅", 5)) == {
+            "count": 1,
+            "results": [{"name": "東京駅"}],
+        }
+        assert cache.get(("search", "大阪駅", 5)) is None
+
+    def test_persists_across_instances(self, tmp_path):
+        """A new instance on the same file should see earlier entries."""
+        path = str(tmp_path / "cache.sqlite3")
+        first = DiskCache(path, ttl=60)
+        first.set("key", {"value": 1})
+        first.close()
+        assert DiskCache(path, ttl=60).get("key") == {"value": 1}
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Entries past their TTL should not be returned."""
+        cache = DiskCache(str(tmp_path / "cache.sqlite3"), ttl=60)
+        cache.set("key", {"value": 1})
+        with patch("cache.time.time", return_value=time.time() + 61):
+            assert cache.get("key") is None
+
+    def test_prune_keeps_newest_entries(self, tmp_path):
+        """Pruning should drop entries beyond max_size, oldest first."""
+        cache = DiskCache(str(tmp_path / "cache.sqlite3"), ttl=60, max_size=2)
+        cache.PRUNE_INTERVAL = 3
+        for i in range(3):
+            cache.set(i, i, ttl=60 + i)
+        assert cache.get(0) is None
+        assert cache.get(1) == 1
+        assert cache.get(2) == 2
+
+    def test_empty_path_disables_cache(self):
+        """An empty path should make the cache a no-op."""
+        cache = DiskCache("")
+        cache.set("key", {"value": 1})
+        assert not cache.enabled
+        assert cache.get("key") is None
+
+    def test_unusable_path_is_a_miss(self, tmp_path):
+        """Database errors should be swallowed and treated as misses."""
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+        cache = DiskCache(str(blocker / "cache.sqlite3"))
+        cache.set("key", {"value": 1})
+        assert cache.get("key") is None
+
+    def test_async_access(self, tmp_path):
+        """aget/aset should work from the event loop."""
+        cache = DiskCache(str(tmp_path / "cache.sqlite3"), ttl=60)
+
+        async def run_test():
+            await cache.aset("key", {"value": 1})
+            return await cache.aget("key")
+
+        assert asyncio.run(run_test()) == {"value": 1}
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Concurrent calls with the same key should run the function once."""
+
+        async def run_test():
+            flights = SingleFlight()
+            calls = 0
+
+            async def fetch():
+                nonlocal calls
+                calls += 1
+                await asyncio.sleep(0.01)
+                return {"results": [1]}
+
+            results = await asyncio.gather(*(flights.do("key", fetch) for _ in range(5)))
+
+            assert calls == 1
+            assert all(r == {"results": [1]} for r in results)
+            # Followers get copies, not the leader's object
+            assert results[1] is not results[0]
+            assert len(flights) == 0
+
+        asyncio.run(run_test())
+
+    def test_different_keys_run_separately(self):
+        """Calls with different keys should not be coalesced."""
+
+        async def run_test():
+            flights = SingleFlight()
+            calls = []
+
+            async def fetch(key):
+                calls.append(key)
+                await asyncio.sleep(0)
+                return key
+
+            results = await asyncio.gather(
+                flights.do("a", lambda: fetch("a")), flights.do("b", lambda: fetch("b"))
+            )
+
+            assert results == ["a", "b"]
+            assert calls == ["a", "b"]
+
+        asyncio.run(run_test())
+
+    def test_exception_propagates_to_all_callers(self):
+        """Followers should see the leader's exception."""
+
+        async def run_test():
+            flights = SingleFlight()
+
+            async def fail():
+                await asyncio.sleep(0.01)
+                raise ValueError("boom")
+
+            results = await asyncio.gather(
+                flights.do("key", fail), flights.do("key", fail), return_exceptions=True
+            )
+
+            assert all(isinstance(r, ValueError) for r in results)
+            assert len(flights) == 0
+
+        asyncio.run(run_test())
+
+    def test_sequential_calls_run_again(self):
+        """Once a call finishes, the next call for the key should run afresh."""
+
+        async def run_test():
+            flights = SingleFlight()
+            calls = 0
+
+            async def fetch():
+                nonlocal calls
+                calls += 1
+                return calls
+
+            assert await flights.do("key", fetch) == 1
+            assert await flights.do("key", fetch) == 2
+
+        asyncio.run(run_test())
+
+    def test_cancelled_leader_does_not_cancel_followers(self):
+        """A follower should still get the result when the leader is cancelled."""
+
+        async def run_test():
+            flights = SingleFlight()
+            release = asyncio.Event()
+            calls = 0
+
+            async def fetch():
+                nonlocal calls
+                calls += 1
+                await release.wait()
+                return {"results": [1]}
+
+            leader = asyncio.create_task(flights.do("key", fetch))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(flights.do("key", fetch))
+            await asyncio.sleep(0)
+
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            release.set()
+
+            assert await follower == {"results": [1]}
+            assert calls == 1
+            assert len(flights) == 0
+
+        asyncio.run(run_test())
+
+    def test_leader_error_without_followers(self):
+        """A failing call with no followers should just raise."""
+
+        async def run_test():
+            flights = SingleFlight()
+
+            async def fail():
+                raise ValueError("boom")
+
+            with pytest.raises(ValueError):
+                await flights.do("key", fail)
+
+        asyncio.run(run_test())
@@ -9,8 +9,10 @@ Uses standard asyncio approach (not pytest-asyncio).
 """
 
 import asyncio
+import json
 from unittest.mock import AsyncMock, Mock, patch
 
+from cache import tilejson_cache, tileset_info_cache, tileset_list_cache
 from tools.crud import (
     create_feature,
     create_tileset,
@@ -29,14 +31,14 @@ class TestCreateTileset:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json = Mock(
-                return_value={
+            mock_response.content = json.dumps(
+                {
                     "id": "new-tileset-id",
                     "name": "Test Tileset",
                     "type": "vector",
                     "format": "pbf",
                 }
-            )
+            ).encode()
             mock_response.raise_for_status = Mock()
             mock_response.status_code = 201
 
@@ -59,6 +61,29 @@ class TestCreateTileset:
 
         asyncio.run(run_test())
 
+    def test_create_tileset_drops_cached_listings(self):
+        """create_tileset should drop cached tileset listings."""
+
+        async def run_test():
+            tileset_list_cache.set((), [])
+            mock_response = Mock()
+            mock_response.content = json.dumps({"id": "new-tileset-id"}).encode()
+            mock_response.raise_for_status = Mock()
+            mock_response.status_code = 201
+
+            with patch("tools.crud.httpx.AsyncClient") as mock_client:
+                mock_instance = AsyncMock()
+                mock_instance.post = AsyncMock(return_value=mock_response)
+                mock_instance.__aenter__.return_value = mock_instance
+                mock_instance.__aexit__.return_value = None
+                mock_client.return_value = mock_instance
+
+                await create_tileset(name="Test Tileset", type="vector", format="pbf")
+
+            assert tileset_list_cache.get(()) is None
+
+        asyncio.run(run_test())
+
     def test_create_tileset_auth_required(self):
         """create_tileset should handle auth errors."""
 
@@ -89,9 +114,9 @@ class TestCreateTileset:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json = Mock(
-                return_value={"id": "550e8400-e29b-41d4-a716-446655440010", "name": "Full Test"}
-            )
+            mock_response.content = json.dumps(
+                {"id": "550e8400-e29b-41d4-a716-446655440010", "name": "Full Test"}
+            ).encode()
             mock_response.raise_for_status = Mock()
             mock_response.status_code = 201
 
@@ -129,10 +154,12 @@ class TestUpdateTileset:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {
-                "id": "550e8400-e29b-41d4-a716-446655440010",
-                "name": "Updated Name",
-            }
+            mock_response.content = json.dumps(
+                {
+                    "id": "550e8400-e29b-41d4-a716-446655440010",
+                    "name": "Updated Name",
+                }
+            ).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.crud.httpx.AsyncClient") as mock_client:
@@ -213,6 +240,32 @@ class TestDeleteTileset:
 
         asyncio.run(run_test())
 
+    def test_delete_tileset_drops_cached_metadata(self):
+        """delete_tileset should drop the tileset's cached metadata and TileJSON."""
+        tileset_id = "550e8400-e29b-41d4-a716-446655440010"
+
+        async def run_test():
+            tileset_info_cache.set(tileset_id, {"name": "Old"})
+            tilejson_cache.set(tileset_id, {"name": "Old"})
+            tileset_list_cache.set((), [{"id": tileset_id}])
+            mock_response = Mock()
+            mock_response.status_code = 204
+
+            with patch("tools.crud.httpx.AsyncClient") as mock_client:
+                mock_instance = AsyncMock()
+                mock_instance.delete.return_value = mock_response
+                mock_instance.__aenter__.return_value = mock_instance
+                mock_instance.__aexit__.return_value = None
+                mock_client.return_value = mock_instance
+
+                await delete_tileset(tileset_id=tileset_id)
+
+            assert tileset_info_cache.get(tileset_id) is None
+            assert tilejson_cache.get(tileset_id) is None
+            assert tileset_list_cache.get(()) is None
+
+        asyncio.run(run_test())
+
     def test_delete_tileset_not_found(self):
         """delete_tileset should handle 404 errors."""
 
@@ -246,12 +299,14 @@ class TestCreateFeature:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {
-                "id": "new-feature-id",
-                "type": "Feature",
-                "geometry": {"type": "Point", "coordinates": [139.7, 35.6]},
-                "properties": {"name": "Test Point"},
-            }
+            mock_response.content = json.dumps(
+                {
+                    "id": "new-feature-id",
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [139.7, 35.6]},
+                    "properties": {"name": "Test Point"},
+                }
+            ).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.crud.httpx.AsyncClient") as mock_client:
@@ -303,10 +358,12 @@ class TestCreateFeature:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {
-                "id": "550e8400-e29b-41d4-a716-446655440095",
-                "layer_name": "custom_layer",
-            }
+            mock_response.content = json.dumps(
+                {
+                    "id": "550e8400-e29b-41d4-a716-446655440095",
+                    "layer_name": "custom_layer",
+                }
+            ).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.crud.httpx.AsyncClient") as mock_client:
@@ -335,10 +392,12 @@ class TestUpdateFeature:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {
-                "id": "550e8400-e29b-41d4-a716-446655440095",
-                "properties": {"name": "Updated"},
-            }
+            mock_response.content = json.dumps(
+                {
+                    "id": "550e8400-e29b-41d4-a716-446655440095",
+                    "properties": {"name": "Updated"},
+                }
+            ).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.crud.httpx.AsyncClient") as mock_client:
@@ -363,10 +422,12 @@ class TestUpdateFeature:
         async def run_test():
             new_geom = {"type": "Point", "coordinates": [140.0, 36.0]}
             mock_response = Mock()
-            mock_response.json.return_value = {
-                "id": "550e8400-e29b-41d4-a716-446655440095",
-                "geometry": new_geom,
-            }
+            mock_response.content = json.dumps(
+                {
+                    "id": "550e8400-e29b-41d4-a716-446655440095",
+                    "geometry": new_geom,
+                }
+            ).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.crud.httpx.AsyncClient") as mock_client:
@@ -3,17 +3,40 @@ Tests for geocoding tools.
 
 This module tests:
 - geocode (address to coordinates)
+- geocode_batch (concurrent batch geocoding)
 - reverse_geocode (coordinates to address)
+- reverse_geocode_batch (concurrent batch reverse geocoding)
 
 Uses standard asyncio approach (not pytest-asyncio).
 """
 
 import asyncio
+import gzip
+import json
+import time
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
+import pytest
+from tenacity import RetryError
+
+from cache import DiskCache, clear_all_caches
+from errors import ErrorCode
 from tools.geocoding import (
+    STREAM_PARSE_MIN_LIMIT,
+    _build_search_url,
+    _classify,
+    _error_response,
+    _format_result,
+    _nominatim_get,
+    _normalize_query,
+    _parse_bounds,
+    _retry_after,
+    _wait_for_request_slot,
     geocode,
+    geocode_batch,
     reverse_geocode,
+    reverse_geocode_batch,
 )
 
 
@@ -25,16 +48,18 @@ class TestGeocode:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = [
-                {
-                    "place_id": 12345,
-                    "lat": "35.6812",
-                    "lon": "139.7671",
-                    "display_name": "東京駅, 千代田区, 東京都, 日本",
-                    "type": "station",
-                    "boundingbox": ["35.6", "35.7", "139.7", "139.8"],
-                }
-            ]
+            mock_response.content = json.dumps(
+                [
+                    {
+                        "place_id": 12345,
+                        "lat": "35.6812",
+                        "lon": "139.7671",
+                        "display_name": "東京駅, 千代田区, 東京都, 日本",
+                        "type": "station",
+                        "boundingbox": ["35.6", "35.7", "139.7", "139.8"],
+                    }
+                ]
+            ).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.geocoding.httpx.AsyncClient") as mock_client:
@@ -110,12 +135,36 @@ class TestGeocode:
 
         asyncio.run(run_test())
 
+    def test_geocode_invalid_limit(self):
+        """geocode with out-of-range limit should return error."""
+
+        async def run_test():
+            result = await geocode("Tokyo", limit=51)
+            assert "error" in result
+            assert result["count"] == 0
+
+        asyncio.run(run_test())
+
+    def test_geocode_string_limit(self):
+        """geocode should still coerce a numeric string limit via the validator."""
+
+        async def run_test():
+            with patch(
+                "tools.geocoding.fetch_with_retry", new=AsyncMock(return_value=[])
+            ) as mock_fetch:
+                result = await geocode("Tokyo", limit="3")
+
+            assert "error" not in result
+            assert "limit=3" in mock_fetch.call_args.args[0]
+
+        asyncio.run(run_test())
+
     def test_geocode_nonexistent_place(self):
         """geocode should handle no results gracefully."""
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = []
+            mock_response.content = json.dumps([]).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.geocoding.httpx.AsyncClient") as mock_client:
@@ -151,6 +200,24 @@ class TestGeocode:
 
         asyncio.run(run_test())
 
+    def test_geocode_error_response_shape(self):
+        """Failed geocode calls should return an empty results list and count 0."""
+
+        async def run_test():
+            with patch(
+                "tools.geocoding.fetch_with_retry",
+                new=AsyncMock(side_effect=httpx.ConnectError("Connection failed")),
+            ):
+                result = await geocode("Tokyo")
+
+            assert result["results"] == []
+            assert type(result["results"]) is list
+            assert result["count"] == 0
+            assert result["query"] == "Tokyo"
+            assert result["code"] == ErrorCode.NETWORK_ERROR.value
+
+        asyncio.run(run_test())
+
     def test_geocode_language_parameter(self):
         """geocode should pass language parameter."""
 
@@ -174,6 +241,364 @@ class TestGeocode:
 
         asyncio.run(run_test())
 
+    def test_geocode_large_limit_streams_results(self):
+        """geocode should shape streamed results when limit is large."""
+
+        async def run_test():
+            real_client = httpx.AsyncClient
+            items = [
+                {
+                    "lat": f"35.{i}",
+                    "lon": f"139.{i}",
+                    "display_name": f"Result {i}",
+                    "boundingbox": ["35.6", "35.7", "139.7", "139.8"],
+                }
+                for i in range(20)
+            ]
+
+            def handler(request):
+                assert request.url.params["limit"] == "20"
+                return httpx.Response(200, json=items)
+
+            with patch(
+                "tools.geocoding.httpx.AsyncClient",
+                side_effect=lambda **kwargs: real_client(
+                    transport=httpx.MockTransport(handler), **kwargs
+                ),
+            ):
+                result = await geocode("Tokyo", limit=20)
+
+            assert result["count"] == 20
+            assert result["results"][3]["latitude"] == 35.3
+            assert result["results"][0]["bounds"]["east"] == 139.8
+
+        asyncio.run(run_test())
+
+    def test_geocode_small_limit_decodes_whole_body(self):
+        """geocode should skip stream parsing below STREAM_PARSE_MIN_LIMIT."""
+
+        async def run_test():
+            fetch = AsyncMock(return_value=[{"lat": "35.6", "lon": "139.7"}])
+            stream = AsyncMock()
+            with (
+                patch("tools.geocoding.fetch_with_retry", new=fetch),
+                patch("tools.geocoding.fetch_items_with_retry", new=stream),
+            ):
+                result = await geocode("Tokyo", limit=STREAM_PARSE_MIN_LIMIT - 1)
+
+            assert result["count"] == 1
+            fetch.assert_awaited_once()
+            stream.assert_not_awaited()
+
+        asyncio.run(run_test())
+
+    def test_geocode_requests_compressed_response(self):
+        """geocode should advertise compression and decode the compressed body."""
+
+        async def run_test():
+            real_client = httpx.AsyncClient
+            body = json.dumps([{"lat": "35.6812", "lon": "139.7671", "display_name": "東京駅"}])
+
+            def handler(request):
+                assert "gzip" in request.headers["accept-encoding"]
+                return httpx.Response(
+                    200,
+                    content=gzip.compress(body.encode()),
+                    headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+                )
+
+            with patch(
+                "retry.httpx.AsyncClient",
+                side_effect=lambda **kwargs: real_client(
+                    transport=httpx.MockTransport(handler), **kwargs
+                ),
+            ):
+                result = await geocode("東京駅")
+
+            assert result["count"] == 1
+            assert result["results"][0]["name"] == "東京駅"
+
+        asyncio.run(run_test())
+
+
+class TestGeocodingCache:
+    """Tests for caching of geocoding responses."""
+
+    def test_geocode_cache_returns_independent_copies(self):
+        """Mutating a returned response should not corrupt the cached entry."""
+
+        async def run_test():
+            data = [{"lat": "35.6812", "lon": "139.7671", "display_name": "東京駅"}]
+            with patch(
+                "tools.geocoding.fetch_with_retry", new=AsyncMock(return_value=data)
+            ) as mock_fetch:
+                first = await geocode("東京駅")
+                first["results"].clear()
+                second = await geocode("東京駅")
+
+            assert mock_fetch.await_count == 1
+            assert second["count"] == 1
+            assert second["results"][0]["name"] == "東京駅"
+
+        asyncio.run(run_test())
+
+    def test_disk_cache_survives_memory_clear(self, tmp_path):
+        """Responses should be served from disk after the memory cache is lost."""
+
+        async def run_test():
+            disk = DiskCache(str(tmp_path / "geocoding.sqlite3"))
+            search = [{"lat": "35.6812", "lon": "139.7671", "display_name": "東京駅"}]
+            address = {"display_name": "東京駅", "address": {"city": "千代田区"}}
+            with (
+                patch("tools.geocoding.geocoding_disk_cache", disk),
+                patch(
+                    "tools.geocoding.fetch_with_retry",
+                    new=AsyncMock(side_effect=[search, address]),
+                ) as mock_fetch,
+            ):
+                await geocode("東京駅")
+                await reverse_geocode(latitude=35.6812, longitude=139.7671)
+                clear_all_caches()  # Simulate a restart
+                forward = await geocode("東京駅")
+                reverse = await reverse_geocode(latitude=35.6812, longitude=139.7671)
+
+            assert mock_fetch.await_count == 2
+            assert forward["results"][0]["name"] == "東京駅"
+            assert reverse["address"] == {"city": "千代田区"}
+            assert reverse["coordinates"]["latitude"] == 35.6812
+
+        asyncio.run(run_test())
+
+    def test_geocode_errors_are_not_cached(self):
+        """A failed lookup should be retried on the next call."""
+
+        async def run_test():
+            with patch(
+                "tools.geocoding.fetch_with_retry",
+                new=AsyncMock(side_effect=[httpx.ConnectError("down"), []]),
+            ) as mock_fetch:
+                failed = await geocode("Tokyo")
+                recovered = await geocode("Tokyo")
+
+            assert "error" in failed
+            assert "error" not in recovered
+            assert mock_fetch.await_count == 2
+
+        asyncio.run(run_test())
+
+    def test_concurrent_identical_geocodes_share_request(self):
+        """Concurrent identical geocode calls should issue one request."""
+
+        async def run_test():
+            async def slow_fetch(*args, **kwargs):
+                await asyncio.sleep(0.01)
+                return [{"lat": "35.6812", "lon": "139.7671", "display_name": "東京駅"}]
+
+            with patch(
+                "tools.geocoding.fetch_with_retry", new=AsyncMock(side_effect=slow_fetch)
+            ) as mock_fetch:
+                results = await asyncio.gather(*(geocode("東京駅") for _ in range(3)))
+
+            assert mock_fetch.await_count == 1
+            assert all(r["count"] == 1 for r in results)
+
+        asyncio.run(run_test())
+
+    def test_reverse_geocode_cache_hit(self):
+        """Repeated reverse lookups should be served from the cache."""
+
+        async def run_test():
+            with patch(
+                "tools.geocoding.fetch_with_retry",
+                new=AsyncMock(return_value={"display_name": "東京駅"}),
+            ) as mock_fetch:
+                await reverse_geocode(latitude=35.6812, longitude=139.7671)
+                cached = await reverse_geocode(latitude=35.68120001, longitude=139.7671)
+                await reverse_geocode(latitude=35.6812, longitude=139.7671, zoom=10)
+
+            assert mock_fetch.await_count == 2
+            assert cached["display_name"] == "東京駅"
+            assert cached["coordinates"]["latitude"] == 35.68120001
+
+        asyncio.run(run_test())
+
+
+class TestNominatimRequests:
+    """Tests for Nominatim request pacing and throttling retries."""
+
+    @staticmethod
+    def _status_error(status, headers=None):
+        request = httpx.Request("GET", "https://nominatim.example/search")
+        response = httpx.Response(status, headers=headers or {}, request=request)
+        return httpx.HTTPStatusError("throttled", request=request, response=response)
+
+    def test_retries_429_with_retry_after(self):
+        """A 429 should be retried after the Retry-After delay."""
+
+        async def run_test():
+            with (
+                patch(
+                    "tools.geocoding.fetch_with_retry",
+                    new=AsyncMock(side_effect=[self._status_error(429, {"Retry-After": "2"}), [1]]),
+                ) as mock_fetch,
+                patch("tools.geocoding.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+            ):
+                data = await _nominatim_get("https://nominatim.example/search")
+
+            assert data == [1]
+            assert mock_fetch.await_count == 2
+            mock_sleep.assert_awaited_once_with(2.0)
+
+        asyncio.run(run_test())
+
+    def test_gives_up_after_max_attempts(self):
+        """Persistent 503s should surface as an HTTP error after the last attempt."""
+
+        async def run_test():
+            async def always_unavailable(*args, **kwargs):
+                raise self._status_error(503)
+
+            with (
+                patch(
+                    "tools.geocoding.fetch_with_retry",
+                    new=AsyncMock(side_effect=always_unavailable),
+                ) as mock_fetch,
+                patch("tools.geocoding.asyncio.sleep", new=AsyncMock()),
+            ):
+                result = await reverse_geocode(latitude=35.6812, longitude=139.7671)
+
+            assert result["code"] == ErrorCode.HTTP_ERROR.value
+            assert mock_fetch.await_count == 3
+
+        asyncio.run(run_test())
+
+    def test_does_not_retry_other_statuses(self):
+        """Non-throttling HTTP errors should not be retried."""
+
+        async def run_test():
+            with patch(
+                "tools.geocoding.fetch_with_retry",
+                new=AsyncMock(side_effect=self._status_error(400)),
+            ) as mock_fetch:
+                with pytest.raises(httpx.HTTPStatusError):
+                    await _nominatim_get("https://nominatim.example/search")
+
+            assert mock_fetch.await_count == 1
+
+        asyncio.run(run_test())
+
+    def test_retry_after_parsing(self):
+        """Retry-After should accept seconds, fall back to backoff, and be capped."""
+        assert _retry_after(self._status_error(429, {"Retry-After": "5"}).response, 1) == 5.0
+        assert _retry_after(self._status_error(429).response, 2) == 4.0
+        assert _retry_after(self._status_error(429, {"Retry-After": "3600"}).response, 1) == 30.0
+        http_date = "Wed, 21 Oct 2015 07:28:00 GMT"
+        assert _retry_after(self._status_error(503, {"Retry-After": http_date}).response, 1) == 0
+
+    def test_requests_are_spaced_by_min_interval(self):
+        """Consecutive requests should wait out NOMINATIM_MIN_INTERVAL."""
+
+        async def run_test():
+            with patch("tools.geocoding.settings.nominatim_min_interval", 0.05):
+                start = time.monotonic()
+                for _ in range(3):
+                    await _wait_for_request_slot()
+                elapsed = time.monotonic() - start
+
+            assert elapsed >= 0.1
+
+        asyncio.run(run_test())
+
+
+class TestGeocodeBatch:
+    """Tests for geocode_batch function."""
+
+    def test_geocode_batch_returns_per_query_results(self):
+        """geocode_batch should wrap one geocode response per query."""
+
+        async def run_test():
+            async def fake_geocode(query, **kwargs):
+                return {"query": query, "count": 1, "results": [{"name": query}]}
+
+            with patch("tools.geocoding.geocode", side_effect=fake_geocode):
+                result = await geocode_batch(["東京駅", "大阪駅"], limit=1)
+
+            assert result["count"] == 2
+            assert [r["query"] for r in result["results"]] == ["東京駅", "大阪駅"]
+
+        asyncio.run(run_test())
+
+    def test_geocode_batch_empty_queries(self):
+        """geocode_batch with no queries should return a validation error."""
+        result = asyncio.run(geocode_batch([]))
+        assert result["code"] == ErrorCode.VALIDATION_ERROR.value
+        assert result["count"] == 0
+
+    def test_geocode_batch_too_many_queries(self):
+        """geocode_batch should reject more than MAX_BATCH_QUERIES queries."""
+        result = asyncio.run(geocode_batch([f"q{i}" for i in range(51)]))
+        assert result["code"] == ErrorCode.VALIDATION_ERROR.value
+        assert "at most 50" in result["error"]
+
+    def test_geocode_batch_preserves_order(self):
+        """geocode_batch should return one response per query, in order."""
+
+        async def run_test():
+            async def fake_geocode(query, **kwargs):
+                await asyncio.sleep(0.01 if query == "a" else 0)
+                return {"query": query, "count": 0, "results": []}
+
+            with patch("tools.geocoding.geocode", side_effect=fake_geocode):
+                results = (await geocode_batch(["a", "b", "c"]))["results"]
+
+            assert [r["query"] for r in results] == ["a", "b", "c"]
+
+        asyncio.run(run_test())
+
+    def test_geocode_batch_isolates_failures(self):
+        """A query that raises should become an error entry, not abort the batch."""
+
+        async def run_test():
+            async def fake_geocode(query, **kwargs):
+                if query == "bad":
+                    raise RuntimeError("boom")
+                return {"query": query, "count": 0, "results": []}
+
+            with patch("tools.geocoding.geocode", side_effect=fake_geocode):
+                results = (await geocode_batch(["a", "bad", "c"]))["results"]
+
+            assert [r["query"] for r in results] == ["a", "bad", "c"]
+            assert results[1]["code"] == ErrorCode.UNKNOWN_ERROR.value
+            assert results[1]["count"] == 0
+
+        asyncio.run(run_test())
+
+    def test_geocode_batch_bounds_concurrency(self):
+        """geocode_batch should not exceed GEOCODE_MAX_PARALLEL in-flight calls."""
+
+        async def run_test():
+            in_flight = 0
+            peak = 0
+
+            async def fake_geocode(query, **kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return {"query": query, "count": 0, "results": []}
+
+            with (
+                patch("tools.geocoding.geocode", side_effect=fake_geocode),
+                patch("tools.geocoding.settings.geocode_max_parallel", 2),
+            ):
+                results = (await geocode_batch([str(i) for i in range(6)]))["results"]
+
+            assert len(results) == 6
+            assert peak == 2
+
+        asyncio.run(run_test())
+
 
 class TestReverseGeocode:
     """Tests for reverse_geocode function."""
@@ -246,6 +671,33 @@ class TestReverseGeocode:
 
         asyncio.run(run_test())
 
+    def test_reverse_geocode_string_inputs(self):
+        """reverse_geocode should still coerce numeric strings via the validators."""
+
+        async def run_test():
+            with patch(
+                "tools.geocoding.fetch_with_retry",
+                new=AsyncMock(return_value={"display_name": "Tokyo"}),
+            ) as mock_fetch:
+                result = await reverse_geocode(latitude="35.6812", longitude="139.7671", zoom="10")
+
+            assert result["coordinates"] == {"latitude": 35.6812, "longitude": 139.7671}
+            params = mock_fetch.call_args.kwargs["params"]
+            assert params["zoom"] == 10
+            assert params["format"] == "jsonv2"
+            assert params["addressdetails"] == 1
+
+        asyncio.run(run_test())
+
+    def test_reverse_geocode_invalid_zoom(self):
+        """reverse_geocode with out-of-range zoom should return error."""
+
+        async def run_test():
+            result = await reverse_geocode(latitude=35.6812, longitude=139.7671, zoom=19)
+            assert "error" in result
+
+        asyncio.run(run_test())
+
     def test_reverse_geocode_ocean(self):
         """reverse_geocode should handle ocean/empty locations."""
 
@@ -289,6 +741,46 @@ class TestReverseGeocode:
 
         asyncio.run(run_test())
 
+    @pytest.mark.parametrize(
+        "latitude, longitude",
+        [(float("nan"), 139.7671), (35.6812, float("inf")), (35.6812, float("-inf"))],
+    )
+    def test_reverse_geocode_non_finite_coordinates(self, latitude, longitude):
+        """NaN and infinite coordinates should not slip through the fast path."""
+        result = asyncio.run(reverse_geocode(latitude=latitude, longitude=longitude))
+        assert result["code"] == ErrorCode.VALIDATION_ERROR.value
+
+    def test_reverse_geocode_int_coordinates(self):
+        """Integer coordinates should be accepted and reported as floats."""
+
+        async def run_test():
+            fetch = AsyncMock(return_value={"display_name": "Somewhere"})
+            with patch("tools.geocoding.fetch_with_retry", new=fetch):
+                result = await reverse_geocode(latitude=35, longitude=139)
+            assert result["coordinates"] == {"latitude": 35.0, "longitude": 139.0}
+            assert type(result["coordinates"]["latitude"]) is float
+
+        asyncio.run(run_test())
+
+    def test_reverse_geocode_debug_logging_is_lazy(self, caplog):
+        """Debug messages should be formatted only when DEBUG is enabled."""
+
+        async def run_test(latitude):
+            fetch = AsyncMock(return_value={"display_name": "あ" * 80})
+            with patch("tools.geocoding.fetch_with_retry", new=fetch):
+                await reverse_geocode(latitude=latitude, longitude=139.0)
+            fetch.assert_awaited_once()
+
+        with caplog.at_level("DEBUG", logger="tools.geocoding"):
+            asyncio.run(run_test(35.0))
+        messages = [r.getMessage() for r in caplog.records if r.levelname == "DEBUG"]
+        assert "Reverse geocoding successful: " + "あ" * 50 + "..." in messages
+
+        caplog.clear()
+        with caplog.at_level("INFO", logger="tools.geocoding"):
+            asyncio.run(run_test(36.0))
+        assert not [r for r in caplog.records if r.levelname == "DEBUG"]
+
     def test_reverse_geocode_network_error(self):
         """reverse_geocode should handle network errors."""
 
@@ -309,6 +801,261 @@ class TestReverseGeocode:
         asyncio.run(run_test())
 
 
+class TestNormalizeQuery:
+    """Tests for query normalization."""
+
+    def test_strips_and_collapses_whitespace(self):
+        """Leading/trailing and repeated whitespace (incl. full-width spaces) collapse."""
+        assert _normalize_query("  東京\u3000 駅  ") == "東京 駅"
+
+    def test_applies_nfc(self):
+        """Decomposed characters should be composed (NFC)."""
+        assert _normalize_query("Cafe\u0301") == "Caf\u00e9"
+
+    def test_preserves_case(self):
+        """Case is kept for the outbound request."""
+        assert _normalize_query("Tokyo Tower") == "Tokyo Tower"
+
+    def test_query_variants_share_cache_entry(self):
+        """ "東京駅 ", "東京駅" and case variants should hit the same cache entry."""
+
+        async def run_test():
+            with patch(
+                "tools.geocoding.fetch_with_retry", new=AsyncMock(return_value=[])
+            ) as mock_fetch:
+                await geocode("東京駅 ")
+                second = await geocode("東京駅")
+                await geocode("tokyo station")
+                third = await geocode("Tokyo  Station")
+
+            assert mock_fetch.await_count == 2
+            assert second["query"] == "東京駅"
+            assert third["query"] == "Tokyo  Station"
+
+        asyncio.run(run_test())
+
+
+class TestFormatResult:
+    """Tests for search result shaping."""
+
+    def test_omits_absent_fields(self):
+        """Fields Nominatim did not send should not appear as nulls."""
+        result = _format_result({"display_name": "東京駅", "lat": "35.6812", "lon": "139.7671"})
+        assert result == {"name": "東京駅", "latitude": 35.6812, "longitude": 139.7671}
+
+    def test_copies_present_fields(self):
+        """Fields Nominatim sent should be passed through unchanged."""
+        result = _format_result(
+            {
+                "display_name": "東京駅",
+                "lat": "35.6812",
+                "lon": "139.7671",
+                "type": "station",
+                "place_id": 12345,
+                "osm_id": 0,
+                "address": {"city": "千代田区"},
+            }
+        )
+        assert result["type"] == "station"
+        assert result["place_id"] == 12345
+        assert result["osm_id"] == 0
+        assert result["address"] == {"city": "千代田区"}
+        assert "category" not in result
+
+    def test_bounds_match_parse_bounds(self):
+        """Bounds should be parsed by _parse_bounds, and be omitted when empty."""
+        bbox = ["35.6", "35.7", "139.7", "139.8"]
+        item = {"display_name": "東京駅", "lat": "35.6812", "lon": "139.7671"}
+        assert _format_result({**item, "boundingbox": bbox})["bounds"] == _parse_bounds(bbox)
+        assert "bounds" not in _format_result({**item, "boundingbox": []})
+
+
+class TestParseBounds:
+    """Tests for bounding box parsing."""
+
+    def test_parse_bounds(self):
+        """Nominatim's [south, north, west, east] strings become a float bounds dict."""
+        assert _parse_bounds(["35.6", "35.7", "139.7", "139.8"]) == {
+            "south": 35.6,
+            "north": 35.7,
+            "west": 139.7,
+            "east": 139.8,
+        }
+
+
+class TestBuildSearchUrl:
+    """Tests for search URL construction."""
+
+    def test_encodes_params(self):
+        """The URL should carry every Nominatim search parameter, percent-encoded."""
+        url = httpx.URL(_build_search_url("東京駅", 5, "ja", "jp"))
+        assert url.path == "/search"
+        assert url.params["q"] == "東京駅"
+        assert url.params["limit"] == "5"
+        assert url.params["format"] == "jsonv2"
+        assert url.params["accept-language"] == "ja"
+        assert url.params["countrycodes"] == "jp"
+
+    def test_omits_empty_country_codes(self):
+        """countrycodes should be left out when no filter is given."""
+        url = httpx.URL(_build_search_url("Tokyo", 5, "ja", None))
+        assert "countrycodes" not in url.params
+
+    def test_repeated_requests_hit_cache(self):
+        """Identical requests should reuse the cached URL string."""
+        _build_search_url.cache_clear()
+        first = _build_search_url("Tokyo", 5, "ja", None)
+        second = _build_search_url("Tokyo", 5, "ja", None)
+        assert first is second
+        assert _build_search_url.cache_info().hits == 1
+
+
+class TestReverseGeocodeBatch:
+    """Tests for reverse_geocode_batch function."""
+
+    def test_reverse_geocode_batch_returns_per_point_results(self):
+        """reverse_geocode_batch should return one response per point, in order."""
+
+        async def run_test():
+            async def fake_reverse(latitude, longitude, **kwargs):
+                return {"coordinates": {"latitude": latitude, "longitude": longitude}}
+
+            with patch("tools.geocoding.reverse_geocode", side_effect=fake_reverse):
+                result = await reverse_geocode_batch([[35.6812, 139.7671], [34.7025, 135.4959]])
+
+            assert result["count"] == 2
+            assert [r["coordinates"]["latitude"] for r in result["results"]] == [
+                35.6812,
+                34.7025,
+            ]
+
+        asyncio.run(run_test())
+
+    def test_reverse_geocode_batch_isolates_failures(self):
+        """A point that raises should not cancel or drop the other points."""
+
+        async def run_test():
+            async def fake_reverse(latitude, longitude, **kwargs):
+                if latitude == 0.0:
+                    raise RuntimeError("boom")
+                return {"coordinates": {"latitude": latitude, "longitude": longitude}}
+
+            with patch("tools.geocoding.reverse_geocode", side_effect=fake_reverse):
+                result = await reverse_geocode_batch([[35.0, 139.0], [0.0, 0.0], [34.0, 135.0]])
+
+            assert result["count"] == 3
+            failed = result["results"][1]
+            assert failed["code"] == ErrorCode.UNKNOWN_ERROR.value
+            assert failed["coordinates"] == {"latitude": 0.0, "longitude": 0.0}
+            assert result["results"][2]["coordinates"]["latitude"] == 34.0
+
+        asyncio.run(run_test())
+
+    def test_reverse_geocode_batch_repeated_point_uses_cache(self):
+        """Repeated points should be answered without another request."""
+
+        async def run_test():
+            fetch = AsyncMock(return_value={"display_name": "東京駅", "address": {}})
+            with patch("tools.geocoding.fetch_with_retry", new=fetch):
+                result = await reverse_geocode_batch([[35.6812, 139.7671], [35.6812, 139.7671]])
+
+            assert result["count"] == 2
+            assert all(r["display_name"] == "東京駅" for r in result["results"])
+            fetch.assert_awaited_once()
+
+        asyncio.run(run_test())
+
+    def test_reverse_geocode_batch_empty_points(self):
+        """reverse_geocode_batch with no points should return a validation error."""
+        result = asyncio.run(reverse_geocode_batch([]))
+        assert result["code"] == ErrorCode.VALIDATION_ERROR.value
+        assert result["count"] == 0
+
+    def test_reverse_geocode_batch_too_many_points(self):
+        """reverse_geocode_batch should reject more than MAX_BATCH_QUERIES points."""
+        result = asyncio.run(reverse_geocode_batch([[35.0, 139.0]] * 51))
+        assert result["code"] == ErrorCode.VALIDATION_ERROR.value
+        assert "at most 50" in result["error"]
+
+    def test_reverse_geocode_batch_malformed_point(self):
+        """Points must be [latitude, longitude] pairs."""
+        result = asyncio.run(reverse_geocode_batch([[35.0, 139.0], [35.0]]))
+        assert result["code"] == ErrorCode.VALIDATION_ERROR.value
+
+
+class TestClassify:
+    """Tests for exception classification."""
+
+    def test_proxy_error_takes_precedence_over_http_error(self):
+        """ProxyError should map to its own entry, not the HTTPError fallback."""
+        code, message = _classify(httpx.ProxyError("blocked"))
+        assert code == ErrorCode.NETWORK_ERROR
+        assert message.startswith("Proxy error: blocked")
+
+    def test_http_status_error_includes_status(self):
+        """HTTPStatusError should produce an HTTP_ERROR with the status code."""
+        request = httpx.Request("GET", "https://example.com")
+        response = httpx.Response(503, request=request)
+        error = httpx.HTTPStatusError("unavailable", request=request, response=response)
+        code, message = _classify(error)
+        assert code == ErrorCode.HTTP_ERROR
+        assert message.startswith("HTTP error 503")
+
+    def test_subclass_resolves_via_mro(self):
+        """Unlisted httpx errors should resolve to the nearest mapped base class."""
+        code, message = _classify(httpx.ConnectTimeout("timed out"))
+        assert code == ErrorCode.NETWORK_ERROR
+        assert message == "Network error: timed out"
+
+    def test_retry_error(self):
+        """RetryError should map to NETWORK_ERROR."""
+        code, _ = _classify(RetryError(last_attempt=Mock()))
+        assert code == ErrorCode.NETWORK_ERROR
+
+    def test_unknown_error(self):
+        """Unmapped exceptions should fall back to UNKNOWN_ERROR."""
+        code, message = _classify(ValueError("boom"))
+        assert code == ErrorCode.UNKNOWN_ERROR
+        assert message == "Unexpected error: ValueError: boom"
+
+
+class TestErrorResponse:
+    """Tests for the shared error response helper."""
+
+    def test_network_error_logged_as_warning(self, caplog):
+        """Network errors should be logged as warnings and merged with fields."""
+        with caplog.at_level("WARNING", logger="tools.geocoding"):
+            result = _error_response(
+                httpx.ConnectError("refused"), "geocoding", {"query": "東京駅"}, query="東京駅"
+            )
+        assert result["code"] == ErrorCode.NETWORK_ERROR.value
+        assert result["query"] == "東京駅"
+        assert [r.levelname for r in caplog.records] == ["WARNING"]
+        assert caplog.records[0].getMessage().startswith("Geocoding failed")
+
+    def test_unexpected_error_logged_with_traceback(self, caplog):
+        """Unexpected errors should be logged at ERROR level, with exc_info at DEBUG."""
+        try:
+            raise ValueError("boom")
+        except ValueError as e:
+            with caplog.at_level("DEBUG", logger="tools.geocoding"):
+                result = _error_response(e, "reverse geocoding", {}, address=None)
+        assert result["code"] == ErrorCode.UNKNOWN_ERROR.value
+        assert result["address"] is None
+        assert caplog.records[0].levelname == "ERROR"
+        assert caplog.records[0].exc_info is not None
+
+    def test_traceback_skipped_above_debug(self, caplog):
+        """At INFO level and above, the traceback should not be captured."""
+        try:
+            raise ValueError("boom")
+        except ValueError as e:
+            with caplog.at_level("INFO", logger="tools.geocoding"):
+                _error_response(e, "geocoding", {})
+        assert caplog.records[0].levelname == "ERROR"
+        assert not caplog.records[0].exc_info
+
+
 class TestGeocodingIntegration:
     """Integration tests for geocoding tools."""
 
@@ -318,21 +1065,25 @@ class TestGeocodingIntegration:
         async def run_test():
             # Mock geocode response
             geocode_response = Mock()
-            geocode_response.json.return_value = [
-                {
-                    "lat": "35.6812",
-                    "lon": "139.7671",
-                    "display_name": "東京駅",
-                }
-            ]
+            geocode_response.content = json.dumps(
+                [
+                    {
+                        "lat": "35.6812",
+                        "lon": "139.7671",
+                        "display_name": "東京駅",
+                    }
+                ]
+            ).encode()
             geocode_response.raise_for_status = Mock()
 
             # Mock reverse geocode response
             reverse_response = Mock()
-            reverse_response.json.return_value = {
-                "display_name": "東京駅, 千代田区",
-                "address": {"railway": "東京駅"},
-            }
+            reverse_response.content = json.dumps(
+                {
+                    "display_name": "東京駅, 千代田区",
+                    "address": {"railway": "東京駅"},
+                }
+            ).encode()
             reverse_response.raise_for_status = Mock()
 
             with patch("tools.geocoding.httpx.AsyncClient") as mock_client:
@@ -9,6 +9,7 @@ Tests end-to-end workflows combining multiple components:
 """
 
 import asyncio
+import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -166,25 +167,27 @@ class TestFullWorkflows:
 
             # Mock feature response
             feature_response = Mock()
-            feature_response.json.return_value = {
-                "features": [
-                    {
-                        "id": "550e8400-e29b-41d4-a716-446655440022",
-                        "geometry": {"type": "Point", "coordinates": [139.7, 35.65]},
-                        "layer_name": "points",
-                    },
-                    {
-                        "id": "f2",
-                        "geometry": {"type": "Point", "coordinates": [139.75, 35.7]},
-                        "layer_name": "points",
-                    },
-                    {
-                        "id": "f3",
-                        "geometry": {"type": "Polygon", "coordinates": [[]]},
-                        "layer_name": "areas",
-                    },
-                ]
-            }
+            feature_response.content = json.dumps(
+                {
+                    "features": [
+                        {
+                            "id": "550e8400-e29b-41d4-a716-446655440022",
+                            "geometry": {"type": "Point", "coordinates": [139.7, 35.65]},
+                            "layer_name": "points",
+                        },
+                        {
+                            "id": "f2",
+                            "geometry": {"type": "Point", "coordinates": [139.75, 35.7]},
+                            "layer_name": "points",
+                        },
+                        {
+                            "id": "f3",
+                            "geometry": {"type": "Polygon", "coordinates": [[]]},
+                            "layer_name": "areas",
+                        },
+                    ]
+                }
+            ).encode()
             feature_response.raise_for_status = Mock()
 
             with (
@@ -198,8 +201,26 @@ class TestFullWorkflows:
                 mock_feat_instance.__aexit__.return_value = None
                 mock_features.return_value = mock_feat_instance
 
+                # The tile server aggregates area stats itself
+                stats_response = Mock()
+                stats_response.content = json.dumps(
+                    {
+                        "total_features": 3,
+                        "geometry_types": {"Point": 2, "Polygon": 1},
+                        "layers": {
+                            "points": {"feature_count": 2, "geometry_types": {"Point": 2}},
+                            "areas": {"feature_count": 1, "geometry_types": {"Polygon": 1}},
+                        },
+                        "coordinate_count": 2,
+                        "tilesets_found": 1,
+                    }
+                ).encode()
+                stats_response.raise_for_status = Mock()
+
                 mock_stats_instance = AsyncMock()
-                mock_stats_instance.get.return_value = feature_response
+                mock_stats_instance.get.side_effect = lambda url, **kwargs: (
+                    stats_response if url.endswith("/api/features/stats") else feature_response
+                )
                 mock_stats_instance.__aenter__.return_value = mock_stats_instance
                 mock_stats_instance.__aexit__.return_value = None
                 mock_stats.return_value = mock_stats_instance
@@ -212,7 +233,8 @@ class TestFullWorkflows:
                 # Step 2: Get area statistics
                 stats = await get_area_stats(bbox=bbox)
                 assert "area_km2" in stats
-                assert stats["feature_count"] >= 0
+                assert stats["feature_count"] == 3
+                assert stats["layers"] == ["areas", "points"]
 
         asyncio.run(run_test())
 
@@ -368,7 +390,7 @@ class TestEdgeCases:
             from tools.features import search_features
 
             mock_response = Mock()
-            mock_response.json.return_value = {"features": []}
+            mock_response.content = json.dumps({"features": []}).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.features.httpx.AsyncClient") as mock_client:
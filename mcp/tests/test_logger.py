@@ -195,6 +195,31 @@ class TestToolCallLogger:
             with ToolCallLogger(logger, "failing_tool"):
                 raise ValueError("Test error")
 
+    def test_skips_logging_when_info_disabled(self):
+        """ToolCallLogger should not log or summarize when INFO is disabled."""
+        logger = logging.getLogger("tool_call_quiet_test")
+        logger.setLevel(logging.WARNING)
+
+        with patch.object(logger, "info") as mock_info:
+            with patch.object(ToolCallLogger, "_summarize_result") as mock_summary:
+                with ToolCallLogger(logger, "quiet_tool") as log:
+                    log.set_result({"count": 1})
+
+        mock_info.assert_not_called()
+        mock_summary.assert_not_called()
+
+    def test_logs_failure_when_info_disabled(self):
+        """ToolCallLogger should still log failures when INFO is disabled."""
+        logger = logging.getLogger("tool_call_quiet_failure_test")
+        logger.setLevel(logging.WARNING)
+
+        with patch.object(logger, "error") as mock_error:
+            with pytest.raises(ValueError):
+                with ToolCallLogger(logger, "quiet_tool"):
+                    raise ValueError("Test error")
+
+        mock_error.assert_called_once()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
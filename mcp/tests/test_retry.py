@@ -3,28 +3,38 @@ Tests for retry utilities.
 
 This module tests:
 - Retry configuration
+- Shared HTTP client
 - fetch_with_retry function
+- fetch_items_with_retry function
 - post_with_retry function
 - RetryableClient class
 """
 
 import asyncio
+import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
 import pytest
 
+import retry
 from retry import (
+    HTTP2_AVAILABLE,
     RETRY_MAX_ATTEMPTS,
     RETRY_MAX_WAIT,
     RETRY_MIN_WAIT,
     RETRYABLE_EXCEPTIONS,
     RetryableClient,
     _create_retry_config,
+    close_shared_client,
     delete_with_retry,
+    fetch_items_with_retry,
     fetch_with_retry,
+    get_shared_client,
+    parse_json,
     post_with_retry,
     put_with_retry,
+    warm_shared_client,
 )
 
 
@@ -63,6 +73,150 @@ class TestRetryConfiguration:
         )
         assert config is not None
 
+    def test_create_retry_config_is_shared(self):
+        """Identical arguments should reuse one read-only configuration."""
+        config = _create_retry_config(max_attempts=2)
+        assert _create_retry_config(max_attempts=2) is config
+        assert _create_retry_config(max_attempts=4) is not config
+        with pytest.raises(TypeError):
+            config["reraise"] = False
+
+
+class TestSharedClient:
+    """Tests for the shared HTTP client."""
+
+    def test_reused_within_event_loop(self):
+        """get_shared_client should return the same client on one loop."""
+
+        async def run_test():
+            client = get_shared_client()
+            try:
+                assert get_shared_client() is client
+            finally:
+                await close_shared_client()
+
+        asyncio.run(run_test())
+
+    def test_recreated_per_event_loop(self):
+        """A client from a previous event loop should not be reused."""
+
+        async def get_client():
+            return get_shared_client()
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+        assert first is not second
+
+    def test_recreated_after_close(self):
+        """Closing the shared client should make the next call build a new one."""
+
+        async def run_test():
+            client = get_shared_client()
+            await close_shared_client()
+            assert client.is_closed
+
+            replacement = get_shared_client()
+            try:
+                assert replacement is not client
+                assert not replacement.is_closed
+            finally:
+                await close_shared_client()
+
+        asyncio.run(run_test())
+
+    def test_http2_follows_h2_availability(self):
+        """The shared client should enable HTTP/2 exactly when h2 is installed."""
+
+        async def run_test():
+            with patch("retry.httpx.AsyncClient") as mock_client:
+                get_shared_client()
+            assert mock_client.call_args.kwargs["http2"] is HTTP2_AVAILABLE
+
+        asyncio.run(run_test())
+
+    def test_pool_limits_follow_settings(self):
+        """The shared client's pool should be sized from the HTTP_MAX_* settings."""
+
+        async def run_test():
+            with patch("retry.httpx.AsyncClient") as mock_client:
+                get_shared_client()
+            limits = mock_client.call_args.kwargs["limits"]
+            assert limits.max_connections == retry.settings.http_max_connections
+            assert limits.max_keepalive_connections == (
+                retry.settings.http_max_keepalive_connections
+            )
+
+        asyncio.run(run_test())
+
+    def test_explicit_client_bypasses_shared_client(self):
+        """A client passed to fetch_with_retry should be used instead of the shared one."""
+
+        async def run_test():
+            transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": 1}))
+            async with httpx.AsyncClient(transport=transport) as client:
+                data = await fetch_with_retry("https://example.com/a", client=client)
+                items = await fetch_items_with_retry(
+                    "https://example.com/b", "item", lambda item: item, client=client
+                )
+
+            assert data == {"ok": 1}
+            assert items == []
+            assert retry._shared_client is None
+
+        asyncio.run(run_test())
+
+    def test_requests_share_one_client(self):
+        """Consecutive fetches should go through a single client instance."""
+
+        async def run_test():
+            mock_response = Mock()
+            mock_response.content = json.dumps({"data": "test"}).encode()
+            mock_response.raise_for_status = Mock()
+
+            with patch("retry.httpx.AsyncClient") as mock_client:
+                mock_instance = AsyncMock()
+                mock_instance.is_closed = False
+                mock_instance.get.return_value = mock_response
+                mock_client.return_value = mock_instance
+
+                await fetch_with_retry("https://example.com/a")
+                await fetch_with_retry("https://example.com/b")
+
+                assert mock_client.call_count == 1
+                assert mock_instance.get.call_count == 2
+
+        asyncio.run(run_test())
+
+    def test_warm_up_primes_shared_client(self):
+        """warm_shared_client should connect through the shared client."""
+
+        async def run_test():
+            with patch("retry.httpx.AsyncClient") as mock_client:
+                mock_instance = AsyncMock()
+                mock_instance.is_closed = False
+                mock_client.return_value = mock_instance
+
+                await warm_shared_client("https://example.com/api/health")
+
+                assert get_shared_client() is mock_instance
+                mock_instance.get.assert_awaited_once_with("https://example.com/api/health")
+
+        asyncio.run(run_test())
+
+    def test_warm_up_failure_is_ignored(self):
+        """An unreachable server should not make the warm-up raise."""
+
+        async def run_test():
+            with patch("retry.httpx.AsyncClient") as mock_client:
+                mock_instance = AsyncMock()
+                mock_instance.is_closed = False
+                mock_instance.get.side_effect = httpx.ConnectError("refused")
+                mock_client.return_value = mock_instance
+
+                await warm_shared_client("https://example.com/api/health")
+
+        asyncio.run(run_test())
+
 
 class TestFetchWithRetry:
     """Tests for fetch_with_retry function."""
@@ -72,7 +226,7 @@ class TestFetchWithRetry:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {"data": "test"}
+            mock_response.content = json.dumps({"data": "test"}).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("retry.httpx.AsyncClient") as mock_client:
@@ -94,7 +248,7 @@ class TestFetchWithRetry:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {"data": "test"}
+            mock_response.content = json.dumps({"data": "test"}).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("retry.httpx.AsyncClient") as mock_client:
@@ -119,7 +273,7 @@ class TestFetchWithRetry:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {"data": "test"}
+            mock_response.content = json.dumps({"data": "test"}).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("retry.httpx.AsyncClient") as mock_client:
@@ -144,7 +298,7 @@ class TestFetchWithRetry:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {"data": "test"}
+            mock_response.content = json.dumps({"data": "test"}).encode()
             mock_response.raise_for_status = Mock()
 
             call_count = 0
@@ -196,6 +350,100 @@ class TestFetchWithRetry:
         asyncio.run(run_test())
 
 
+class TestParseJson:
+    """Tests for parse_json function."""
+
+    def test_parse_json_decodes_body(self):
+        """parse_json should decode the raw response body, including non-ASCII text."""
+        response = httpx.Response(200, json={"name": "東京駅", "lat": 35.6812})
+        assert parse_json(response) == {"name": "東京駅", "lat": 35.6812}
+
+    def test_parse_json_invalid_body(self):
+        """parse_json should raise ValueError on a non-JSON body."""
+        response = httpx.Response(200, content=b"<html>")
+        with pytest.raises(ValueError):
+            parse_json(response)
+
+
+class TestFetchItemsWithRetry:
+    """Tests for fetch_items_with_retry function."""
+
+    def _patch_transport(self, handler):
+        """Route the retry module's clients through an httpx.MockTransport."""
+        real_client = httpx.AsyncClient
+        return patch(
+            "retry.httpx.AsyncClient",
+            side_effect=lambda **kwargs: real_client(
+                transport=httpx.MockTransport(handler), **kwargs
+            ),
+        )
+
+    def test_streams_top_level_array(self):
+        """fetch_items_with_retry should transform each item of a JSON array."""
+
+        async def run_test():
+            def handler(request):
+                return httpx.Response(200, json=[{"v": 1.5}, {"v": 2}, {"v": 3}])
+
+            with self._patch_transport(handler):
+                items = await fetch_items_with_retry(
+                    "https://api.example.com/data", "item", lambda item: item["v"] * 2
+                )
+
+            assert items == [3.0, 4, 6]
+            assert isinstance(items[0], float)
+
+        asyncio.run(run_test())
+
+    def test_streams_nested_prefix(self):
+        """fetch_items_with_retry should follow dotted prefixes."""
+
+        async def run_test():
+            def handler(request):
+                return httpx.Response(
+                    200, json={"type": "FeatureCollection", "features": [{"id": "a"}, {"id": "b"}]}
+                )
+
+            with self._patch_transport(handler):
+                items = await fetch_items_with_retry(
+                    "https://api.example.com/features", "features.item", lambda f: f["id"]
+                )
+
+            assert items == ["a", "b"]
+
+        asyncio.run(run_test())
+
+    def test_raises_on_http_error(self):
+        """fetch_items_with_retry should raise HTTPStatusError for error responses."""
+
+        async def run_test():
+            def handler(request):
+                return httpx.Response(503, json={"error": "unavailable"})
+
+            with self._patch_transport(handler):
+                with pytest.raises(httpx.HTTPStatusError):
+                    await fetch_items_with_retry("https://api.example.com/data", "item", dict)
+
+        asyncio.run(run_test())
+
+    def test_falls_back_without_ijson(self):
+        """fetch_items_with_retry should use fetch_with_retry when ijson is missing."""
+
+        async def run_test():
+            with (
+                patch("retry.IJSON_AVAILABLE", False),
+                patch("retry.fetch_with_retry", new_callable=AsyncMock) as mock_fetch,
+            ):
+                mock_fetch.return_value = {"features": [{"id": "a"}]}
+                items = await fetch_items_with_retry(
+                    "https://api.example.com/features", "features.item", lambda f: f["id"]
+                )
+
+            assert items == ["a"]
+
+        asyncio.run(run_test())
+
+
 class TestPostWithRetry:
     """Tests for post_with_retry function."""
 
@@ -204,7 +452,7 @@ class TestPostWithRetry:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {"id": "123"}
+            mock_response.content = json.dumps({"id": "123"}).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("retry.httpx.AsyncClient") as mock_client:
@@ -229,7 +477,7 @@ class TestPostWithRetry:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {"id": "123"}
+            mock_response.content = json.dumps({"id": "123"}).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("retry.httpx.AsyncClient") as mock_client:
@@ -258,7 +506,7 @@ class TestPutWithRetry:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {"updated": True}
+            mock_response.content = json.dumps({"updated": True}).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("retry.httpx.AsyncClient") as mock_client:
@@ -286,7 +534,7 @@ class TestDeleteWithRetry:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {"deleted": True}
+            mock_response.content = json.dumps({"deleted": True}).encode()
             mock_response.status_code = 200
             mock_response.raise_for_status = Mock()
 
@@ -346,7 +594,7 @@ class TestRetryableClient:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {"data": "test"}
+            mock_response.content = json.dumps({"data": "test"}).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("retry.httpx.AsyncClient") as mock_client:
@@ -366,7 +614,7 @@ class TestRetryableClient:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {"id": "123"}
+            mock_response.content = json.dumps({"id": "123"}).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("retry.httpx.AsyncClient") as mock_client:
@@ -400,7 +648,7 @@ class TestRetryableClient:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {"data": "test"}
+            mock_response.content = json.dumps({"data": "test"}).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("retry.httpx.AsyncClient") as mock_client:
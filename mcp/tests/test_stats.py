@@ -7,15 +7,23 @@ This module tests:
 - get_layer_stats
 - get_area_stats
 - Helper functions
+- Server-side aggregation via /api/features/stats (with local fallback)
 """
 
 import asyncio
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
+import pytest
+
+from cache import stats_endpoint_unsupported
+from errors import ErrorCode
 from tools.stats import (
+    _TILE_SERVER_URL,
     _calculate_bbox_area_km2,
-    _count_coordinates,
-    _extract_geometry_type,
+    _get_auth_headers,
+    _stats_endpoint_missing,
+    _summarize_feature,
     get_area_stats,
     get_feature_distribution,
     get_layer_stats,
@@ -24,6 +32,25 @@ from tools.stats import (
 from validators import validate_bbox
 
 
+@pytest.fixture(autouse=True)
+def local_aggregation():
+    """Make the tools aggregate features locally, as without the stats endpoint.
+
+    Test classes covering the server-side aggregation override this fixture.
+    """
+    with patch("tools.stats._fetch_server_stats", AsyncMock(return_value=None)):
+        yield
+
+
+def _streamed(features):
+    """Stand-in for fetch_items_with_retry that transforms the given features."""
+
+    async def fake_fetch_items(url, prefix, transform, **kwargs):
+        return [transform(feature) for feature in features]
+
+    return fake_fetch_items
+
+
 class TestHelperFunctions:
     """Tests for helper functions."""
 
@@ -57,6 +84,27 @@ class TestHelperFunctions:
         # Should be roughly 2000-3000 km²
         assert 2000 < area < 3500
 
+    def test_summarize_feature(self):
+        """_summarize_feature should keep only the aggregated values."""
+        feature = {
+            "geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1]]},
+            "layer_name": "roads",
+            "tileset_id": "t1",
+            "properties": {"name": "Main St", "lanes": 2},
+        }
+
+        assert _summarize_feature(feature) == ("LineString", 2, "roads", "t1", ("name", "lanes"))
+        assert _summarize_feature({}) == ("Unknown", 0, "default", None, ())
+
+    def test_calculate_bbox_area_degenerate(self):
+        """_calculate_bbox_area_km2 should return 0 for a zero-size bbox."""
+        assert _calculate_bbox_area_km2(139.5, 35.5, 139.5, 35.5) == 0.0
+
+    def test_calculate_bbox_area_reversed_corners(self):
+        """_calculate_bbox_area_km2 should be non-negative for swapped corners."""
+        area = _calculate_bbox_area_km2(140.0, 36.0, 139.5, 35.5)
+        assert area == pytest.approx(_calculate_bbox_area_km2(139.5, 35.5, 140.0, 36.0))
+
     def test_calculate_bbox_area_small(self):
         """_calculate_bbox_area_km2 should work for small areas."""
         # Very small area (0.01 degree square)
@@ -64,45 +112,89 @@ class TestHelperFunctions:
         # Should be roughly 1 km²
         assert 0.5 < area < 2.0
 
-    def test_extract_geometry_type_point(self):
-        """_extract_geometry_type should extract Point type."""
+    def test_geometry_type_point(self):
+        """_summarize_feature should extract Point type."""
         feature = {"geometry": {"type": "Point", "coordinates": [139.7, 35.6]}}
-        assert _extract_geometry_type(feature) == "Point"
+        assert _summarize_feature(feature)[0] == "Point"
 
-    def test_extract_geometry_type_polygon(self):
-        """_extract_geometry_type should extract Polygon type."""
+    def test_geometry_type_polygon(self):
+        """_summarize_feature should extract Polygon type."""
         feature = {"geometry": {"type": "Polygon", "coordinates": [[]]}}
-        assert _extract_geometry_type(feature) == "Polygon"
+        assert _summarize_feature(feature)[0] == "Polygon"
 
-    def test_extract_geometry_type_geom_field(self):
-        """_extract_geometry_type should handle 'geom' field."""
+    def test_geometry_type_geom_field(self):
+        """_summarize_feature should handle the 'geom' field."""
         feature = {"geom": {"type": "LineString", "coordinates": []}}
-        assert _extract_geometry_type(feature) == "LineString"
+        assert _summarize_feature(feature)[0] == "LineString"
 
-    def test_extract_geometry_type_missing(self):
-        """_extract_geometry_type should return Unknown for missing geometry."""
+    def test_geometry_type_missing(self):
+        """_summarize_feature should report Unknown for missing geometry."""
         feature = {}
-        assert _extract_geometry_type(feature) == "Unknown"
+        assert _summarize_feature(feature)[0] == "Unknown"
 
-    def test_count_coordinates_point(self):
-        """_count_coordinates should count 1 for Point."""
+    def test_coordinate_count_point(self):
+        """_summarize_feature should count 1 for Point."""
         feature = {"geometry": {"type": "Point", "coordinates": [139.7, 35.6]}}
-        assert _count_coordinates(feature) == 1
+        assert _summarize_feature(feature)[1] == 1
 
-    def test_count_coordinates_linestring(self):
-        """_count_coordinates should count LineString coordinates."""
+    def test_coordinate_count_linestring(self):
+        """_summarize_feature should count LineString coordinates."""
         feature = {"geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1], [2, 2]]}}
-        assert _count_coordinates(feature) == 3
+        assert _summarize_feature(feature)[1] == 3
 
-    def test_count_coordinates_polygon(self):
-        """_count_coordinates should count Polygon coordinates."""
+    def test_coordinate_count_polygon(self):
+        """_summarize_feature should count Polygon coordinates."""
         feature = {
             "geometry": {
                 "type": "Polygon",
                 "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]],
             }
         }
-        assert _count_coordinates(feature) == 5
+        assert _summarize_feature(feature)[1] == 5
+
+    def test_coordinate_count_missing_coordinates(self):
+        """Geometries without coordinates should count as zero, not raise."""
+        feature = {"geometry": {"type": "Polygon"}}
+        assert _summarize_feature(feature)[1] == 0
+
+    def test_coordinate_count_unknown_type(self):
+        """Unsupported geometry types should count as zero."""
+        feature = {"geometry": {"type": "GeometryCollection", "geometries": []}}
+        assert _summarize_feature(feature)[1] == 0
+
+    def test_coordinate_count_multipolygon(self):
+        """_summarize_feature should count every ring of every polygon."""
+        square = [[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]
+        triangle = [[0, 0], [1, 0], [0, 1], [0, 0]]
+        feature = {
+            "geometry": {
+                "type": "MultiPolygon",
+                "coordinates": [[square, triangle], [triangle]],
+            }
+        }
+        assert _summarize_feature(feature)[1] == 13
+
+    def test_auth_headers_built_once(self):
+        """_get_auth_headers should return one shared read-only mapping."""
+        _get_auth_headers.cache_clear()
+        try:
+            with patch("tools.stats.settings.api_token", "secret"):
+                headers = _get_auth_headers()
+                assert headers == {"Authorization": "Bearer secret"}
+                assert _get_auth_headers() is headers
+                with pytest.raises(TypeError):
+                    headers["Authorization"] = "changed"
+        finally:
+            _get_auth_headers.cache_clear()
+
+    def test_auth_headers_empty_without_token(self):
+        """_get_auth_headers should be empty when no API token is configured."""
+        _get_auth_headers.cache_clear()
+        try:
+            with patch("tools.stats.settings.api_token", None):
+                assert _get_auth_headers() == {}
+        finally:
+            _get_auth_headers.cache_clear()
 
 
 class TestGetTilesetStats:
@@ -141,11 +233,17 @@ class TestGetTilesetStats:
                 ]
             }
 
-            with patch("tools.stats.fetch_with_retry") as mock_fetch:
-                mock_fetch.side_effect = [tileset_data, features_data]
-
+            with (
+                patch("tools.stats.fetch_with_retry", return_value=tileset_data),
+                patch(
+                    "tools.stats.fetch_items_with_retry",
+                    side_effect=_streamed(features_data["features"]),
+                ) as mock_stream,
+            ):
                 result = await get_tileset_stats("550e8400-e29b-41d4-a716-446655440000")
 
+                assert mock_stream.call_args.args[1] == "features.item"
+
                 assert result["tileset_id"] == "550e8400-e29b-41d4-a716-446655440000"
                 assert result["tileset_name"] == "Test Tileset"
                 assert result["feature_count"] == 3
@@ -156,6 +254,79 @@ class TestGetTilesetStats:
 
         asyncio.run(run_test())
 
+    def test_layer_breakdown_and_coordinate_count(self):
+        """Per-layer counts and coordinate totals should cover every geometry type."""
+
+        async def run_test():
+            features_data = {
+                "features": [
+                    {"geometry": {"type": "Point", "coordinates": [0, 0]}, "layer_name": "a"},
+                    {
+                        "geom": {"type": "MultiLineString", "coordinates": [[[0, 0], [1, 1]]]},
+                        "layer_name": "a",
+                    },
+                    {
+                        "geometry": {
+                            "type": "MultiPolygon",
+                            "coordinates": [[[[0, 0], [1, 0], [0, 1], [0, 0]]]],
+                        }
+                    },
+                    {"geometry": None, "layer_name": "a"},
+                ]
+            }
+
+            with (
+                patch("tools.stats.fetch_with_retry", return_value={"name": "T"}),
+                patch(
+                    "tools.stats.fetch_items_with_retry",
+                    side_effect=_streamed(features_data["features"]),
+                ),
+            ):
+                result = await get_tileset_stats("550e8400-e29b-41d4-a716-446655440000")
+
+            assert result["coordinate_count"] == 1 + 2 + 4
+            assert result["layers"] == {
+                "a": {
+                    "feature_count": 3,
+                    "geometry_types": {"Point": 1, "MultiLineString": 1, "Unknown": 1},
+                },
+                "default": {"feature_count": 1, "geometry_types": {"MultiPolygon": 1}},
+            }
+
+        asyncio.run(run_test())
+
+    def test_streams_feature_collection(self):
+        """A real FeatureCollection body should be stream-parsed into the stats."""
+
+        async def run_test():
+            real_client = httpx.AsyncClient
+            collection = {
+                "type": "FeatureCollection",
+                "features": [
+                    {"geometry": {"type": "Point", "coordinates": [0, 0]}, "layer_name": "a"},
+                    {"geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1]]}},
+                ],
+            }
+
+            def handler(request):
+                if request.url.path == "/api/features":
+                    return httpx.Response(200, json=collection)
+                return httpx.Response(200, json={"name": "T"})
+
+            with patch(
+                "retry.httpx.AsyncClient",
+                side_effect=lambda **kwargs: real_client(
+                    transport=httpx.MockTransport(handler), **kwargs
+                ),
+            ):
+                result = await get_tileset_stats("550e8400-e29b-41d4-a716-446655440000")
+
+            assert result["feature_count"] == 2
+            assert result["coordinate_count"] == 3
+            assert result["geometry_types"] == {"Point": 1, "LineString": 1}
+
+        asyncio.run(run_test())
+
     def test_invalid_tileset_id(self):
         """get_tileset_stats should return error for invalid tileset_id."""
 
@@ -172,7 +343,10 @@ class TestGetTilesetStats:
         async def run_test():
             import httpx
 
-            with patch("tools.stats.fetch_with_retry") as mock_fetch:
+            with (
+                patch("tools.stats.fetch_with_retry") as mock_fetch,
+                patch("tools.stats.fetch_items_with_retry", return_value=[]),
+            ):
                 mock_response = Mock()
                 mock_response.status_code = 404
                 mock_response.text = "Not found"
@@ -186,6 +360,71 @@ class TestGetTilesetStats:
 
         asyncio.run(run_test())
 
+    def test_tileset_info_is_cached(self):
+        """Repeated calls for a tileset should fetch its metadata once."""
+
+        async def run_test():
+            with (
+                patch(
+                    "tools.stats.fetch_with_retry", return_value={"name": "Cached"}
+                ) as mock_fetch,
+                patch("tools.stats.fetch_items_with_retry", side_effect=_streamed([])),
+            ):
+                first = await get_tileset_stats("550e8400-e29b-41d4-a716-446655440000")
+                first["tileset_name"] = "mutated"
+                second = await get_tileset_stats("550e8400-e29b-41d4-a716-446655440000")
+
+            assert mock_fetch.call_count == 1
+            assert second["tileset_name"] == "Cached"
+
+        asyncio.run(run_test())
+
+    def test_requests_run_concurrently(self):
+        """Tileset info and features should be fetched at the same time."""
+
+        async def run_test():
+            in_flight = 0
+            peak = 0
+
+            async def fake_fetch(url, *args, **kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return [] if url.endswith("/api/features") else {"name": "T"}
+
+            with (
+                patch("tools.stats.fetch_with_retry", side_effect=fake_fetch),
+                patch("tools.stats.fetch_items_with_retry", side_effect=fake_fetch),
+            ):
+                result = await get_tileset_stats("550e8400-e29b-41d4-a716-446655440000")
+
+            assert result["tileset_name"] == "T"
+            assert peak == 2
+
+        asyncio.run(run_test())
+
+    def test_tileset_error_takes_precedence(self):
+        """When both requests fail, the tileset info error should be reported."""
+
+        async def run_test():
+            async def fake_fetch(url, *args, **kwargs):
+                if url.endswith("/api/features"):
+                    raise RuntimeError("features failed")
+                await asyncio.sleep(0.01)
+                raise RuntimeError("tileset failed")
+
+            with (
+                patch("tools.stats.fetch_with_retry", side_effect=fake_fetch),
+                patch("tools.stats.fetch_items_with_retry", side_effect=fake_fetch),
+            ):
+                result = await get_tileset_stats("550e8400-e29b-41d4-a716-446655440000")
+
+            assert "tileset failed" in result["error"]
+
+        asyncio.run(run_test())
+
 
 class TestGetFeatureDistribution:
     """Tests for get_feature_distribution function."""
@@ -203,8 +442,8 @@ class TestGetFeatureDistribution:
                 ]
             }
 
-            with patch("tools.stats.fetch_with_retry") as mock_fetch:
-                mock_fetch.return_value = features_data
+            with patch("tools.stats.fetch_items_with_retry") as mock_fetch:
+                mock_fetch.side_effect = _streamed(features_data["features"])
 
                 result = await get_feature_distribution()
 
@@ -216,14 +455,53 @@ class TestGetFeatureDistribution:
 
         asyncio.run(run_test())
 
+    def test_distribution_empty_has_no_percentages(self):
+        """No features should yield empty tallies and percentages."""
+
+        async def run_test():
+            with patch("tools.stats.fetch_items_with_retry") as mock_fetch:
+                mock_fetch.side_effect = _streamed([])
+                result = await get_feature_distribution()
+
+            assert result["total_features"] == 0
+            assert result["percentages"] == {}
+
+        asyncio.run(run_test())
+
+    def test_distribution_percentages_of_thirds(self):
+        """Percentages should be rounded to two decimals."""
+
+        async def run_test():
+            features = [{"geometry": {"type": t}} for t in ("Point", "Point", "Polygon")]
+            with patch("tools.stats.fetch_items_with_retry") as mock_fetch:
+                mock_fetch.side_effect = _streamed(features)
+                result = await get_feature_distribution()
+
+            assert result["percentages"] == {"Point": 66.67, "Polygon": 33.33}
+
+        asyncio.run(run_test())
+
+    def test_distribution_returns_plain_dicts(self):
+        """Tallies should be returned as plain dicts, without default factories."""
+
+        async def run_test():
+            with patch("tools.stats.fetch_items_with_retry") as mock_fetch:
+                mock_fetch.side_effect = _streamed([{"geometry": {"type": "Point"}}])
+                result = await get_feature_distribution()
+
+            assert type(result["geometry_types"]) is dict
+            assert "LineString" not in result["geometry_types"]
+
+        asyncio.run(run_test())
+
     def test_distribution_with_tileset_filter(self):
         """get_feature_distribution should pass tileset_id to API."""
 
         async def run_test():
             features_data = {"features": []}
 
-            with patch("tools.stats.fetch_with_retry") as mock_fetch:
-                mock_fetch.return_value = features_data
+            with patch("tools.stats.fetch_items_with_retry") as mock_fetch:
+                mock_fetch.side_effect = _streamed(features_data["features"])
 
                 result = await get_feature_distribution(
                     tileset_id="550e8400-e29b-41d4-a716-446655440000"
@@ -272,8 +550,8 @@ class TestGetLayerStats:
                 ]
             }
 
-            with patch("tools.stats.fetch_with_retry") as mock_fetch:
-                mock_fetch.return_value = features_data
+            with patch("tools.stats.fetch_items_with_retry") as mock_fetch:
+                mock_fetch.side_effect = _streamed(features_data["features"])
 
                 result = await get_layer_stats("550e8400-e29b-41d4-a716-446655440000")
 
@@ -285,6 +563,32 @@ class TestGetLayerStats:
 
         asyncio.run(run_test())
 
+    def test_property_keys_sampled_from_first_three(self):
+        """Property keys should come from the first 3 features that have properties."""
+
+        async def run_test():
+            features_data = {
+                "features": [
+                    {"layer_name": "roads", "geometry": {"type": "LineString"}},
+                    {"layer_name": "roads", "properties": {"name": "a", "lanes": 2}},
+                    {"layer_name": "roads", "properties": {}},
+                    {"layer_name": "roads", "properties": {"name": "b"}},
+                    {"layer_name": "roads", "properties": {"surface": "asphalt"}},
+                    {"layer_name": "roads", "properties": {"toll": True}},
+                ]
+            }
+
+            with patch("tools.stats.fetch_items_with_retry") as mock_fetch:
+                mock_fetch.side_effect = _streamed(features_data["features"])
+
+                result = await get_layer_stats("550e8400-e29b-41d4-a716-446655440000")
+
+                roads = result["layers"]["roads"]
+                assert roads["property_keys"] == ["lanes", "name", "surface"]
+                assert "_sampled" not in roads
+
+        asyncio.run(run_test())
+
     def test_default_layer(self):
         """get_layer_stats should use 'default' for features without layer."""
 
@@ -295,8 +599,8 @@ class TestGetLayerStats:
                 ]
             }
 
-            with patch("tools.stats.fetch_with_retry") as mock_fetch:
-                mock_fetch.return_value = features_data
+            with patch("tools.stats.fetch_items_with_retry") as mock_fetch:
+                mock_fetch.side_effect = _streamed(features_data["features"])
 
                 result = await get_layer_stats("550e8400-e29b-41d4-a716-446655440000")
 
@@ -315,6 +619,83 @@ class TestGetLayerStats:
         asyncio.run(run_test())
 
 
+class TestFeatureFetchCache:
+    """Tests for sharing feature fetches between stats tools."""
+
+    TILESET_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+    def test_layer_and_distribution_share_fetch(self):
+        """Consecutive tools on the same tileset should fetch the features once."""
+
+        async def run_test():
+            features_data = {"features": [{"layer_name": "roads", "geometry": {"type": "Point"}}]}
+
+            with patch("tools.stats.fetch_items_with_retry") as mock_fetch:
+                mock_fetch.side_effect = _streamed(features_data["features"])
+
+                layer_result = await get_layer_stats(self.TILESET_ID)
+                distribution = await get_feature_distribution(tileset_id=self.TILESET_ID)
+
+                assert mock_fetch.call_count == 1
+                assert layer_result["total_features"] == 1
+                assert distribution["geometry_types"] == {"Point": 1}
+
+        asyncio.run(run_test())
+
+    def test_concurrent_calls_share_request(self):
+        """Concurrent identical calls should share one in-flight request."""
+
+        async def run_test():
+            async def slow_fetch(*args, **kwargs):
+                await asyncio.sleep(0.01)
+                return []
+
+            with patch("tools.stats.fetch_items_with_retry", side_effect=slow_fetch) as mock_fetch:
+                await asyncio.gather(
+                    get_layer_stats(self.TILESET_ID),
+                    get_layer_stats(self.TILESET_ID),
+                )
+
+                assert mock_fetch.call_count == 1
+
+        asyncio.run(run_test())
+
+    def test_errors_are_not_cached(self):
+        """A failed fetch should be retried by the next call."""
+
+        async def run_test():
+            request = httpx.Request("GET", "http://test/api/features")
+            error = httpx.HTTPStatusError(
+                "Server error", request=request, response=httpx.Response(503, request=request)
+            )
+
+            with patch("tools.stats.fetch_items_with_retry") as mock_fetch:
+                mock_fetch.side_effect = [error, []]
+
+                first = await get_layer_stats(self.TILESET_ID)
+                second = await get_layer_stats(self.TILESET_ID)
+
+                assert "error" in first
+                assert second["total_features"] == 0
+                assert mock_fetch.call_count == 2
+
+        asyncio.run(run_test())
+
+    def test_different_params_fetch_separately(self):
+        """Different queries should not share a cached response."""
+
+        async def run_test():
+            with patch("tools.stats.fetch_items_with_retry") as mock_fetch:
+                mock_fetch.side_effect = _streamed([])
+
+                await get_area_stats("139.5,35.5,140.0,36.0")
+                await get_area_stats("139.0,35.0,140.0,36.0")
+
+                assert mock_fetch.call_count == 2
+
+        asyncio.run(run_test())
+
+
 class TestGetAreaStats:
     """Tests for get_area_stats function."""
 
@@ -329,8 +710,8 @@ class TestGetAreaStats:
                 ]
             }
 
-            with patch("tools.stats.fetch_with_retry") as mock_fetch:
-                mock_fetch.return_value = features_data
+            with patch("tools.stats.fetch_items_with_retry") as mock_fetch:
+                mock_fetch.side_effect = _streamed(features_data["features"])
 
                 result = await get_area_stats("139.5,35.5,140.0,36.0")
 
@@ -343,6 +724,28 @@ class TestGetAreaStats:
 
         asyncio.run(run_test())
 
+    def test_distinct_layers_and_tilesets(self):
+        """Layers and tilesets should be deduplicated; missing tileset ids ignored."""
+
+        async def run_test():
+            features_data = {
+                "features": [
+                    {"geometry": {"type": "Point"}, "layer_name": "b", "tileset_id": "t1"},
+                    {"geometry": {"type": "Point"}, "layer_name": "a", "tileset_id": "t1"},
+                    {"geometry": {"type": "Point"}, "tileset_id": "t2"},
+                    {"geometry": {"type": "Point"}, "layer_name": "a", "tileset_id": None},
+                ]
+            }
+
+            with patch("tools.stats.fetch_items_with_retry") as mock_fetch:
+                mock_fetch.side_effect = _streamed(features_data["features"])
+                result = await get_area_stats("139.5,35.5,140.0,36.0")
+
+            assert result["layers"] == ["a", "b", "default"]
+            assert result["tilesets_found"] == 2
+
+        asyncio.run(run_test())
+
     def test_invalid_bbox(self):
         """get_area_stats should return error for invalid bbox."""
 
@@ -360,8 +763,8 @@ class TestGetAreaStats:
         async def run_test():
             features_data = {"features": []}
 
-            with patch("tools.stats.fetch_with_retry") as mock_fetch:
-                mock_fetch.return_value = features_data
+            with patch("tools.stats.fetch_items_with_retry") as mock_fetch:
+                mock_fetch.side_effect = _streamed(features_data["features"])
 
                 result = await get_area_stats("139.5,35.5,140.0,36.0")
 
@@ -378,8 +781,8 @@ class TestGetAreaStats:
         async def run_test():
             features_data = {"features": []}
 
-            with patch("tools.stats.fetch_with_retry") as mock_fetch:
-                mock_fetch.return_value = features_data
+            with patch("tools.stats.fetch_items_with_retry") as mock_fetch:
+                mock_fetch.side_effect = _streamed(features_data["features"])
 
                 result = await get_area_stats(
                     bbox="139.5,35.5,140.0,36.0",
@@ -390,6 +793,21 @@ class TestGetAreaStats:
 
         asyncio.run(run_test())
 
+    def test_sends_normalized_bbox(self):
+        """get_area_stats should send the parsed bbox, echoing the input in the query."""
+
+        async def run_test():
+            with patch("tools.stats.fetch_items_with_retry") as mock_fetch:
+                mock_fetch.side_effect = _streamed([])
+
+                result = await get_area_stats(bbox="139.5, 35.5, 140, 36")
+
+                params = mock_fetch.call_args.kwargs["params"]
+                assert params["bbox"] == "139.5,35.5,140.0,36.0"
+                assert result["query"]["bbox"] == "139.5, 35.5, 140, 36"
+
+        asyncio.run(run_test())
+
     def test_with_invalid_tileset_id(self):
         """get_area_stats should return error for invalid tileset_id."""
 
@@ -402,3 +820,232 @@ class TestGetAreaStats:
             assert "VALIDATION_ERROR" in result.get("code", "")
 
         asyncio.run(run_test())
+
+
+class TestServerAggregation:
+    """Tests for using the tile server's /api/features/stats aggregation."""
+
+    TILESET_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+    # What an older geo-base API answers GET /api/features/stats with
+    LEGACY_ERROR = {
+        "error": {
+            "code": "internal_db_error",
+            "message": 'Error fetching feature: invalid input syntax for type uuid: "stats"',
+        }
+    }
+
+    SERVER_STATS = {
+        "total_features": 2500,
+        "geometry_types": {"Point": 2000, "Polygon": 500},
+        "layers": {
+            "stations": {
+                "feature_count": 2000,
+                "geometry_types": {"Point": 2000},
+                "coordinate_count": 2000,
+                "property_keys": ["lines", "name"],
+            },
+            "parks": {
+                "feature_count": 500,
+                "geometry_types": {"Polygon": 500},
+                "coordinate_count": 6000,
+                "property_keys": [],
+            },
+        },
+        "coordinate_count": 8000,
+        "tilesets_found": 2,
+    }
+
+    @pytest.fixture
+    def local_aggregation(self):
+        """Leave the stats endpoint lookup in place for these tests."""
+        yield
+
+    @staticmethod
+    def _status_error(status_code, body=None):
+        request = httpx.Request("GET", "http://test/api/features/stats")
+        response = httpx.Response(status_code, json=body, request=request)
+        return httpx.HTTPStatusError("error", request=request, response=response)
+
+    def _fake_fetch(self, stats=None, tileset=None):
+        """Stand-in for fetch_with_retry answering by URL."""
+
+        async def fake_fetch(url, params=None, headers=None, **kwargs):
+            if url.endswith("/api/features/stats"):
+                if isinstance(stats, Exception):
+                    raise stats
+                return stats
+            return tileset or {}
+
+        return fake_fetch
+
+    def test_tileset_stats_uses_server_counts(self):
+        """get_tileset_stats should report the server's exact counts without sampling."""
+
+        async def run_test():
+            fake = self._fake_fetch(stats=self.SERVER_STATS, tileset={"name": "Stations"})
+            with (
+                patch("tools.stats.fetch_with_retry", side_effect=fake),
+                patch("tools.stats.fetch_items_with_retry") as mock_items,
+            ):
+                result = await get_tileset_stats(self.TILESET_ID)
+
+            mock_items.assert_not_called()
+            assert result["tileset_name"] == "Stations"
+            assert result["feature_count"] == 2500
+            assert result["coordinate_count"] == 8000
+            assert result["layers"]["parks"] == {
+                "feature_count": 500,
+                "geometry_types": {"Polygon": 500},
+            }
+            assert result["is_sample"] is False
+            assert "sample_limit" not in result
+
+        asyncio.run(run_test())
+
+    def test_distribution_uses_server_counts(self):
+        """get_feature_distribution should compute percentages from the server counts."""
+
+        async def run_test():
+            with patch(
+                "tools.stats.fetch_with_retry", side_effect=self._fake_fetch(self.SERVER_STATS)
+            ) as mock_fetch:
+                result = await get_feature_distribution(tileset_id=self.TILESET_ID)
+
+            assert mock_fetch.call_count == 1
+            assert mock_fetch.call_args.kwargs["params"] == {"tileset_id": self.TILESET_ID}
+            assert result["total_features"] == 2500
+            assert result["percentages"] == {"Point": 80.0, "Polygon": 20.0}
+            assert result["is_sample"] is False
+
+        asyncio.run(run_test())
+
+    def test_layer_stats_uses_server_counts(self):
+        """get_layer_stats should request property keys and report exact layer stats."""
+
+        async def run_test():
+            with patch(
+                "tools.stats.fetch_with_retry", side_effect=self._fake_fetch(self.SERVER_STATS)
+            ) as mock_fetch:
+                result = await get_layer_stats(self.TILESET_ID)
+
+            assert mock_fetch.call_args.kwargs["params"]["include_property_keys"] == "true"
+            assert result["layer_count"] == 2
+            assert result["layers"]["stations"] == {
+                "feature_count": 2000,
+                "geometry_types": {"Point": 2000},
+                "property_keys": ["lines", "name"],
+                "percentage": 80.0,
+            }
+            # The shared server response is left untouched
+            assert "percentage" not in self.SERVER_STATS["layers"]["stations"]
+
+        asyncio.run(run_test())
+
+    def test_area_stats_uses_server_counts(self):
+        """get_area_stats should derive density, layers and tilesets from the server counts."""
+
+        async def run_test():
+            with patch(
+                "tools.stats.fetch_with_retry", side_effect=self._fake_fetch(self.SERVER_STATS)
+            ):
+                result = await get_area_stats("139.5,35.5,140.0,36.0")
+
+            assert result["feature_count"] == 2500
+            assert result["layers"] == ["parks", "stations"]
+            assert result["tilesets_found"] == 2
+            assert result["density"]["features_per_km2"] > 0
+            assert result["is_sample"] is False
+
+        asyncio.run(run_test())
+
+    def test_falls_back_when_endpoint_missing(self):
+        """Without the endpoint, tools should aggregate features and stop probing it."""
+
+        async def run_test():
+            features = [{"layer_name": "roads", "geometry": {"type": "LineString"}}]
+            fake = self._fake_fetch(stats=self._status_error(500, self.LEGACY_ERROR))
+            with (
+                patch("tools.stats.fetch_with_retry", side_effect=fake) as mock_fetch,
+                patch("tools.stats.fetch_items_with_retry", side_effect=_streamed(features)),
+            ):
+                first = await get_feature_distribution(tileset_id=self.TILESET_ID)
+                second = await get_area_stats("139.5,35.5,140.0,36.0")
+
+            urls = [call.args[0] for call in mock_fetch.call_args_list]
+            assert sum(url.endswith("/api/features/stats") for url in urls) == 1
+            assert first["geometry_types"] == {"LineString": 1}
+            assert first["sample_limit"] == 1000
+            assert second["layers"] == ["roads"]
+
+        asyncio.run(run_test())
+
+    def test_server_errors_do_not_disable_endpoint(self):
+        """A 500 from the stats endpoint should be reported and not remembered."""
+
+        async def run_test():
+            error = self._status_error(
+                500,
+                {
+                    "error": {
+                        "code": "internal_db_error",
+                        "message": "Error computing feature stats: connection lost",
+                    }
+                },
+            )
+            with patch(
+                "tools.stats.fetch_with_retry", side_effect=self._fake_fetch(stats=error)
+            ) as mock_fetch:
+                result = await get_feature_distribution(tileset_id=self.TILESET_ID)
+
+            assert mock_fetch.call_count == 1
+            assert result["code"] == ErrorCode.SERVER_ERROR.value
+            assert stats_endpoint_unsupported.get(_TILE_SERVER_URL) is None
+
+        asyncio.run(run_test())
+
+    def test_endpoint_not_found_errors_are_not_masked(self):
+        """A 404 with the stats endpoint's own error code should not disable it."""
+
+        async def run_test():
+            error = self._status_error(404, {"error": {"code": "tileset_not_found"}})
+            with patch("tools.stats.fetch_with_retry", side_effect=self._fake_fetch(stats=error)):
+                result = await get_feature_distribution(tileset_id=self.TILESET_ID)
+
+            assert result["code"] == ErrorCode.NOT_FOUND.value
+            assert stats_endpoint_unsupported.get(_TILE_SERVER_URL) is None
+
+        asyncio.run(run_test())
+
+    @pytest.mark.parametrize(
+        "status_code, body, missing",
+        [
+            # Older geo-base servers: "stats" looked up as a feature ID
+            (500, LEGACY_ERROR, True),
+            # Tile servers without the route at all
+            (404, {"detail": "Not Found"}, True),
+            (405, {"detail": "Method Not Allowed"}, True),
+            # Failures of the stats endpoint itself
+            (500, {"error": {"code": "internal_db_error", "message": "Error computing"}}, False),
+            (500, None, False),
+            (404, {"error": {"code": "tileset_not_found", "message": "Tileset not found"}}, False),
+            (422, {"detail": [{"loc": ["query", "bbox"]}]}, False),
+        ],
+    )
+    def test_missing_endpoint_responses(self, status_code, body, missing):
+        """Only route misses and the legacy feature lookup mean the endpoint is missing."""
+        error = self._status_error(status_code, body)
+        assert _stats_endpoint_missing(error.response) is missing
+
+    def test_access_errors_are_not_masked(self):
+        """A 403 from the stats endpoint should be reported, not retried locally."""
+
+        async def run_test():
+            fake = self._fake_fetch(stats=self._status_error(403))
+            with patch("tools.stats.fetch_with_retry", side_effect=fake) as mock_fetch:
+                result = await get_layer_stats(self.TILESET_ID)
+
+            assert mock_fetch.call_count == 1
+            assert result["code"] == ErrorCode.FORBIDDEN.value
+
+        asyncio.run(run_test())
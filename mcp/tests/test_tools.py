@@ -13,6 +13,7 @@ Uses standard asyncio approach (not pytest-asyncio).
 """
 
 import asyncio
+import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -23,8 +24,10 @@ from tools.features import (
     search_features,
 )
 from tools.tilesets import (
+    MAX_BULK_TILESETS,
     get_tileset,
     get_tileset_tilejson,
+    get_tilesets_bulk,
     list_tilesets,
 )
 
@@ -37,10 +40,12 @@ class TestListTilesets:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = [
-                {"id": "id1", "name": "Tileset 1", "type": "vector"},
-                {"id": "id2", "name": "Tileset 2", "type": "raster"},
-            ]
+            mock_response.content = json.dumps(
+                [
+                    {"id": "id1", "name": "Tileset 1", "type": "vector"},
+                    {"id": "id2", "name": "Tileset 2", "type": "raster"},
+                ]
+            ).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.tilesets.httpx.AsyncClient") as mock_client:
@@ -85,7 +90,7 @@ class TestListTilesets:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = []
+            mock_response.content = json.dumps([]).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.tilesets.httpx.AsyncClient") as mock_client:
@@ -121,6 +126,23 @@ class TestListTilesets:
 
         asyncio.run(run_test())
 
+    def test_list_tilesets_is_cached_per_filter(self):
+        """Repeated listings should be cached separately for each filter."""
+
+        async def run_test():
+            with patch(
+                "tools.tilesets.fetch_with_retry", return_value=[{"id": "a", "name": "A"}]
+            ) as mock_fetch:
+                first = await list_tilesets()
+                second = await list_tilesets()
+                filtered = await list_tilesets(type="vector")
+
+            assert mock_fetch.call_count == 2
+            assert first == second
+            assert filtered["count"] == 1
+
+        asyncio.run(run_test())
+
 
 class TestGetTileset:
     """Tests for get_tileset function."""
@@ -130,15 +152,17 @@ class TestGetTileset:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {
-                "id": "550e8400-e29b-41d4-a716-446655440099",
-                "name": "Test Tileset",
-                "type": "vector",
-                "format": "pbf",
-                "min_zoom": 0,
-                "max_zoom": 14,
-                "bounds": [139.5, 35.5, 140.0, 36.0],
-            }
+            mock_response.content = json.dumps(
+                {
+                    "id": "550e8400-e29b-41d4-a716-446655440099",
+                    "name": "Test Tileset",
+                    "type": "vector",
+                    "format": "pbf",
+                    "min_zoom": 0,
+                    "max_zoom": 14,
+                    "bounds": [139.5, 35.5, 140.0, 36.0],
+                }
+            ).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.tilesets.httpx.AsyncClient") as mock_client:
@@ -155,6 +179,62 @@ class TestGetTileset:
 
         asyncio.run(run_test())
 
+    def test_get_tileset_is_cached(self):
+        """Repeated lookups of a tileset should be answered from the cache."""
+
+        async def run_test():
+            with patch(
+                "tools.tilesets.fetch_with_retry", return_value={"name": "Cached"}
+            ) as mock_fetch:
+                first = await get_tileset("550e8400-e29b-41d4-a716-446655440099")
+                second = await get_tileset("550e8400-e29b-41d4-a716-446655440099")
+
+            assert mock_fetch.call_count == 1
+            assert first["name"] == second["name"] == "Cached"
+
+        asyncio.run(run_test())
+
+    def test_concurrent_lookups_share_request(self):
+        """Concurrent lookups of one tileset should share a single request."""
+
+        async def run_test():
+            async def slow_fetch(*args, **kwargs):
+                await asyncio.sleep(0.01)
+                return {"name": "Shared"}
+
+            with patch("tools.tilesets.fetch_with_retry", side_effect=slow_fetch) as mock_fetch:
+                results = await asyncio.gather(
+                    get_tileset("550e8400-e29b-41d4-a716-446655440099"),
+                    get_tileset("550e8400-e29b-41d4-a716-446655440099"),
+                )
+
+            assert mock_fetch.call_count == 1
+            assert [r["name"] for r in results] == ["Shared", "Shared"]
+
+        asyncio.run(run_test())
+
+    def test_get_tileset_geojson_bounds(self):
+        """GeoJSON polygon bounds should be reduced to their extent."""
+
+        async def run_test():
+            bounds = {
+                "type": "Polygon",
+                "coordinates": [
+                    [[139.7, 35.6], [139.9, 35.5], [140.0, 35.8], [139.5, 36.0], [139.7, 35.6]]
+                ],
+            }
+            with patch("tools.tilesets.fetch_with_retry", return_value={"bounds": bounds}):
+                result = await get_tileset("550e8400-e29b-41d4-a716-446655440099")
+
+            assert result["bounds"] == {
+                "min_lng": 139.5,
+                "min_lat": 35.5,
+                "max_lng": 140.0,
+                "max_lat": 36.0,
+            }
+
+        asyncio.run(run_test())
+
     def test_get_tileset_not_found(self):
         """get_tileset should handle 404 errors."""
 
@@ -179,6 +259,119 @@ class TestGetTileset:
 
         asyncio.run(run_test())
 
+    @pytest.mark.parametrize(
+        "status_code, code, has_hint",
+        [(403, "FORBIDDEN", True), (404, "NOT_FOUND", False), (500, "SERVER_ERROR", False)],
+    )
+    def test_get_tileset_maps_http_errors(self, status_code, code, has_hint):
+        """get_tileset should map tile server status codes to error responses."""
+
+        async def run_test():
+            import httpx
+
+            tileset_id = "550e8400-e29b-41d4-a716-446655440000"
+            error = httpx.HTTPStatusError(
+                "", request=Mock(), response=Mock(status_code=status_code, text="")
+            )
+            with patch("tools.tilesets.fetch_with_retry", side_effect=error):
+                result = await get_tileset(tileset_id)
+
+            assert result["code"] == code
+            assert result["tileset_id"] == tileset_id
+            assert ("hint" in result) == has_hint
+
+        asyncio.run(run_test())
+
+
+class TestGetTilesetsBulk:
+    """Tests for get_tilesets_bulk function."""
+
+    ID_A = "550e8400-e29b-41d4-a716-446655440001"
+    ID_B = "550e8400-e29b-41d4-a716-446655440002"
+
+    def test_fetches_distinct_ids_concurrently(self):
+        """Distinct IDs should be fetched at once, duplicates only once, in order."""
+
+        async def run_test():
+            in_flight = 0
+            peak = 0
+
+            async def fake_fetch(url, **kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return {"id": url.rsplit("/", 1)[-1]}
+
+            with patch("tools.tilesets.fetch_with_retry", side_effect=fake_fetch) as mock_fetch:
+                result = await get_tilesets_bulk([self.ID_A, self.ID_B, self.ID_A])
+
+            assert mock_fetch.call_count == 2
+            assert peak == 2
+            assert result["count"] == 2
+            assert [ts["id"] for ts in result["tilesets"]] == [self.ID_A, self.ID_B]
+
+        asyncio.run(run_test())
+
+    def test_runs_without_keepalive_connections(self):
+        """Disabling keep-alive (HTTP_MAX_KEEPALIVE_CONNECTIONS=0) must not stall lookups."""
+
+        async def run_test():
+            with (
+                patch("tools.tilesets.settings.http_max_keepalive_connections", 0),
+                patch("tools.tilesets.fetch_with_retry", return_value={"name": "A"}),
+            ):
+                return await asyncio.wait_for(get_tilesets_bulk([self.ID_A, self.ID_B]), 1)
+
+        result = asyncio.run(run_test())
+
+        assert result["count"] == 2
+
+    def test_reports_errors_per_id(self):
+        """An invalid ID should fail on its own without failing the call."""
+
+        async def run_test():
+            with patch("tools.tilesets.fetch_with_retry", return_value={"name": "A"}):
+                result = await get_tilesets_bulk([self.ID_A, "not-a-uuid"])
+
+            assert result["tilesets"][0]["name"] == "A"
+            assert result["tilesets"][1]["code"] == "VALIDATION_ERROR"
+
+        asyncio.run(run_test())
+
+    def test_reports_malformed_entries_in_place(self):
+        """Non-string (even unhashable) entries should get their own error, in order."""
+
+        async def run_test():
+            with patch("tools.tilesets.fetch_with_retry", return_value={"name": "A"}):
+                return await get_tilesets_bulk([["x"], self.ID_A, {"id": 1}, self.ID_A])
+
+        result = asyncio.run(run_test())
+
+        assert result["count"] == 3
+        assert [ts.get("code") for ts in result["tilesets"]] == [
+            "VALIDATION_ERROR",
+            None,
+            "VALIDATION_ERROR",
+        ]
+        assert result["tilesets"][1]["name"] == "A"
+
+    @pytest.mark.parametrize("tileset_ids", [[], "550e8400-e29b-41d4-a716-446655440001"])
+    def test_rejects_empty_or_non_list(self, tileset_ids):
+        """tileset_ids must be a non-empty list."""
+        result = asyncio.run(get_tilesets_bulk(tileset_ids))
+
+        assert result["code"] == "VALIDATION_ERROR"
+        assert result["tilesets"] == []
+
+    def test_rejects_too_many_ids(self):
+        """More than MAX_BULK_TILESETS distinct IDs should be rejected."""
+        ids = [f"550e8400-e29b-41d4-a716-{i:012d}" for i in range(MAX_BULK_TILESETS + 1)]
+        result = asyncio.run(get_tilesets_bulk(ids))
+
+        assert result["code"] == "VALIDATION_ERROR"
+
 
 class TestGetTilesetTilejson:
     """Tests for get_tileset_tilejson function."""
@@ -188,13 +381,15 @@ class TestGetTilesetTilejson:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {
-                "tilejson": "2.2.0",
-                "tiles": ["https://example.com/tiles/{z}/{x}/{y}.pbf"],
-                "bounds": [139.5, 35.5, 140.0, 36.0],
-                "minzoom": 0,
-                "maxzoom": 14,
-            }
+            mock_response.content = json.dumps(
+                {
+                    "tilejson": "2.2.0",
+                    "tiles": ["https://example.com/tiles/{z}/{x}/{y}.pbf"],
+                    "bounds": [139.5, 35.5, 140.0, 36.0],
+                    "minzoom": 0,
+                    "maxzoom": 14,
+                }
+            ).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.tilesets.httpx.AsyncClient") as mock_client:
@@ -210,6 +405,21 @@ class TestGetTilesetTilejson:
 
         asyncio.run(run_test())
 
+    def test_get_tileset_tilejson_is_cached(self):
+        """Repeated TileJSON lookups should be answered from the cache."""
+
+        async def run_test():
+            with patch(
+                "tools.tilesets.fetch_with_retry", return_value={"tiles": ["t/{z}/{x}/{y}"]}
+            ) as mock_fetch:
+                await get_tileset_tilejson("550e8400-e29b-41d4-a716-446655440099")
+                result = await get_tileset_tilejson("550e8400-e29b-41d4-a716-446655440099")
+
+            assert mock_fetch.call_count == 1
+            assert result["tiles"] == ["t/{z}/{x}/{y}"]
+
+        asyncio.run(run_test())
+
 
 class TestSearchFeatures:
     """Tests for search_features function."""
@@ -219,20 +429,22 @@ class TestSearchFeatures:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {
-                "features": [
-                    {
-                        "id": "550e8400-e29b-41d4-a716-446655440004",
-                        "geometry": {"type": "Point", "coordinates": [139.7, 35.6]},
-                        "properties": {"name": "Point 1"},
-                    },
-                    {
-                        "id": "550e8400-e29b-41d4-a716-446655440005",
-                        "geometry": {"type": "Point", "coordinates": [139.8, 35.7]},
-                        "properties": {"name": "Point 2"},
-                    },
-                ]
-            }
+            mock_response.content = json.dumps(
+                {
+                    "features": [
+                        {
+                            "id": "550e8400-e29b-41d4-a716-446655440004",
+                            "geometry": {"type": "Point", "coordinates": [139.7, 35.6]},
+                            "properties": {"name": "Point 1"},
+                        },
+                        {
+                            "id": "550e8400-e29b-41d4-a716-446655440005",
+                            "geometry": {"type": "Point", "coordinates": [139.8, 35.7]},
+                            "properties": {"name": "Point 2"},
+                        },
+                    ]
+                }
+            ).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.features.httpx.AsyncClient") as mock_client:
@@ -254,7 +466,7 @@ class TestSearchFeatures:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {"features": []}
+            mock_response.content = json.dumps({"features": []}).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.features.httpx.AsyncClient") as mock_client:
@@ -276,7 +488,7 @@ class TestSearchFeatures:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {"features": []}
+            mock_response.content = json.dumps({"features": []}).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.features.httpx.AsyncClient") as mock_client:
@@ -297,7 +509,7 @@ class TestSearchFeatures:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {"features": []}
+            mock_response.content = json.dumps({"features": []}).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.features.httpx.AsyncClient") as mock_client:
@@ -318,7 +530,7 @@ class TestSearchFeatures:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {"features": []}
+            mock_response.content = json.dumps({"features": []}).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.features.httpx.AsyncClient") as mock_client:
@@ -339,7 +551,7 @@ class TestSearchFeatures:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {"features": [{"id": "1"}] * 50}
+            mock_response.content = json.dumps({"features": [{"id": "1"}] * 50}).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.features.httpx.AsyncClient") as mock_client:
@@ -364,14 +576,16 @@ class TestGetFeature:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {
-                "id": "550e8400-e29b-41d4-a716-446655440098",
-                "type": "Feature",
-                "geometry": {"type": "Point", "coordinates": [139.7, 35.6]},
-                "properties": {"name": "Test Point"},
-                "layer_name": "points",
-                "tileset_id": "tileset-id",
-            }
+            mock_response.content = json.dumps(
+                {
+                    "id": "550e8400-e29b-41d4-a716-446655440098",
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [139.7, 35.6]},
+                    "properties": {"name": "Test Point"},
+                    "layer_name": "points",
+                    "tileset_id": "tileset-id",
+                }
+            ).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.features.httpx.AsyncClient") as mock_client:
@@ -422,14 +636,16 @@ class TestGetFeaturesInTile:
 
         async def run_test():
             mock_response = Mock()
-            mock_response.json.return_value = {
-                "features": [
-                    {
-                        "id": "550e8400-e29b-41d4-a716-446655440004",
-                        "geometry": {"type": "Point", "coordinates": [139.76, 35.68]},
-                    },
-                ]
-            }
+            mock_response.content = json.dumps(
+                {
+                    "features": [
+                        {
+                            "id": "550e8400-e29b-41d4-a716-446655440004",
+                            "geometry": {"type": "Point", "coordinates": [139.76, 35.68]},
+                        },
+                    ]
+                }
+            ).encode()
             mock_response.raise_for_status = Mock()
 
             with patch("tools.features.httpx.AsyncClient") as mock_client:
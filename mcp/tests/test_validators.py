@@ -12,6 +12,10 @@ This module tests all validation functions including:
 - String and numeric validation
 """
 
+import dataclasses
+
+import pytest
+
 from validators import (
     ValidationResult,
     is_valid_uuid,
@@ -64,6 +68,12 @@ class TestValidationResult:
         result = ValidationResult(valid=True)
         assert result.to_error_response() == {}
 
+    def test_result_is_immutable(self):
+        """ValidationResult should be frozen so cached results can be shared."""
+        result = ValidationResult(valid=True, value=1)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.value = 2
+
 
 class TestUUIDValidation:
     """Tests for UUID validation."""
@@ -96,6 +106,12 @@ class TestUUIDValidation:
         assert result.valid is False
         assert "required" in result.error
 
+    def test_string_results_are_memoized(self):
+        """Should share results for repeated UUID strings."""
+        value = "550e8400-e29b-41d4-a716-446655440000"
+        assert validate_uuid(value, "tileset_id") is validate_uuid(value, "tileset_id")
+        assert validate_uuid(value, "feature_id") is not validate_uuid(value, "tileset_id")
+
     def test_is_valid_uuid_helper(self):
         """is_valid_uuid should return boolean."""
         assert is_valid_uuid("550e8400-e29b-41d4-a716-446655440000") is True
@@ -217,6 +233,13 @@ class TestBboxValidation:
         result = validate_bbox("139.5,95,140.0,36.0")  # Invalid latitude
         assert result.valid is False
 
+    def test_string_results_are_memoized(self):
+        """Should share results for repeated bbox strings but not lists."""
+        assert validate_bbox("139.5,35.5,140.0,36.0") is validate_bbox("139.5,35.5,140.0,36.0")
+        assert validate_bbox("invalid") is validate_bbox("invalid")
+        bbox = [139.5, 35.5, 140.0, 36.0]
+        assert validate_bbox(bbox) is not validate_bbox(bbox)
+
     def test_parse_bbox_helper(self):
         """parse_bbox should return tuple or None."""
         assert parse_bbox("139.5,35.5,140.0,36.0") == (139.5, 35.5, 140.0, 36.0)
@@ -448,6 +471,22 @@ class TestNumericValidation:
         result = validate_limit(1001, "limit")
         assert result.valid is False
 
+    def test_int_results_are_memoized(self):
+        """Repeated int inputs should return the same cached result."""
+        assert validate_range(5, "field", 1, 10) is validate_range(5, "field", 1, 10)
+        assert validate_limit(20, "limit") is validate_limit(20, "limit")
+        assert validate_zoom(12) is validate_zoom(12)
+
+    def test_non_int_inputs_bypass_cache(self):
+        """Floats and strings should still be validated (and coerced) uncached."""
+        result = validate_range(5.5, "field", min_value=1, max_value=10)
+        assert result.valid is True
+        assert result.value == 5.5
+
+        result = validate_limit("20", "limit")
+        assert result.valid is True
+        assert result.value == 20
+
 
 class TestFilterValidation:
     """Tests for filter string validation."""
@@ -33,7 +33,9 @@ from tools.features import (
 )
 from tools.geocoding import (
     geocode,
+    geocode_batch,
     reverse_geocode,
+    reverse_geocode_batch,
 )
 from tools.stats import (
     get_area_stats,
@@ -44,6 +46,7 @@ from tools.stats import (
 from tools.tilesets import (
     get_tileset,
     get_tileset_tilejson,
+    get_tilesets_bulk,
     list_tilesets,
 )
 
@@ -51,6 +54,7 @@ __all__ = [
     # Tilesets
     "list_tilesets",
     "get_tileset",
+    "get_tilesets_bulk",
     "get_tileset_tilejson",
     # Features
     "search_features",
@@ -58,7 +62,9 @@ __all__ = [
     "get_features_in_tile",
     # Geocoding
     "geocode",
+    "geocode_batch",
     "reverse_geocode",
+    "reverse_geocode_batch",
     # CRUD
     "create_tileset",
     "update_tileset",
@@ -8,8 +8,10 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 
+from cache import tilejson_cache, tileset_info_cache, tileset_list_cache
 from config import get_settings
 from logger import ToolCallLogger, get_logger
+from retry import parse_json
 from validators import (
     validate_geometry,
     validate_non_empty_string,
@@ -34,6 +36,13 @@ def _get_headers() -> dict:
     return headers
 
 
+def _forget_tileset(tileset_id: str) -> None:
+    """Drop cached metadata of a tileset that is being changed."""
+    tileset_info_cache.delete(tileset_id)
+    tilejson_cache.delete(tileset_id)
+    tileset_list_cache.clear()
+
+
 # ============================================================
 # Tileset CRUD Operations
 # ============================================================
@@ -151,6 +160,7 @@ async def create_tileset(
                     json=payload,
                     headers=_get_headers(),
                 )
+                tileset_list_cache.clear()
 
                 if response.status_code == 401:
                     logger.warning("Authentication required for create_tileset")
@@ -159,7 +169,7 @@ async def create_tileset(
                     return result
 
                 response.raise_for_status()
-                result = response.json()
+                result = parse_json(response)
                 logger.info(f"Created tileset: {result.get('id')}", extra={"tileset_name": name})
                 log.set_result(result)
                 return result
@@ -272,6 +282,7 @@ async def update_tileset(
                     json=payload,
                     headers=_get_headers(),
                 )
+                _forget_tileset(validated_tileset_id)
 
                 if response.status_code == 401:
                     logger.warning("Authentication required for update_tileset")
@@ -290,7 +301,7 @@ async def update_tileset(
                     return result
 
                 response.raise_for_status()
-                result = response.json()
+                result = parse_json(response)
                 logger.info(f"Updated tileset: {validated_tileset_id}")
                 log.set_result(result)
                 return result
@@ -348,6 +359,7 @@ async def delete_tileset(tileset_id: str) -> dict:
                     f"{tile_server_url}/api/tilesets/{validated_tileset_id}",
                     headers=_get_headers(),
                 )
+                _forget_tileset(validated_tileset_id)
 
                 if response.status_code == 401:
                     logger.warning("Authentication required for delete_tileset")
@@ -493,7 +505,7 @@ async def create_feature(
                     return result
 
                 response.raise_for_status()
-                result = response.json()
+                result = parse_json(response)
                 logger.info(
                     f"Created feature: {result.get('id')}",
                     extra={"tileset_id": validated_tileset_id},
@@ -605,7 +617,7 @@ async def update_feature(
                     return result
 
                 response.raise_for_status()
-                result = response.json()
+                result = parse_json(response)
                 logger.info(f"Updated feature: {validated_feature_id}")
                 log.set_result(result)
                 return result
@@ -7,18 +7,38 @@ Features:
 - Forward geocoding (address/place name to coordinates)
 - Reverse geocoding (coordinates to address)
 - Automatic retry for transient network errors
+- Item-by-item stream parsing of large result sets
 - Input validation with clear error messages
 - Support for multiple languages and country filters
+- Compressed Nominatim responses, negotiated by the shared HTTP client
+- Request pacing per the Nominatim usage policy (NOMINATIM_MIN_INTERVAL),
+  with Retry-After aware retries of 429/503 responses
+- In-process TTL cache of successful lookups, with concurrent identical
+  lookups coalesced onto one request
+- Concurrent batch geocoding (geocode_batch, reverse_geocode_batch) bounded by
+  GEOCODE_MAX_PARALLEL
 """
 
-from typing import Optional
+import asyncio
+import logging
+import re
+import time
+import unicodedata
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Optional, TypeVar
 
 import httpx
 from tenacity import RetryError
 
+from cache import geocoding_cache, geocoding_disk_cache, geocoding_flights
+from config import get_settings
 from errors import ErrorCode, create_error_response
 from logger import ToolCallLogger, get_logger
-from retry import fetch_with_retry
+from retry import fetch_items_with_retry, fetch_with_retry
 from validators import (
     validate_latitude,
     validate_limit,
@@ -27,11 +47,14 @@ from validators import (
     validate_zoom,
 )
 
-# Initialize logger
+T = TypeVar("T")
+
+# Initialize logger and settings
 logger = get_logger(__name__)
+settings = get_settings()
 
 # Nominatim API base URL
-NOMINATIM_URL = "https://nominatim.openstreetmap.org"
+NOMINATIM_URL = settings.nominatim_url.rstrip("/")
 
 # User-Agent header (required by Nominatim)
 USER_AGENT = "geo-base-mcp/1.0 (https://github.com/mopinfish/geo-base)"
@@ -39,6 +62,262 @@ USER_AGENT = "geo-base-mcp/1.0 (https://github.com/mopinfish/geo-base)"
 # Timeout for Nominatim requests (longer than default for external API)
 NOMINATIM_TIMEOUT = 30.0
 
+# Query parameters shared by every search and reverse request
+_STATIC_PARAMS = MappingProxyType({"format": "jsonv2", "addressdetails": 1})
+
+# Attempts for requests rejected with 429/503, and the longest Retry-After
+# delay honored between them
+NOMINATIM_MAX_ATTEMPTS = 3
+NOMINATIM_MAX_RETRY_AFTER = 30.0
+
+# Forward geocoding requests for at least this many results are stream-parsed
+# item by item; below it, streaming costs more than decoding the whole body
+STREAM_PARSE_MIN_LIMIT = 20
+
+
+# Nominatim search fields passed through to each result when present
+_OPTIONAL_RESULT_KEYS = (
+    "type",
+    "category",
+    "importance",
+    "place_id",
+    "osm_type",
+    "osm_id",
+    "address",
+)
+
+# Maximum number of queries/points accepted by a single batch call
+MAX_BATCH_QUERIES = 50
+
+# Constant fields of failed reverse responses, splatted into each error dict
+_EMPTY_REVERSE = MappingProxyType({"address": None, "display_name": None})
+
+# Exception type -> (error code, message template) for failed Nominatim calls.
+# Looked up along the exception's MRO, so subclasses resolve to their nearest entry.
+_ERROR_MAP: dict[type[BaseException], tuple[ErrorCode, str]] = {
+    httpx.ProxyError: (
+        ErrorCode.NETWORK_ERROR,
+        "Proxy error: {e}. This may be due to network restrictions.",
+    ),
+    httpx.HTTPStatusError: (ErrorCode.HTTP_ERROR, "HTTP error {status}: {e}"),
+    httpx.HTTPError: (ErrorCode.NETWORK_ERROR, "Network error: {e}"),
+    RetryError: (ErrorCode.NETWORK_ERROR, "Network error: {e}"),
+}
+
+
+def _classify(e: Exception) -> tuple[ErrorCode, str]:
+    """Map an exception to an error code and user-facing message."""
+    for cls in type(e).__mro__:
+        entry = _ERROR_MAP.get(cls)
+        if entry is not None:
+            code, template = entry
+            status = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
+            return code, template.format(e=e, status=status)
+    return ErrorCode.UNKNOWN_ERROR, f"Unexpected error: {type(e).__name__}: {e}"
+
+
+def _error_response(e: Exception, operation: str, extra: dict, **fields: Any) -> dict:
+    """Log a failed Nominatim lookup and build its error response.
+
+    Unexpected errors are logged as errors (with a traceback when DEBUG is
+    enabled); network and HTTP errors as warnings. ``fields`` are merged into the response.
+    """
+    code, message = _classify(e)
+    if code is ErrorCode.UNKNOWN_ERROR:
+        # Tracebacks are for debugging; skip formatting them at INFO and above
+        logger.error(
+            f"Unexpected error during {operation}: {message}",
+            extra=extra,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
+    else:
+        logger.warning(f"{operation.capitalize()} failed: {message}", extra=extra)
+    return create_error_response(message, code, **fields)
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_query(query: str) -> str:
+    """NFC-normalize a query and collapse runs of whitespace (including U+3000).
+
+    Case is preserved for the outbound request; Nominatim matches
+    whitespace-insensitively, so variants like "東京駅 " and "東京駅" map to
+    the same request.
+    """
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", query)).strip()
+
+
+@lru_cache(maxsize=4096)
+def _build_search_url(query: str, limit: int, language: str, country_codes: Optional[str]) -> str:
+    """Build the encoded Nominatim search URL, cached per unique request."""
+    params = {
+        "q": query,
+        **_STATIC_PARAMS,
+        "limit": limit,
+        "accept-language": language,
+    }
+
+    if country_codes:
+        params["countrycodes"] = country_codes
+
+    return f"{NOMINATIM_URL}/search?{httpx.QueryParams(params)}"
+
+
+def _parse_bounds(bbox: list[str], _float=float) -> dict:
+    """Convert a Nominatim boundingbox [south, north, west, east] to a bounds dict."""
+    return {
+        "south": _float(bbox[0]),
+        "north": _float(bbox[1]),
+        "west": _float(bbox[2]),
+        "east": _float(bbox[3]),
+    }
+
+
+def _format_result(item: dict, _float=float, _optional_keys=_OPTIONAL_RESULT_KEYS) -> dict:
+    """Shape a single Nominatim search result.
+
+    Optional fields are copied only when Nominatim sent them, keeping null
+    keys out of the response. The defaults bind ``float`` and the key tuple
+    as locals so the per-item loop skips the global/builtins lookups.
+    """
+    get = item.get
+    result_item = {
+        "name": get("display_name", ""),
+        "latitude": _float(get("lat", 0)),
+        "longitude": _float(get("lon", 0)),
+    }
+
+    for key in _optional_keys:
+        if key in item:
+            result_item[key] = item[key]
+
+    # Add bounding box if available
+    bbox = get("boundingbox")
+    if bbox:
+        result_item["bounds"] = _parse_bounds(bbox)
+
+    return result_item
+
+
+# Time of the last Nominatim request, and the lock serializing the pacing.
+# The lock is recreated per event loop since asyncio locks bind to one.
+_last_request = 0.0
+_rate_lock: asyncio.Lock | None = None
+_rate_lock_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def _wait_for_request_slot() -> None:
+    """Space Nominatim requests at least NOMINATIM_MIN_INTERVAL seconds apart."""
+    global _last_request, _rate_lock, _rate_lock_loop
+
+    interval = settings.nominatim_min_interval
+    if interval <= 0:
+        return
+
+    loop = asyncio.get_running_loop()
+    if _rate_lock is None or _rate_lock_loop is not loop:
+        _rate_lock = asyncio.Lock()
+        _rate_lock_loop = loop
+
+    async with _rate_lock:
+        delay = _last_request + interval - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        _last_request = time.monotonic()
+
+
+def _retry_after(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a throttled response."""
+    value = response.headers.get("Retry-After", "")
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            delay = 2.0**attempt
+    return min(max(delay, 0.0), NOMINATIM_MAX_RETRY_AFTER)
+
+
+async def _nominatim_get(
+    url: str,
+    params: Optional[dict] = None,
+    transform: Optional[Callable[[Any], Any]] = None,
+) -> Any:
+    """
+    GET a Nominatim endpoint under the request rate limit.
+
+    Responses rejected with 429 or 503 are retried (honoring Retry-After)
+    up to NOMINATIM_MAX_ATTEMPTS times; transient network errors are
+    retried by the underlying fetch helpers.
+
+    Args:
+        url: Endpoint URL
+        params: Optional query parameters
+        transform: If given, the response must be a JSON array; each item
+                   is passed through transform while the body streams in
+
+    Returns:
+        Parsed JSON response, or the list of transformed items
+    """
+    for attempt in range(1, NOMINATIM_MAX_ATTEMPTS + 1):
+        await _wait_for_request_slot()
+        try:
+            if transform is not None:
+                return await fetch_items_with_retry(
+                    url,
+                    "item",
+                    transform,
+                    params=params,
+                    headers={"User-Agent": USER_AGENT},
+                    timeout=NOMINATIM_TIMEOUT,
+                )
+            return await fetch_with_retry(
+                url,
+                params=params,
+                headers={"User-Agent": USER_AGENT},
+                timeout=NOMINATIM_TIMEOUT,
+            )
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if status not in (429, 503) or attempt == NOMINATIM_MAX_ATTEMPTS:
+                raise
+            delay = _retry_after(e.response, attempt)
+            logger.warning(
+                f"Nominatim returned {status}; retrying in {delay:.1f}s",
+                extra={"attempt": attempt},
+            )
+            await asyncio.sleep(delay)
+
+    raise RuntimeError("Unexpected state: retry exhausted without exception")
+
+
+async def _cache_get(key: tuple) -> Optional[dict]:
+    """Look up a response in memory, then on disk (promoting disk hits)."""
+    cached = geocoding_cache.get(key)
+    if cached is None:
+        cached = await geocoding_disk_cache.aget(key)
+        if cached is not None:
+            geocoding_cache.set(key, cached)
+    return cached
+
+
+async def _cache_set(key: tuple, value: dict) -> None:
+    """Store a response in both the memory and disk caches."""
+    geocoding_cache.set(key, value)
+    await geocoding_disk_cache.aset(key, value)
+
+
+async def _search(url: str, limit: int) -> list[dict]:
+    """Fetch a Nominatim search URL and shape its results."""
+    if limit >= STREAM_PARSE_MIN_LIMIT:
+        # Large responses: shape each result as it is parsed off the stream
+        return await _nominatim_get(url, transform=_format_result)
+
+    data = await _nominatim_get(url)
+    return [_format_result(item) for item in data]
+
 
 async def geocode(
     query: str,
@@ -69,150 +348,175 @@ async def geocode(
     with ToolCallLogger(
         logger, "geocode", query=query, limit=limit, country_codes=country_codes, language=language
     ) as log:
-        # Validate query
-        query_result = validate_non_empty_string(query, "query")
-        if not query_result.valid:
-            result = query_result.to_error_response(
-                results=[],
-                count=0,
-                query=query,
-            )
-            log.set_result(result)
-            return result
-
-        # Validate limit - use validate_limit which returns int
-        limit_result = validate_limit(limit, "limit", min_value=1, max_value=50)
-        if not limit_result.valid:
-            result = limit_result.to_error_response(
-                results=[],
-                count=0,
-                query=query,
-            )
-            log.set_result(result)
-            return result
-        validated_limit = limit_result.value  # This is now int, not float
-
-        params = {
-            "q": query,
-            "format": "jsonv2",
-            "limit": validated_limit,
-            "addressdetails": 1,
-            "accept-language": language,
-        }
-
-        if country_codes:
-            params["countrycodes"] = country_codes
+        # Validate query - the validator only runs when the inline check fails
+        if not (isinstance(query, str) and query.strip()):
+            query_result = validate_non_empty_string(query, "query")
+            if not query_result.valid:
+                result = query_result.to_error_response(
+                    results=[],
+                    count=0,
+                    query=query,
+                )
+                log.set_result(result)
+                return result
 
-        headers = {
-            "User-Agent": USER_AGENT,
-        }
+        # Validate limit - in-range ints skip validate_limit
+        if type(limit) is int and 1 <= limit <= 50:
+            validated_limit = limit
+        else:
+            limit_result = validate_limit(limit, "limit", min_value=1, max_value=50)
+            if not limit_result.valid:
+                result = limit_result.to_error_response(
+                    results=[],
+                    count=0,
+                    query=query,
+                )
+                log.set_result(result)
+                return result
+            validated_limit = limit_result.value  # This is now int, not float
+
+        # Serve repeated lookups from the cache; the key ignores case and
+        # whitespace variants of the same query
+        normalized_query = _normalize_query(str(query))
+        cache_key = (
+            "search",
+            normalized_query.casefold(),
+            validated_limit,
+            country_codes or "",
+            language,
+        )
+        cached = await _cache_get(cache_key)
+        if cached is not None:
+            cached["query"] = query
+            log.set_result(cached)
+            return cached
 
-        logger.debug(f"Geocoding query: '{query}'", extra={"country_codes": country_codes})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Geocoding query: '%s'", query, extra={"country_codes": country_codes})
 
         try:
-            # Use fetch_with_retry for automatic retry on transient errors
-            data = await fetch_with_retry(
-                f"{NOMINATIM_URL}/search",
-                params=params,
-                headers=headers,
-                timeout=NOMINATIM_TIMEOUT,
-            )
-
-            logger.debug(f"Nominatim returned {len(data)} results for '{query}'")
-
-            results = []
-            for item in data:
-                result_item = {
-                    "name": item.get("display_name", ""),
-                    "latitude": float(item.get("lat", 0)),
-                    "longitude": float(item.get("lon", 0)),
-                    "type": item.get("type", ""),
-                    "category": item.get("category", ""),
-                    "importance": item.get("importance", 0),
-                    "place_id": item.get("place_id"),
-                    "osm_type": item.get("osm_type"),
-                    "osm_id": item.get("osm_id"),
-                }
+            url = _build_search_url(normalized_query, validated_limit, language, country_codes)
 
-                # Add address details if available
-                if "address" in item:
-                    result_item["address"] = item["address"]
+            # Concurrent identical lookups share one Nominatim request
+            results = await geocoding_flights.do(cache_key, lambda: _search(url, validated_limit))
 
-                # Add bounding box if available
-                if "boundingbox" in item:
-                    bbox = item["boundingbox"]
-                    result_item["bounds"] = {
-                        "south": float(bbox[0]),
-                        "north": float(bbox[1]),
-                        "west": float(bbox[2]),
-                        "east": float(bbox[3]),
-                    }
-
-                results.append(result_item)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Nominatim returned %d results for '%s'", len(results), query)
 
             response_data = {
                 "results": results,
                 "count": len(results),
                 "query": query,
             }
+            await _cache_set(cache_key, response_data)
             log.set_result(response_data)
             return response_data
 
-        except httpx.ProxyError as e:
-            logger.warning(f"Proxy error during geocoding: {e}", extra={"query": query})
-            result = create_error_response(
-                f"Proxy error: {str(e)}. This may be due to network restrictions.",
-                ErrorCode.NETWORK_ERROR,
-                results=[],
-                count=0,
-                query=query,
+        except Exception as e:
+            result = _error_response(
+                e, "geocoding", {"query": query}, results=[], count=0, query=query
             )
             log.set_result(result)
             return result
 
-        except httpx.HTTPStatusError as e:
-            logger.warning(
-                f"HTTP error during geocoding: {e.response.status_code}",
-                extra={"query": query, "status_code": e.response.status_code},
-            )
-            result = create_error_response(
-                f"HTTP error {e.response.status_code}: {str(e)}",
-                ErrorCode.HTTP_ERROR,
-                results=[],
-                count=0,
-                query=query,
-            )
-            log.set_result(result)
-            return result
 
-        except (httpx.HTTPError, RetryError) as e:
-            logger.error(f"Network error during geocoding: {e}", extra={"query": query})
+async def _gather_limited(
+    calls: Iterable[Callable[[], Awaitable[T]]],
+    on_error: Callable[[int, Exception], T],
+) -> list[T]:
+    """Run calls concurrently, at most GEOCODE_MAX_PARALLEL at a time, in order.
+
+    A call that raises does not cancel the others; its slot is filled with
+    ``on_error(index, exception)``.
+    """
+    semaphore = asyncio.Semaphore(settings.geocode_max_parallel)
+
+    async def _run(call: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await call()
+
+    outcomes = await asyncio.gather(*(_run(call) for call in calls), return_exceptions=True)
+    results = []
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, Exception):
+            outcome = on_error(index, outcome)
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        results.append(outcome)
+    return results
+
+
+async def geocode_batch(
+    queries: list[str],
+    limit: int = 5,
+    country_codes: Optional[str] = None,
+    language: str = "ja",
+) -> dict:
+    """
+    Convert several addresses/place names to coordinates in one call.
+
+    Prefer this over awaiting geocode() in a loop: queries are geocoded
+    concurrently, sharing the underlying connection, bounded by the
+    GEOCODE_MAX_PARALLEL setting. Leave it at 1 when using the public
+    Nominatim service; self-hosted instances can raise it. A query that
+    fails becomes an error entry without aborting the others.
+
+    Args:
+        queries: Addresses or place names to search (1-50 entries)
+        limit: Maximum number of results per query (1-50, default: 5)
+        country_codes: Limit search to specific countries (comma-separated ISO 3166-1 codes)
+        language: Preferred language for results (default: "ja" for Japanese)
+
+    Returns:
+        Dictionary containing:
+        - results: One geocode response per query, in input order
+        - count: Number of queries processed
+    """
+    with ToolCallLogger(
+        logger,
+        "geocode_batch",
+        queries=queries,
+        limit=limit,
+        country_codes=country_codes,
+        language=language,
+    ) as log:
+        # Validate queries
+        if not isinstance(queries, list) or not queries:
             result = create_error_response(
-                f"Network error: {str(e)}",
-                ErrorCode.NETWORK_ERROR,
+                "queries must be a non-empty list of strings",
+                ErrorCode.VALIDATION_ERROR,
                 results=[],
                 count=0,
-                query=query,
             )
             log.set_result(result)
             return result
 
-        except Exception as e:
-            logger.error(
-                f"Unexpected error during geocoding: {type(e).__name__}: {e}",
-                extra={"query": query},
-                exc_info=True,
-            )
+        if len(queries) > MAX_BATCH_QUERIES:
             result = create_error_response(
-                f"Unexpected error: {type(e).__name__}: {str(e)}",
-                ErrorCode.UNKNOWN_ERROR,
+                f"queries must contain at most {MAX_BATCH_QUERIES} entries (got {len(queries)})",
+                ErrorCode.VALIDATION_ERROR,
                 results=[],
                 count=0,
-                query=query,
             )
             log.set_result(result)
             return result
 
+        results = await _gather_limited(
+            (
+                lambda query=query: geocode(
+                    query, limit=limit, country_codes=country_codes, language=language
+                )
+                for query in queries
+            ),
+            lambda i, e: _error_response(
+                e, "geocoding", {"query": queries[i]}, results=[], count=0, query=queries[i]
+            ),
+        )
+
+        result = {"results": results, "count": len(results)}
+        log.set_result(result)
+        return result
+
 
 async def reverse_geocode(
     latitude: float,
@@ -253,67 +557,92 @@ async def reverse_geocode(
         zoom=zoom,
         language=language,
     ) as log:
-        # Validate latitude
-        lat_result = validate_latitude(latitude, "latitude")
-        if not lat_result.valid:
-            result = lat_result.to_error_response(
-                address=None,
-                display_name=None,
-                coordinates={"latitude": latitude, "longitude": longitude},
-            )
-            log.set_result(result)
-            return result
-        validated_lat = lat_result.value
-
-        # Validate longitude
-        lng_result = validate_longitude(longitude, "longitude")
-        if not lng_result.valid:
-            result = lng_result.to_error_response(
-                address=None,
-                display_name=None,
-                coordinates={"latitude": latitude, "longitude": longitude},
-            )
-            log.set_result(result)
-            return result
-        validated_lng = lng_result.value
-
-        # Validate zoom - use validate_zoom which returns int
-        zoom_result = validate_zoom(zoom, min_zoom=0, max_zoom=18, field_name="zoom")
-        if not zoom_result.valid:
-            result = zoom_result.to_error_response(
-                address=None,
-                display_name=None,
-                coordinates={"latitude": latitude, "longitude": longitude},
-            )
-            log.set_result(result)
-            return result
-        validated_zoom = zoom_result.value  # This is now int, not float
+        # Validate latitude - in-range numbers skip validate_latitude. The
+        # chained comparison is False for NaN and infinities, so those still
+        # reach the validator; floats are used as-is, ints converted.
+        if type(latitude) is float and -90.0 <= latitude <= 90.0:
+            validated_lat = latitude
+        elif type(latitude) is int and -90 <= latitude <= 90:
+            validated_lat = float(latitude)
+        else:
+            lat_result = validate_latitude(latitude, "latitude")
+            if not lat_result.valid:
+                result = lat_result.to_error_response(
+                    **_EMPTY_REVERSE,
+                    coordinates={"latitude": latitude, "longitude": longitude},
+                )
+                log.set_result(result)
+                return result
+            validated_lat = lat_result.value
+
+        # Validate longitude - same fast path as latitude
+        if type(longitude) is float and -180.0 <= longitude <= 180.0:
+            validated_lng = longitude
+        elif type(longitude) is int and -180 <= longitude <= 180:
+            validated_lng = float(longitude)
+        else:
+            lng_result = validate_longitude(longitude, "longitude")
+            if not lng_result.valid:
+                result = lng_result.to_error_response(
+                    **_EMPTY_REVERSE,
+                    coordinates={"latitude": latitude, "longitude": longitude},
+                )
+                log.set_result(result)
+                return result
+            validated_lng = lng_result.value
+
+        # Validate zoom - in-range ints skip validate_zoom
+        if type(zoom) is int and 0 <= zoom <= 18:
+            validated_zoom = zoom
+        else:
+            zoom_result = validate_zoom(zoom, min_zoom=0, max_zoom=18, field_name="zoom")
+            if not zoom_result.valid:
+                result = zoom_result.to_error_response(
+                    **_EMPTY_REVERSE,
+                    coordinates={"latitude": latitude, "longitude": longitude},
+                )
+                log.set_result(result)
+                return result
+            validated_zoom = zoom_result.value  # This is now int, not float
+
+        # Coordinates are keyed at ~0.1 m precision (6 decimal places)
+        cache_key = (
+            "reverse",
+            round(validated_lat, 6),
+            round(validated_lng, 6),
+            validated_zoom,
+            language,
+        )
+        cached = await _cache_get(cache_key)
+        if cached is not None:
+            cached["coordinates"] = {"latitude": validated_lat, "longitude": validated_lng}
+            log.set_result(cached)
+            return cached
 
         params = {
             "lat": validated_lat,
             "lon": validated_lng,
-            "format": "jsonv2",
-            "addressdetails": 1,
+            **_STATIC_PARAMS,
             "zoom": validated_zoom,
             "accept-language": language,
         }
 
-        headers = {
-            "User-Agent": USER_AGENT,
-        }
-
-        logger.debug(
-            f"Reverse geocoding: lat={validated_lat}, lon={validated_lng}",
-            extra={"latitude": validated_lat, "longitude": validated_lng, "zoom": validated_zoom},
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Reverse geocoding: lat=%s, lon=%s",
+                validated_lat,
+                validated_lng,
+                extra={
+                    "latitude": validated_lat,
+                    "longitude": validated_lng,
+                    "zoom": validated_zoom,
+                },
+            )
 
         try:
-            # Use fetch_with_retry for automatic retry on transient errors
-            data = await fetch_with_retry(
-                f"{NOMINATIM_URL}/reverse",
-                params=params,
-                headers=headers,
-                timeout=NOMINATIM_TIMEOUT,
+            # Concurrent identical lookups share one request
+            data = await geocoding_flights.do(
+                cache_key, lambda: _nominatim_get(f"{NOMINATIM_URL}/reverse", params=params)
             )
 
             # Check if Nominatim returned an error
@@ -334,10 +663,12 @@ async def reverse_geocode(
                 log.set_result(result)
                 return result
 
-            logger.debug(
-                f"Reverse geocoding successful: {data.get('display_name', '')[:50]}...",
-                extra={"latitude": validated_lat, "longitude": validated_lng},
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Reverse geocoding successful: %.50s...",
+                    data.get("display_name", ""),
+                    extra={"latitude": validated_lat, "longitude": validated_lng},
+                )
 
             result = {
                 "display_name": data.get("display_name", ""),
@@ -358,78 +689,93 @@ async def reverse_geocode(
 
             # Add bounding box if available
             if "boundingbox" in data:
-                bbox = data["boundingbox"]
-                result["bounds"] = {
-                    "south": float(bbox[0]),
-                    "north": float(bbox[1]),
-                    "west": float(bbox[2]),
-                    "east": float(bbox[3]),
-                }
+                result["bounds"] = _parse_bounds(data["boundingbox"])
 
+            await _cache_set(cache_key, result)
             log.set_result(result)
             return result
 
-        except httpx.ProxyError as e:
-            logger.warning(
-                f"Proxy error during reverse geocoding: {e}",
-                extra={"latitude": validated_lat, "longitude": validated_lng},
-            )
-            result = create_error_response(
-                f"Proxy error: {str(e)}. This may be due to network restrictions.",
-                ErrorCode.NETWORK_ERROR,
-                address=None,
-                display_name=None,
-                coordinates={"latitude": validated_lat, "longitude": validated_lng},
+        except Exception as e:
+            coordinates = {"latitude": validated_lat, "longitude": validated_lng}
+            result = _error_response(
+                e, "reverse geocoding", coordinates, **_EMPTY_REVERSE, coordinates=coordinates
             )
             log.set_result(result)
             return result
 
-        except httpx.HTTPStatusError as e:
-            logger.warning(
-                f"HTTP error during reverse geocoding: {e.response.status_code}",
-                extra={
-                    "latitude": validated_lat,
-                    "longitude": validated_lng,
-                    "status_code": e.response.status_code,
-                },
-            )
+
+async def reverse_geocode_batch(
+    points: list[list[float]],
+    zoom: int = 18,
+    language: str = "ja",
+) -> dict:
+    """
+    Convert several coordinates to addresses in one call.
+
+    Points are reverse geocoded concurrently, bounded by the
+    GEOCODE_MAX_PARALLEL setting. Leave it at 1 when using the public
+    Nominatim service; self-hosted instances can raise it. Repeated points
+    are answered from the geocoding cache.
+
+    Args:
+        points: [latitude, longitude] pairs in decimal degrees (1-50 entries)
+        zoom: Level of detail for the addresses (0-18, default: 18)
+        language: Preferred language for results (default: "ja" for Japanese)
+
+    Returns:
+        Dictionary containing:
+        - results: One reverse_geocode response per point, in input order
+        - count: Number of points processed
+    """
+    with ToolCallLogger(
+        logger, "reverse_geocode_batch", points=points, zoom=zoom, language=language
+    ) as log:
+        # Validate points
+        if not isinstance(points, list) or not points:
             result = create_error_response(
-                f"HTTP error {e.response.status_code}: {str(e)}",
-                ErrorCode.HTTP_ERROR,
-                address=None,
-                display_name=None,
-                coordinates={"latitude": validated_lat, "longitude": validated_lng},
+                "points must be a non-empty list of [latitude, longitude] pairs",
+                ErrorCode.VALIDATION_ERROR,
+                results=[],
+                count=0,
             )
             log.set_result(result)
             return result
 
-        except (httpx.HTTPError, RetryError) as e:
-            logger.error(
-                f"Network error during reverse geocoding: {e}",
-                extra={"latitude": validated_lat, "longitude": validated_lng},
-            )
+        if len(points) > MAX_BATCH_QUERIES:
             result = create_error_response(
-                f"Network error: {str(e)}",
-                ErrorCode.NETWORK_ERROR,
-                address=None,
-                display_name=None,
-                coordinates={"latitude": validated_lat, "longitude": validated_lng},
+                f"points must contain at most {MAX_BATCH_QUERIES} entries (got {len(points)})",
+                ErrorCode.VALIDATION_ERROR,
+                results=[],
+                count=0,
             )
             log.set_result(result)
             return result
 
-        except Exception as e:
-            logger.error(
-                f"Unexpected error during reverse geocoding: {type(e).__name__}: {e}",
-                extra={"latitude": validated_lat, "longitude": validated_lng},
-                exc_info=True,
-            )
-            result = create_error_response(
-                f"Unexpected error: {type(e).__name__}: {str(e)}",
-                ErrorCode.UNKNOWN_ERROR,
-                address=None,
-                display_name=None,
-                coordinates={"latitude": validated_lat, "longitude": validated_lng},
+        for i, point in enumerate(points):
+            if not isinstance(point, (list, tuple)) or len(point) != 2:
+                result = create_error_response(
+                    f"points[{i}] must be a [latitude, longitude] pair",
+                    ErrorCode.VALIDATION_ERROR,
+                    results=[],
+                    count=0,
+                )
+                log.set_result(result)
+                return result
+
+        def on_error(i: int, e: Exception) -> dict:
+            coordinates = {"latitude": points[i][0], "longitude": points[i][1]}
+            return _error_response(
+                e, "reverse geocoding", coordinates, **_EMPTY_REVERSE, coordinates=coordinates
             )
-            log.set_result(result)
-            return result
+
+        results = await _gather_limited(
+            (
+                lambda lat=lat, lng=lng: reverse_geocode(lat, lng, zoom=zoom, language=language)
+                for lat, lng in points
+            ),
+            on_error,
+        )
+
+        result = {"results": results, "count": len(results)}
+        log.set_result(result)
+        return result
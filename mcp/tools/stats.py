@@ -8,35 +8,87 @@ Provides tools for analyzing geographic data statistics including:
 - Area-based statistics and density calculations
 
 Features:
+- Exact counts aggregated by the tile server (GET /api/features/stats),
+  falling back to counting a sample of features on older tile servers
+- Samples parsed as they stream in, keeping only per-feature summaries
 - Automatic retry for transient network errors
 - Input validation with clear error messages
 - Structured logging for debugging and monitoring
 """
 
+import asyncio
 import math
-from collections import Counter
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Mapping
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
 from typing import Any
 
 import httpx
 from tenacity import RetryError
 
+from cache import (
+    stats_endpoint_unsupported,
+    stats_features_cache,
+    stats_features_flights,
+    tileset_info_cache,
+    tileset_info_flights,
+)
 from config import get_settings
 from errors import ErrorCode, create_error_response, handle_api_error
 from logger import ToolCallLogger, get_logger
-from retry import fetch_with_retry
+from retry import fetch_items_with_retry, fetch_with_retry
 from validators import validate_bbox, validate_uuid
 
 # Initialize logger and settings
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Tile server endpoints; settings are fixed for the life of the process, so
+# the URLs are built once instead of on every tool call
+_TILE_SERVER_URL = settings.tile_server_url.rstrip("/")
+_FEATURES_URL = f"{_TILE_SERVER_URL}/api/features"
+_FEATURE_STATS_URL = f"{_FEATURES_URL}/stats"
 
-def _get_auth_headers() -> dict[str, str]:
-    """Get authentication headers if API token is configured."""
-    headers = {}
+# Maximum number of features fetched for a statistics sample; results with
+# this many features are flagged as a sample of a possibly larger set
+SAMPLE_LIMIT = 1000
+
+# Layer name reported for features that carry none
+DEFAULT_LAYER = "default"
+
+# Statuses of a route miss on a tile server without GET /api/features/stats
+_STATS_ROUTE_MISS_STATUSES = frozenset({404, 405})
+
+# Error a geo-base tile server that predates GET /api/features/stats answers
+# it with: "stats" is routed to GET /api/features/{feature_id}, whose lookup
+# of the non-UUID id fails in the database and is reported as a 500
+_LEGACY_FEATURE_ERROR_CODE = "internal_db_error"
+_LEGACY_FEATURE_ERROR_PREFIX = "Error fetching feature"
+
+# Sampling fields of a result counted over every matching feature
+_EXACT_FIELDS: Mapping[str, Any] = MappingProxyType({"is_sample": False})
+
+
+@lru_cache(maxsize=1)
+def _get_auth_headers() -> Mapping[str, str]:
+    """Get authentication headers if API token is configured.
+
+    Settings are fixed for the life of the process, so the headers are
+    built once and shared read-only (httpx copies them per request).
+    """
     if settings.api_token:
-        headers["Authorization"] = f"Bearer {settings.api_token}"
-    return headers
+        return MappingProxyType({"Authorization": f"Bearer {settings.api_token}"})
+    return MappingProxyType({})
+
+
+# Square of Earth's mean radius (6371 km), in km²
+_EARTH_RADIUS_KM_SQ = 6371.0 * 6371.0
+
+# Module-level bindings save an attribute lookup per call in the area math
+_radians = math.radians
+_cos = math.cos
 
 
 def _calculate_bbox_area_km2(
@@ -59,55 +111,273 @@ def _calculate_bbox_area_km2(
     Returns:
         Approximate area in square kilometers
     """
-    # Earth's radius in km
-    R = 6371.0
-
-    # Convert to radians
-    lat1 = math.radians(min_lat)
-    lat2 = math.radians(max_lat)
-    lng1 = math.radians(min_lng)
-    lng2 = math.radians(max_lng)
+    lat1 = _radians(min_lat)
+    lat2 = _radians(max_lat)
 
-    # Width and height in radians
+    # Height times width in radians; the width shrinks with the cosine of
+    # the average latitude
     d_lat = lat2 - lat1
-    d_lng = lng2 - lng1
+    d_lng = _radians(max_lng - min_lng)
+    return abs(d_lat * d_lng * _cos((lat1 + lat2) * 0.5)) * _EARTH_RADIUS_KM_SQ
+
+
+# Shared stand-in for features without geometry (never mutated)
+_EMPTY_GEOMETRY: Mapping[str, Any] = MappingProxyType({})
+
+# Coordinate point counters per GeoJSON geometry type; map(len) and chain
+# keep the ring iteration in C instead of nested generator expressions
+_COORD_COUNTERS: dict[str, Callable[[Any], int]] = {
+    "Point": lambda coords: 1,
+    "LineString": len,
+    "Polygon": lambda coords: sum(map(len, coords)),
+    "MultiPoint": len,
+    "MultiLineString": lambda coords: sum(map(len, coords)),
+    "MultiPolygon": lambda coords: sum(map(len, chain.from_iterable(coords))),
+}
+
+
+# What the stats tools need of a feature: (geometry type, coordinate count,
+# layer name, tileset ID, property keys)
+FeatureSummary = tuple[str, int, str, str | None, tuple[str, ...]]
+
+
+def _summarize_feature(feature: dict) -> FeatureSummary:
+    """Reduce a feature to the values the stats tools aggregate.
+
+    Resolves the geometry once; the coordinates themselves are dropped.
+    """
+    geom = feature.get("geometry") or feature.get("geom") or _EMPTY_GEOMETRY
+    geom_type = geom.get("type", "Unknown")
+    counter = _COORD_COUNTERS.get(geom_type)
+    coordinate_count = counter(geom.get("coordinates", ())) if counter else 0
+    return (
+        geom_type,
+        coordinate_count,
+        feature.get("layer_name", DEFAULT_LAYER),
+        feature.get("tileset_id"),
+        tuple(feature.get("properties") or ()),
+    )
+
+
+def _format_bbox(bounds: tuple[float, float, float, float]) -> str:
+    """Format validated bbox bounds as the canonical "minx,miny,maxx,maxy" query value.
+
+    Equivalent inputs (e.g. with spaces or integer values) map to the same
+    string, so the tile server sees one query for one area.
+    """
+    return "%r,%r,%r,%r" % bounds
+
 
-    # Average latitude for width calculation
-    avg_lat = (lat1 + lat2) / 2
+async def _fetch_shared(
+    url: str, params: dict[str, Any], fetch: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Run ``fetch``, sharing its result between stats tools for a few seconds.
+
+    Clients often call several stats tools on the same tileset in a row;
+    the short-lived cache, keyed by URL and params, lets them reuse one
+    response, and concurrent identical calls share one request. Failed
+    fetches are not cached. The returned data is shared, so callers must
+    not mutate it.
+    """
+    key = (url, tuple(sorted(params.items())))
+    data = stats_features_cache.get(key)
+    if data is None:
+        data = await stats_features_flights.do(key, fetch)
+        stats_features_cache.set(key, data)
+    return data
 
-    # Calculate dimensions in km
-    height_km = d_lat * R
-    width_km = d_lng * R * math.cos(avg_lat)
 
-    return abs(width_km * height_km)
+async def _fetch_feature_summaries(params: dict[str, Any]) -> list[FeatureSummary]:
+    """Fetch a sample of features as (shared, read-only) summaries.
 
+    The FeatureCollection is parsed while it streams in and each feature is
+    reduced to a :data:`FeatureSummary` on arrival, so up to SAMPLE_LIMIT
+    geometries never sit in memory (or in the shared cache) at once.
+    """
+    params = {**params, "limit": SAMPLE_LIMIT}
+    return await _fetch_shared(
+        _FEATURES_URL,
+        params,
+        lambda: fetch_items_with_retry(
+            _FEATURES_URL,
+            "features.item",
+            _summarize_feature,
+            params=params,
+            headers=_get_auth_headers(),
+        ),
+    )
+
+
+def _stats_endpoint_missing(response: httpx.Response) -> bool:
+    """Whether an error response shows the tile server lacks GET /api/features/stats.
+
+    Two responses qualify: a bare route miss (404/405 without an error code
+    of the stats endpoint itself), and the 500 of the legacy feature lookup
+    that older geo-base servers route "stats" to. Any other server error,
+    including a failure of the stats endpoint itself, is a real error.
+    """
+    status_code = response.status_code
+    if status_code not in _STATS_ROUTE_MISS_STATUSES and status_code != 500:
+        return False
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    error = body.get("error") if isinstance(body, dict) else None
+    if not isinstance(error, dict):
+        return status_code != 500
+    if status_code != 500:
+        return False
+    message = error.get("message")
+    return (
+        error.get("code") == _LEGACY_FEATURE_ERROR_CODE
+        and isinstance(message, str)
+        and message.startswith(_LEGACY_FEATURE_ERROR_PREFIX)
+    )
+
+
+async def _fetch_server_stats(params: dict[str, Any]) -> dict | None:
+    """Fetch feature statistics aggregated by the tile server.
+
+    GET /api/features/stats counts every matching feature in the database
+    and returns only the totals, instead of up to SAMPLE_LIMIT geometries.
+    Returns None when the tile server does not provide the endpoint; that
+    is remembered for a while so later calls skip the probe, and callers
+    aggregate a sample of the features themselves instead.
 
-def _extract_geometry_type(feature: dict) -> str:
-    """Extract geometry type from a feature."""
-    geom = feature.get("geometry") or feature.get("geom") or {}
-    return geom.get("type", "Unknown")
+    Args:
+        params: Filters (tileset_id, bbox, layer, include_property_keys)
 
+    Returns:
+        Shared, read-only stats response, or None if unsupported
+    """
+    if stats_endpoint_unsupported.get(_TILE_SERVER_URL):
+        return None
+    try:
+        return await _fetch_shared(
+            _FEATURE_STATS_URL,
+            params,
+            lambda: fetch_with_retry(
+                _FEATURE_STATS_URL, params=params, headers=_get_auth_headers()
+            ),
+        )
+    except httpx.HTTPStatusError as e:
+        if not _stats_endpoint_missing(e.response):
+            raise
+        logger.info(
+            "Tile server has no feature stats endpoint; aggregating features locally",
+            extra={"status_code": e.response.status_code},
+        )
+        stats_endpoint_unsupported.set(_TILE_SERVER_URL, True)
+        return None
+
+
+async def _fetch_tileset_info(tileset_id: str) -> dict[str, Any]:
+    """Fetch tileset metadata, cached for a minute.
+
+    Metadata changes rarely, so repeated stats calls for a tileset reuse it;
+    concurrent cold lookups share one request. Failed fetches are not cached.
+    """
+    tileset_info = tileset_info_cache.get(tileset_id)
+    if tileset_info is None:
+        tileset_info = await tileset_info_flights.do(
+            tileset_id,
+            lambda: fetch_with_retry(
+                f"{_TILE_SERVER_URL}/api/tilesets/{tileset_id}",
+                headers=_get_auth_headers(),
+            ),
+        )
+        tileset_info_cache.set(tileset_id, tileset_info)
+    return tileset_info
 
-def _count_coordinates(feature: dict) -> int:
-    """Count the number of coordinate points in a feature."""
-    geom = feature.get("geometry") or feature.get("geom") or {}
-    coords = geom.get("coordinates", [])
-    geom_type = geom.get("type", "")
 
-    if geom_type == "Point":
-        return 1
-    elif geom_type == "LineString":
-        return len(coords)
-    elif geom_type == "Polygon":
-        return sum(len(ring) for ring in coords)
-    elif geom_type == "MultiPoint":
-        return len(coords)
-    elif geom_type == "MultiLineString":
-        return sum(len(line) for line in coords)
-    elif geom_type == "MultiPolygon":
-        return sum(sum(len(ring) for ring in polygon) for polygon in coords)
+def _sample_fields(feature_count: int) -> dict[str, Any]:
+    """Sampling fields of a result aggregated from at most SAMPLE_LIMIT features."""
+    return {"sample_limit": SAMPLE_LIMIT, "is_sample": feature_count >= SAMPLE_LIMIT}
 
-    return 0
+
+async def _tileset_feature_stats(tileset_id: str) -> dict[str, Any]:
+    """Feature statistics of a tileset for get_tileset_stats.
+
+    Exact counts from the tile server when it can aggregate them; otherwise
+    features are streamed and reduced to summaries as they arrive, so the
+    full geometries never sit in memory at once.
+    """
+    server_stats = await _fetch_server_stats({"tileset_id": tileset_id})
+    if server_stats is not None:
+        return {
+            "feature_count": server_stats["total_features"],
+            "geometry_types": dict(server_stats["geometry_types"]),
+            "layers": {
+                name: {
+                    "feature_count": layer["feature_count"],
+                    "geometry_types": dict(layer["geometry_types"]),
+                }
+                for name, layer in server_stats["layers"].items()
+            },
+            "coordinate_count": server_stats["coordinate_count"],
+            **_EXACT_FIELDS,
+        }
+
+    summaries = await _fetch_feature_summaries({"tileset_id": tileset_id})
+    feature_count = len(summaries)
+    logger.debug(f"Retrieved {feature_count} features for analysis")
+
+    # Fold the per-feature summaries into the statistics
+    geometry_types: defaultdict[str, int] = defaultdict(int)
+    layer_counts: defaultdict[str, list] = defaultdict(lambda: [0, defaultdict(int)])
+    total_coordinates = 0
+
+    for geom_type, coordinate_count, layer_name, _, _ in summaries:
+        geometry_types[geom_type] += 1
+        total_coordinates += coordinate_count
+        layer = layer_counts[layer_name]
+        layer[0] += 1
+        layer[1][geom_type] += 1
+
+    return {
+        "feature_count": feature_count,
+        "geometry_types": dict(geometry_types),
+        "layers": {
+            name: {"feature_count": count, "geometry_types": dict(types)}
+            for name, (count, types) in layer_counts.items()
+        },
+        "coordinate_count": total_coordinates,
+        **_sample_fields(feature_count),
+    }
+
+
+def _group_layers(summaries: list[FeatureSummary]) -> dict[str, dict]:
+    """Group feature summaries by layer for get_layer_stats.
+
+    Returns per-layer feature counts, geometry type counts, and the property
+    keys of a sample (the first 3 features per layer that have properties).
+    """
+    layers: dict[str, dict] = {}
+    for geom_type, _, layer, _, property_keys in summaries:
+
+        if layer not in layers:
+            layers[layer] = {
+                "feature_count": 0,
+                "geometry_types": defaultdict(int),
+                "property_keys": set(),
+                "_sampled": 0,
+            }
+
+        layers[layer]["feature_count"] += 1
+        layers[layer]["geometry_types"][geom_type] += 1
+
+        # Collect property keys from a sample straight into the layer's set
+        if layers[layer]["_sampled"] < 3 and property_keys:
+            layers[layer]["property_keys"].update(property_keys)
+            layers[layer]["_sampled"] += 1
+
+    for layer_data in layers.values():
+        layer_data["geometry_types"] = dict(layer_data["geometry_types"])
+        layer_data["property_keys"] = sorted(layer_data["property_keys"])
+        del layer_data["_sampled"]
+
+    return layers
 
 
 async def get_tileset_stats(tileset_id: str) -> dict[str, Any]:
@@ -139,71 +409,29 @@ async def get_tileset_stats(tileset_id: str) -> dict[str, Any]:
             return result
         validated_tileset_id = uuid_result.value
 
-        tile_server_url = settings.tile_server_url.rstrip("/")
-
         logger.debug(f"Fetching stats for tileset {validated_tileset_id}")
 
         try:
-            # First, get tileset info with retry
-            tileset_info = await fetch_with_retry(
-                f"{tile_server_url}/api/tilesets/{validated_tileset_id}",
-                headers=_get_auth_headers(),
+            # Fetch tileset info and feature statistics concurrently. Both
+            # requests always complete; if either failed, the tileset info
+            # error is reported first, as a sequential fetch would.
+            tileset_info, feature_stats = await asyncio.gather(
+                _fetch_tileset_info(validated_tileset_id),
+                _tileset_feature_stats(validated_tileset_id),
+                return_exceptions=True,
             )
+            for outcome in (tileset_info, feature_stats):
+                if isinstance(outcome, BaseException):
+                    raise outcome
 
             logger.debug(f"Got tileset info: {tileset_info.get('name')}")
 
-            # Get features for this tileset (up to 1000 for stats)
-            features_data = await fetch_with_retry(
-                f"{tile_server_url}/api/features",
-                params={"tileset_id": validated_tileset_id, "limit": 1000},
-                headers=_get_auth_headers(),
-            )
-
-            # Extract features list
-            features = features_data.get("features", [])
-            if isinstance(features, dict) and "features" in features:
-                features = features["features"]
-
-            logger.debug(f"Retrieved {len(features)} features for analysis")
-
-            # Calculate statistics
-            geometry_types = Counter()
-            layer_stats: dict[str, dict] = {}
-            total_coordinates = 0
-
-            for feature in features:
-                # Count geometry types
-                geom_type = _extract_geometry_type(feature)
-                geometry_types[geom_type] += 1
-
-                # Count coordinates
-                total_coordinates += _count_coordinates(feature)
-
-                # Count by layer
-                layer = feature.get("layer_name", "default")
-                if layer not in layer_stats:
-                    layer_stats[layer] = {
-                        "feature_count": 0,
-                        "geometry_types": Counter(),
-                    }
-                layer_stats[layer]["feature_count"] += 1
-                layer_stats[layer]["geometry_types"][geom_type] += 1
-
-            # Convert Counter to dict for JSON serialization
-            for layer in layer_stats:
-                layer_stats[layer]["geometry_types"] = dict(layer_stats[layer]["geometry_types"])
-
             # Build result
             result = {
                 "tileset_id": validated_tileset_id,
                 "tileset_name": tileset_info.get("name"),
                 "tileset_type": tileset_info.get("type"),
-                "feature_count": len(features),
-                "geometry_types": dict(geometry_types),
-                "layers": layer_stats,
-                "coordinate_count": total_coordinates,
-                "sample_limit": 1000,
-                "is_sample": len(features) >= 1000,
+                **feature_stats,
             }
 
             # Add bounds if available
@@ -294,45 +522,38 @@ async def get_feature_distribution(
                 log.set_result(result)
                 return result
 
-        tile_server_url = settings.tile_server_url.rstrip("/")
-
         logger.debug(f"Getting feature distribution (tileset={tileset_id}, bbox={bbox})")
 
         # Build query parameters
-        params: dict[str, Any] = {"limit": 1000}
+        params: dict[str, Any] = {}
         if tileset_id:
             params["tileset_id"] = tileset_id
         if bbox:
-            params["bbox"] = bbox
+            params["bbox"] = _format_bbox(bbox_result.value)
 
         try:
-            # Use fetch_with_retry for automatic retry
-            data = await fetch_with_retry(
-                f"{tile_server_url}/api/features",
-                params=params,
-                headers=_get_auth_headers(),
-            )
-
-            # Extract features
-            features = data.get("features", [])
-            if isinstance(features, dict) and "features" in features:
-                features = features["features"]
-
-            logger.debug(f"Analyzing {len(features)} features")
-
-            # Count geometry types
-            geometry_types = Counter()
-            for feature in features:
-                geom_type = _extract_geometry_type(feature)
-                geometry_types[geom_type] += 1
-
-            total = len(features)
+            server_stats = await _fetch_server_stats(params)
+            if server_stats is not None:
+                total = server_stats["total_features"]
+                geometry_types = server_stats["geometry_types"]
+                sample_fields = _EXACT_FIELDS
+            else:
+                summaries = await _fetch_feature_summaries(params)
+                total = len(summaries)
+                logger.debug(f"Analyzing {total} features")
 
-            # Calculate percentages
-            percentages = {}
-            if total > 0:
-                for geom_type, count in geometry_types.items():
-                    percentages[geom_type] = round(count / total * 100, 2)
+                # Count geometry types
+                geometry_types = defaultdict(int)
+                for summary in summaries:
+                    geometry_types[summary[0]] += 1
+                sample_fields = _sample_fields(total)
+
+            # Calculate percentages (one multiply per type; empty when total is 0)
+            scale = 100.0 / total if total else 0.0
+            _round = round
+            percentages = {
+                geom_type: _round(count * scale, 2) for geom_type, count in geometry_types.items()
+            }
 
             result = {
                 "total_features": total,
@@ -342,8 +563,7 @@ async def get_feature_distribution(
                     "tileset_id": tileset_id,
                     "bbox": bbox,
                 },
-                "sample_limit": 1000,
-                "is_sample": total >= 1000,
+                **sample_fields,
             }
 
             log.set_result(result)
@@ -399,72 +619,41 @@ async def get_layer_stats(tileset_id: str) -> dict[str, Any]:
             return result
         validated_tileset_id = uuid_result.value
 
-        tile_server_url = settings.tile_server_url.rstrip("/")
-
         logger.debug(f"Getting layer stats for tileset {validated_tileset_id}")
 
         try:
-            # Use fetch_with_retry for automatic retry
-            data = await fetch_with_retry(
-                f"{tile_server_url}/api/features",
-                params={"tileset_id": validated_tileset_id, "limit": 1000},
-                headers=_get_auth_headers(),
+            server_stats = await _fetch_server_stats(
+                {"tileset_id": validated_tileset_id, "include_property_keys": "true"},
             )
-
-            # Extract features
-            features = data.get("features", [])
-            if isinstance(features, dict) and "features" in features:
-                features = features["features"]
-
-            logger.debug(f"Analyzing {len(features)} features for layer stats")
-
-            # Group by layer
-            layers: dict[str, dict] = {}
-            for feature in features:
-                layer = feature.get("layer_name", "default")
-
-                if layer not in layers:
-                    layers[layer] = {
-                        "feature_count": 0,
-                        "geometry_types": Counter(),
-                        "properties_sample": [],
+            if server_stats is not None:
+                total = server_stats["total_features"]
+                layers = {
+                    name: {
+                        "feature_count": layer["feature_count"],
+                        "geometry_types": dict(layer["geometry_types"]),
+                        "property_keys": list(layer.get("property_keys", ())),
                     }
-
-                layers[layer]["feature_count"] += 1
-                geom_type = _extract_geometry_type(feature)
-                layers[layer]["geometry_types"][geom_type] += 1
-
-                # Collect sample of property keys (first 3 features per layer)
-                if len(layers[layer]["properties_sample"]) < 3:
-                    props = feature.get("properties", {})
-                    if props:
-                        layers[layer]["properties_sample"].append(list(props.keys()))
-
-            total = len(features)
-
-            # Post-process layers
-            for layer_name, layer_data in layers.items():
-                # Convert Counter to dict
-                layer_data["geometry_types"] = dict(layer_data["geometry_types"])
-
-                # Calculate percentage
-                if total > 0:
+                    for name, layer in server_stats["layers"].items()
+                }
+                sample_fields = _EXACT_FIELDS
+            else:
+                summaries = await _fetch_feature_summaries({"tileset_id": validated_tileset_id})
+                total = len(summaries)
+                logger.debug(f"Analyzing {total} features for layer stats")
+                layers = _group_layers(summaries)
+                sample_fields = _sample_fields(total)
+
+            # Calculate layer percentages
+            if total > 0:
+                for layer_data in layers.values():
                     layer_data["percentage"] = round(layer_data["feature_count"] / total * 100, 2)
 
-                # Extract unique property keys from samples
-                all_keys = set()
-                for sample in layer_data["properties_sample"]:
-                    all_keys.update(sample)
-                layer_data["property_keys"] = sorted(list(all_keys))
-                del layer_data["properties_sample"]
-
             result = {
                 "tileset_id": validated_tileset_id,
                 "total_features": total,
                 "layer_count": len(layers),
                 "layers": layers,
-                "sample_limit": 1000,
-                "is_sample": total >= 1000,
+                **sample_fields,
             }
 
             log.set_result(result)
@@ -551,48 +740,38 @@ async def get_area_stats(
 
         logger.debug(f"Analyzing area: {area_km2:.2f} km²")
 
-        tile_server_url = settings.tile_server_url.rstrip("/")
-
         # Build query parameters
-        params: dict[str, Any] = {
-            "bbox": bbox,
-            "limit": 1000,
-        }
+        params: dict[str, Any] = {"bbox": _format_bbox(bbox_result.value)}
         if tileset_id:
             params["tileset_id"] = tileset_id
 
         try:
-            # Use fetch_with_retry for automatic retry
-            data = await fetch_with_retry(
-                f"{tile_server_url}/api/features",
-                params=params,
-                headers=_get_auth_headers(),
-            )
-
-            # Extract features
-            features = data.get("features", [])
-            if isinstance(features, dict) and "features" in features:
-                features = features["features"]
-
-            logger.debug(f"Found {len(features)} features in area")
-
-            # Calculate statistics
-            geometry_types = Counter()
-            layers = set()
-            tilesets = set()
-
-            for feature in features:
-                geom_type = _extract_geometry_type(feature)
-                geometry_types[geom_type] += 1
-
-                layer = feature.get("layer_name", "default")
-                layers.add(layer)
-
-                ts_id = feature.get("tileset_id")
-                if ts_id:
-                    tilesets.add(ts_id)
-
-            feature_count = len(features)
+            server_stats = await _fetch_server_stats(params)
+            if server_stats is not None:
+                feature_count = server_stats["total_features"]
+                geometry_types = server_stats["geometry_types"]
+                layers = server_stats["layers"]
+                tilesets_found = server_stats["tilesets_found"]
+                sample_fields = _EXACT_FIELDS
+            else:
+                summaries = await _fetch_feature_summaries(params)
+                feature_count = len(summaries)
+                logger.debug(f"Found {feature_count} features in area")
+
+                # Calculate statistics in one pass, with the set methods
+                # bound to locals outside the loop
+                geometry_types = defaultdict(int)
+                layers = set()
+                tilesets = set()
+                add_layer = layers.add
+                add_tileset = tilesets.add
+                for geom_type, _, layer_name, ts_id, _ in summaries:
+                    geometry_types[geom_type] += 1
+                    add_layer(layer_name)
+                    if ts_id:
+                        add_tileset(ts_id)
+                tilesets_found = len(tilesets)
+                sample_fields = _sample_fields(feature_count)
 
             # Calculate density
             density = feature_count / area_km2 if area_km2 > 0 else 0
@@ -611,14 +790,13 @@ async def get_area_stats(
                     "features_per_100km2": round(density * 100, 2),
                 },
                 "geometry_types": dict(geometry_types),
-                "layers": sorted(list(layers)),
-                "tilesets_found": len(tilesets),
+                "layers": sorted(layers),
+                "tilesets_found": tilesets_found,
                 "query": {
                     "bbox": bbox,
                     "tileset_id": tileset_id,
                 },
-                "sample_limit": 1000,
-                "is_sample": feature_count >= 1000,
+                **sample_fields,
             }
 
             log.set_result(result)
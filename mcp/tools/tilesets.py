@@ -5,16 +5,31 @@ Provides tools for listing, retrieving, and accessing tileset metadata
 from the geo-base tile server API.
 
 Features:
+- Tileset listings cached for 30 seconds, tileset metadata and TileJSON
+  for a minute, with concurrent identical lookups sharing one request
+- Concurrent lookup of several tilesets in one call
 - Automatic retry for transient network errors
 - Input validation with clear error messages
 - Structured logging for debugging and monitoring
 """
 
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from functools import lru_cache, wraps
+from types import MappingProxyType
 from typing import Any
 
 import httpx
 from tenacity import RetryError
 
+from cache import (
+    tilejson_cache,
+    tilejson_flights,
+    tileset_info_cache,
+    tileset_info_flights,
+    tileset_list_cache,
+    tileset_list_flights,
+)
 from config import get_settings
 from errors import ErrorCode, create_error_response, handle_api_error
 from logger import ToolCallLogger, get_logger
@@ -25,13 +40,110 @@ from validators import validate_tileset_type, validate_uuid
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Tile server base URL, stripped once instead of on every tool call
+_TILE_SERVER_URL = settings.tile_server_url.rstrip("/")
+_TILESETS_URL = f"{_TILE_SERVER_URL}/api/tilesets"
 
-def _get_auth_headers() -> dict[str, str]:
-    """Get authentication headers if API token is configured."""
-    headers = {}
+# Maximum number of tileset IDs accepted by a single get_tilesets_bulk call
+MAX_BULK_TILESETS = 50
+
+
+@lru_cache(maxsize=1)
+def _get_auth_headers() -> Mapping[str, str]:
+    """Get authentication headers if API token is configured.
+
+    Settings are fixed for the life of the process, so the headers are
+    built once and shared read-only (httpx copies them per request).
+    """
     if settings.api_token:
-        headers["Authorization"] = f"Bearer {settings.api_token}"
-    return headers
+        return MappingProxyType({"Authorization": f"Bearer {settings.api_token}"})
+    return MappingProxyType({})
+
+
+# (message, error code, hint) returned for a tile server status code instead
+# of the generic handle_api_error response
+StatusErrors = Mapping[int, tuple[str, ErrorCode, str | None]]
+
+
+def _handle_tile_server_errors(
+    action: str,
+    context_key: str,
+    status_errors: StatusErrors | None = None,
+) -> Callable[
+    [Callable[..., Awaitable[dict[str, Any]]]],
+    Callable[..., Awaitable[dict[str, Any]]],
+]:
+    """
+    Decorator factory turning tile server failures into error responses.
+
+    The wrapped coroutine's first argument identifies the request (a URL or
+    tileset ID) and is reported under ``context_key`` in logs and error
+    responses. HTTP status codes listed in ``status_errors`` get a tailored
+    message; everything else goes through handle_api_error.
+
+    Usage:
+        @_handle_tile_server_errors("getting tileset", "tileset_id")
+        async def _fetch_tileset(tileset_id: str) -> dict:
+            ...
+    """
+    status_errors = status_errors or {}
+
+    def decorator(
+        func: Callable[..., Awaitable[dict[str, Any]]],
+    ) -> Callable[..., Awaitable[dict[str, Any]]]:
+        @wraps(func)
+        async def wrapper(context_value: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+            context = {context_key: context_value}
+            try:
+                return await func(context_value, *args, **kwargs)
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                logger.warning(
+                    f"HTTP error {action} {context_value}: {status_code}",
+                    extra={**context, "status_code": status_code},
+                )
+                if status_code not in status_errors:
+                    return handle_api_error(e, context)
+                message, code, hint = status_errors[status_code]
+                if hint is not None:
+                    context["hint"] = hint
+                return create_error_response(message, code, **context)
+            except (httpx.RequestError, RetryError) as e:
+                logger.error(f"Request error {action} {context_value}: {e}", extra=context)
+                return handle_api_error(e, context)
+            except Exception as e:
+                logger.error(f"Unexpected error {action} {context_value}: {e}", extra=context)
+                return create_error_response(
+                    f"Unexpected error: {str(e)}",
+                    ErrorCode.UNKNOWN_ERROR,
+                    **context,
+                )
+
+        return wrapper
+
+    return decorator
+
+
+def _ring_bounds(coords: list) -> dict[str, float]:
+    """Bounding box of a GeoJSON ring, found in a single pass.
+
+    One loop tracking all four extrema instead of four min()/max()
+    generator passes over the coordinates.
+    """
+    min_lng = max_lng = coords[0][0]
+    min_lat = max_lat = coords[0][1]
+    for coord in coords:
+        lng = coord[0]
+        lat = coord[1]
+        if lng < min_lng:
+            min_lng = lng
+        elif lng > max_lng:
+            max_lng = lng
+        if lat < min_lat:
+            min_lat = lat
+        elif lat > max_lat:
+            max_lat = lat
+    return {"min_lng": min_lng, "min_lat": min_lat, "max_lng": max_lng, "max_lat": max_lat}
 
 
 async def list_tilesets(
@@ -61,8 +173,7 @@ async def list_tilesets(
                 return result
             type = type_result.value
 
-        tile_server_url = settings.tile_server_url.rstrip("/")
-        url = f"{tile_server_url}/api/tilesets"
+        url = _TILESETS_URL
 
         # Build query parameters
         params: dict[str, str] = {}
@@ -75,62 +186,52 @@ async def list_tilesets(
 
         logger.debug(f"Fetching tilesets from {url}", extra={"params": str(params)})
 
-        try:
-            # Use fetch_with_retry for automatic retry on transient failures
-            data = await fetch_with_retry(
+        result = await _fetch_tilesets(url, params)
+        log.set_result(result)
+        return result
+
+
+@_handle_tile_server_errors("listing tilesets from", "url")
+async def _fetch_tilesets(url: str, params: dict[str, str]) -> dict[str, Any]:
+    """Fetch the tileset list and project each entry onto its summary fields."""
+    # Use fetch_with_retry for automatic retry on transient failures
+    # (cached per filter; concurrent cold lookups share one request)
+    key = tuple(params.items())
+    data = tileset_list_cache.get(key)
+    if data is None:
+        data = await tileset_list_flights.do(
+            key,
+            lambda: fetch_with_retry(
                 url,
                 params=params if params else None,
                 headers=_get_auth_headers(),
-            )
-
-            # Process and return tilesets
-            tilesets = data if isinstance(data, list) else data.get("tilesets", [])
-
-            logger.debug(f"Retrieved {len(tilesets)} tilesets")
-
-            # Add summary
-            result = {
-                "tilesets": [
-                    {
-                        "id": ts.get("id"),
-                        "name": ts.get("name"),
-                        "description": ts.get("description"),
-                        "type": ts.get("type"),
-                        "format": ts.get("format"),
-                        "is_public": ts.get("is_public", True),
-                        "min_zoom": ts.get("min_zoom", 0),
-                        "max_zoom": ts.get("max_zoom", 22),
-                    }
-                    for ts in tilesets
-                ],
-                "count": len(tilesets),
-                "tile_server_url": tile_server_url,
+            ),
+        )
+        tileset_list_cache.set(key, data)
+
+    # Process and return tilesets
+    tilesets = data if isinstance(data, list) else data.get("tilesets", [])
+
+    logger.debug(f"Retrieved {len(tilesets)} tilesets")
+
+    # Add summary
+    return {
+        "tilesets": [
+            {
+                "id": ts.get("id"),
+                "name": ts.get("name"),
+                "description": ts.get("description"),
+                "type": ts.get("type"),
+                "format": ts.get("format"),
+                "is_public": ts.get("is_public", True),
+                "min_zoom": ts.get("min_zoom", 0),
+                "max_zoom": ts.get("max_zoom", 22),
             }
-            log.set_result(result)
-            return result
-
-        except httpx.HTTPStatusError as e:
-            logger.warning(
-                f"HTTP error listing tilesets: {e.response.status_code}",
-                extra={"status_code": e.response.status_code, "url": url},
-            )
-            result = handle_api_error(e, {"url": url})
-            log.set_result(result)
-            return result
-        except (httpx.RequestError, RetryError) as e:
-            logger.error(f"Request error listing tilesets: {e}", extra={"url": url})
-            result = handle_api_error(e, {"url": url})
-            log.set_result(result)
-            return result
-        except Exception as e:
-            logger.error(f"Unexpected error listing tilesets: {e}", extra={"url": url})
-            result = create_error_response(
-                f"Unexpected error: {str(e)}",
-                ErrorCode.UNKNOWN_ERROR,
-                url=url,
-            )
-            log.set_result(result)
-            return result
+            for ts in tilesets
+        ],
+        "count": len(tilesets),
+        "tile_server_url": _TILE_SERVER_URL,
+    }
 
 
 async def get_tileset(tileset_id: str) -> dict[str, Any]:
@@ -153,117 +254,142 @@ async def get_tileset(tileset_id: str) -> dict[str, Any]:
             return result
         validated_tileset_id = uuid_result.value
 
-        tile_server_url = settings.tile_server_url.rstrip("/")
-        url = f"{tile_server_url}/api/tilesets/{validated_tileset_id}"
-
-        logger.debug(f"Fetching tileset {validated_tileset_id} from {url}")
-
-        try:
-            # Use fetch_with_retry for automatic retry on transient failures
-            tileset = await fetch_with_retry(
-                url,
-                headers=_get_auth_headers(),
-            )
-
-            logger.debug(f"Retrieved tileset: {tileset.get('name')}")
-
-            # Parse bounds if present
-            bounds = tileset.get("bounds")
-            bounds_info = None
-            if bounds:
-                if isinstance(bounds, dict) and "coordinates" in bounds:
-                    # GeoJSON format
-                    coords = bounds["coordinates"][0]
-                    bounds_info = {
-                        "min_lng": min(c[0] for c in coords),
-                        "min_lat": min(c[1] for c in coords),
-                        "max_lng": max(c[0] for c in coords),
-                        "max_lat": max(c[1] for c in coords),
-                    }
-
-            # Parse center if present
-            center = tileset.get("center")
-            center_info = None
-            if center:
-                if isinstance(center, dict) and "coordinates" in center:
-                    center_info = {
-                        "lng": center["coordinates"][0],
-                        "lat": center["coordinates"][1],
-                    }
-
-            result = {
-                "id": tileset.get("id"),
-                "name": tileset.get("name"),
-                "description": tileset.get("description"),
-                "type": tileset.get("type"),
-                "format": tileset.get("format"),
-                "is_public": tileset.get("is_public", True),
-                "min_zoom": tileset.get("min_zoom", 0),
-                "max_zoom": tileset.get("max_zoom", 22),
-                "bounds": bounds_info,
-                "center": center_info,
-                "attribution": tileset.get("attribution"),
-                "metadata": tileset.get("metadata", {}),
-                "created_at": tileset.get("created_at"),
-                "updated_at": tileset.get("updated_at"),
-                "tile_server_url": tile_server_url,
+        result = await _fetch_tileset(validated_tileset_id)
+        log.set_result(result)
+        return result
+
+
+@_handle_tile_server_errors(
+    "getting tileset",
+    "tileset_id",
+    {
+        404: ("Tileset not found", ErrorCode.NOT_FOUND, None),
+        401: (
+            "Authentication required",
+            ErrorCode.AUTH_REQUIRED,
+            "This tileset may be private. Configure API_TOKEN in environment.",
+        ),
+        403: (
+            "Access denied",
+            ErrorCode.FORBIDDEN,
+            "You don't have permission to access this tileset.",
+        ),
+    },
+)
+async def _fetch_tileset(tileset_id: str) -> dict[str, Any]:
+    """Fetch tileset metadata and shape it into the get_tileset response."""
+    url = f"{_TILESETS_URL}/{tileset_id}"
+
+    logger.debug(f"Fetching tileset {tileset_id} from {url}")
+
+    # Use fetch_with_retry for automatic retry on transient failures
+    # (cached for a minute; concurrent cold lookups share one request)
+    tileset = tileset_info_cache.get(tileset_id)
+    if tileset is None:
+        tileset = await tileset_info_flights.do(
+            tileset_id,
+            lambda: fetch_with_retry(url, headers=_get_auth_headers()),
+        )
+        tileset_info_cache.set(tileset_id, tileset)
+
+    logger.debug(f"Retrieved tileset: {tileset.get('name')}")
+
+    # Parse bounds if present
+    bounds = tileset.get("bounds")
+    bounds_info = None
+    if bounds:
+        if isinstance(bounds, dict) and "coordinates" in bounds:
+            # GeoJSON format
+            bounds_info = _ring_bounds(bounds["coordinates"][0])
+
+    # Parse center if present
+    center = tileset.get("center")
+    center_info = None
+    if center:
+        if isinstance(center, dict) and "coordinates" in center:
+            center_info = {
+                "lng": center["coordinates"][0],
+                "lat": center["coordinates"][1],
             }
-            log.set_result(result)
-            return result
 
-        except httpx.HTTPStatusError as e:
-            status_code = e.response.status_code
-            logger.warning(
-                f"HTTP error getting tileset {validated_tileset_id}: {status_code}",
-                extra={"tileset_id": validated_tileset_id, "status_code": status_code},
-            )
+    return {
+        "id": tileset.get("id"),
+        "name": tileset.get("name"),
+        "description": tileset.get("description"),
+        "type": tileset.get("type"),
+        "format": tileset.get("format"),
+        "is_public": tileset.get("is_public", True),
+        "min_zoom": tileset.get("min_zoom", 0),
+        "max_zoom": tileset.get("max_zoom", 22),
+        "bounds": bounds_info,
+        "center": center_info,
+        "attribution": tileset.get("attribution"),
+        "metadata": tileset.get("metadata", {}),
+        "created_at": tileset.get("created_at"),
+        "updated_at": tileset.get("updated_at"),
+        "tile_server_url": _TILE_SERVER_URL,
+    }
+
+
+async def get_tilesets_bulk(tileset_ids: list[str]) -> dict[str, Any]:
+    """
+    Get detailed information about several tilesets in one call.
 
-            if status_code == 404:
-                result = create_error_response(
-                    "Tileset not found",
-                    ErrorCode.NOT_FOUND,
-                    tileset_id=validated_tileset_id,
-                )
-            elif status_code == 401:
-                result = create_error_response(
-                    "Authentication required",
-                    ErrorCode.AUTH_REQUIRED,
-                    tileset_id=validated_tileset_id,
-                    hint="This tileset may be private. Configure API_TOKEN in environment.",
-                )
-            elif status_code == 403:
-                result = create_error_response(
-                    "Access denied",
-                    ErrorCode.FORBIDDEN,
-                    tileset_id=validated_tileset_id,
-                    hint="You don't have permission to access this tileset.",
-                )
-            else:
-                result = handle_api_error(e, {"tileset_id": validated_tileset_id})
+    Each entry is validated on its own; duplicate valid IDs are looked up
+    once. The lookups all run concurrently on the shared client, so with an
+    HTTP_MAX_CONNECTIONS below the number of IDs the excess ones wait for a
+    pooled connection.
 
-            log.set_result(result)
-            return result
-        except (httpx.RequestError, RetryError) as e:
-            logger.error(
-                f"Request error getting tileset {validated_tileset_id}: {e}",
-                extra={"tileset_id": validated_tileset_id},
+    Args:
+        tileset_ids: UUIDs of the tilesets (1-50 entries)
+
+    Returns:
+        Dictionary containing:
+        - tilesets: One get_tileset response per distinct ID (including
+          per-ID errors), in first-seen order
+        - count: Number of tilesets looked up
+    """
+    with ToolCallLogger(logger, "get_tilesets_bulk", tileset_ids=tileset_ids) as log:
+        if not isinstance(tileset_ids, list) or not tileset_ids:
+            result = create_error_response(
+                "tileset_ids must be a non-empty list of strings",
+                ErrorCode.VALIDATION_ERROR,
+                tilesets=[],
+                count=0,
             )
-            result = handle_api_error(e, {"tileset_id": validated_tileset_id})
             log.set_result(result)
             return result
-        except Exception as e:
-            logger.error(
-                f"Unexpected error getting tileset {validated_tileset_id}: {e}",
-                extra={"tileset_id": validated_tileset_id},
-            )
+
+        # Validate before deduplicating, so malformed (even unhashable) entries
+        # get their own error; valid IDs are deduplicated in first-seen order
+        entries: dict[str, None] = {}
+        invalid: dict[int, dict[str, Any]] = {}
+        for tileset_id in tileset_ids:
+            uuid_result = validate_uuid(tileset_id, "tileset_id")
+            if uuid_result.valid:
+                entries.setdefault(uuid_result.value)
+            else:
+                invalid[len(entries) + len(invalid)] = uuid_result.to_error_response(
+                    tileset_id=tileset_id
+                )
+        total = len(entries) + len(invalid)
+        if total > MAX_BULK_TILESETS:
             result = create_error_response(
-                f"Unexpected error: {str(e)}",
-                ErrorCode.UNKNOWN_ERROR,
-                tileset_id=validated_tileset_id,
+                f"tileset_ids must contain at most {MAX_BULK_TILESETS} entries " f"(got {total})",
+                ErrorCode.VALIDATION_ERROR,
+                tilesets=[],
+                count=0,
             )
             log.set_result(result)
             return result
 
+        fetched = iter(await asyncio.gather(*(get_tileset(tileset_id) for tileset_id in entries)))
+        tilesets = [invalid[i] if i in invalid else next(fetched) for i in range(total)]
+
+        result = {"tilesets": tilesets, "count": len(tilesets)}
+        log.set_result(result)
+        return result
+
 
 async def get_tileset_tilejson(tileset_id: str) -> dict[str, Any]:
     """
@@ -287,71 +413,49 @@ async def get_tileset_tilejson(tileset_id: str) -> dict[str, Any]:
             return result
         validated_tileset_id = uuid_result.value
 
-        tile_server_url = settings.tile_server_url.rstrip("/")
-        url = f"{tile_server_url}/api/tilesets/{validated_tileset_id}/tilejson.json"
-
-        logger.debug(f"Fetching TileJSON for {validated_tileset_id} from {url}")
-
-        try:
-            # Use fetch_with_retry for automatic retry on transient failures
-            tilejson = await fetch_with_retry(
-                url,
-                headers=_get_auth_headers(),
-            )
-
-            logger.debug(f"Retrieved TileJSON for tileset: {tilejson.get('name')}")
-
-            result = {
-                "tilejson": tilejson.get("tilejson", "3.0.0"),
-                "name": tilejson.get("name"),
-                "description": tilejson.get("description"),
-                "tiles": tilejson.get("tiles", []),
-                "minzoom": tilejson.get("minzoom", 0),
-                "maxzoom": tilejson.get("maxzoom", 22),
-                "bounds": tilejson.get("bounds"),
-                "center": tilejson.get("center"),
-                "attribution": tilejson.get("attribution"),
-                "vector_layers": tilejson.get("vector_layers", []),
-            }
-            log.set_result(result)
-            return result
-
-        except httpx.HTTPStatusError as e:
-            status_code = e.response.status_code
-            logger.warning(
-                f"HTTP error getting TileJSON for {validated_tileset_id}: {status_code}",
-                extra={"tileset_id": validated_tileset_id, "status_code": status_code},
-            )
-
-            if status_code == 404:
-                result = create_error_response(
-                    "TileJSON not found",
-                    ErrorCode.NOT_FOUND,
-                    tileset_id=validated_tileset_id,
-                    hint="The tileset may not exist or may not support TileJSON.",
-                )
-            else:
-                result = handle_api_error(e, {"tileset_id": validated_tileset_id})
-
-            log.set_result(result)
-            return result
-        except (httpx.RequestError, RetryError) as e:
-            logger.error(
-                f"Request error getting TileJSON for {validated_tileset_id}: {e}",
-                extra={"tileset_id": validated_tileset_id},
-            )
-            result = handle_api_error(e, {"tileset_id": validated_tileset_id})
-            log.set_result(result)
-            return result
-        except Exception as e:
-            logger.error(
-                f"Unexpected error getting TileJSON for {validated_tileset_id}: {e}",
-                extra={"tileset_id": validated_tileset_id},
-            )
-            result = create_error_response(
-                f"Unexpected error: {str(e)}",
-                ErrorCode.UNKNOWN_ERROR,
-                tileset_id=validated_tileset_id,
-            )
-            log.set_result(result)
-            return result
+        result = await _fetch_tilejson(validated_tileset_id)
+        log.set_result(result)
+        return result
+
+
+@_handle_tile_server_errors(
+    "getting TileJSON for",
+    "tileset_id",
+    {
+        404: (
+            "TileJSON not found",
+            ErrorCode.NOT_FOUND,
+            "The tileset may not exist or may not support TileJSON.",
+        ),
+    },
+)
+async def _fetch_tilejson(tileset_id: str) -> dict[str, Any]:
+    """Fetch a tileset's TileJSON and shape it into the tool response."""
+    url = f"{_TILESETS_URL}/{tileset_id}/tilejson.json"
+
+    logger.debug(f"Fetching TileJSON for {tileset_id} from {url}")
+
+    # Use fetch_with_retry for automatic retry on transient failures
+    # (cached for a minute; concurrent cold lookups share one request)
+    tilejson = tilejson_cache.get(tileset_id)
+    if tilejson is None:
+        tilejson = await tilejson_flights.do(
+            tileset_id,
+            lambda: fetch_with_retry(url, headers=_get_auth_headers()),
+        )
+        tilejson_cache.set(tileset_id, tilejson)
+
+    logger.debug(f"Retrieved TileJSON for tileset: {tilejson.get('name')}")
+
+    return {
+        "tilejson": tilejson.get("tilejson", "3.0.0"),
+        "name": tilejson.get("name"),
+        "description": tilejson.get("description"),
+        "tiles": tilejson.get("tiles", []),
+        "minzoom": tilejson.get("minzoom", 0),
+        "maxzoom": tilejson.get("maxzoom", 22),
+        "bounds": tilejson.get("bounds"),
+        "center": tilejson.get("center"),
+        "attribution": tilejson.get("attribution"),
+        "vector_layers": tilejson.get("vector_layers", []),
+    }
@@ -10,19 +10,26 @@ Provides validation functions for common input types including:
 - GeoJSON geometry validation
 
 All validators return a ValidationResult with success status and error details.
+Range, limit and zoom checks on plain ints are memoized, since callers use a
+handful of fixed bounds over small integer domains. Bounding box strings are
+memoized too, as map clients tend to repeat the same viewport.
 """
 
 import re
 import uuid
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from errors import ErrorCode
 
 
-@dataclass
+@dataclass(frozen=True)
 class ValidationResult:
-    """Result of a validation operation."""
+    """Result of a validation operation.
+
+    Frozen so memoized results can be shared between callers.
+    """
 
     valid: bool
     error: str | None = None
@@ -45,17 +52,8 @@ class ValidationResult:
 # ============================================================
 
 
-def validate_uuid(value: str, field_name: str = "id") -> ValidationResult:
-    """
-    Validate that a string is a valid UUID.
-
-    Args:
-        value: String to validate
-        field_name: Name of the field for error messages
-
-    Returns:
-        ValidationResult with parsed UUID if valid
-    """
+def _validate_uuid(value: str, field_name: str = "id") -> ValidationResult:
+    """Uncached implementation of validate_uuid."""
     if not value:
         return ValidationResult(
             valid=False,
@@ -75,6 +73,28 @@ def validate_uuid(value: str, field_name: str = "id") -> ValidationResult:
         )
 
 
+_validate_uuid_cached = lru_cache(maxsize=4096)(_validate_uuid)
+
+
+def validate_uuid(value: str, field_name: str = "id") -> ValidationResult:
+    """
+    Validate that a string is a valid UUID.
+
+    String values are memoized, since the same few IDs tend to be looked
+    up over and over; other types bypass the cache.
+
+    Args:
+        value: String to validate
+        field_name: Name of the field for error messages
+
+    Returns:
+        ValidationResult with parsed UUID if valid
+    """
+    if type(value) is str:
+        return _validate_uuid_cached(value, field_name)
+    return _validate_uuid(value, field_name)
+
+
 def is_valid_uuid(value: str) -> bool:
     """Quick check if a string is a valid UUID."""
     return validate_uuid(value).valid
@@ -175,24 +195,11 @@ def validate_coordinates(
 # ============================================================
 
 
-def validate_bbox(
+def _validate_bbox(
     bbox: str | list | tuple,
     field_name: str = "bbox",
 ) -> ValidationResult:
-    """
-    Validate a bounding box.
-
-    Accepts:
-    - String format: "minx,miny,maxx,maxy" (e.g., "139.5,35.5,140.0,36.0")
-    - List/tuple format: [minx, miny, maxx, maxy]
-
-    Args:
-        bbox: Bounding box to validate
-        field_name: Name of the field for error messages
-
-    Returns:
-        ValidationResult with tuple (min_lng, min_lat, max_lng, max_lat) if valid
-    """
+    """Uncached implementation of validate_bbox."""
     if not bbox:
         return ValidationResult(
             valid=False,
@@ -203,7 +210,8 @@ def validate_bbox(
     # Parse string format
     if isinstance(bbox, str):
         try:
-            parts = [float(x.strip()) for x in bbox.split(",")]
+            # float() ignores surrounding whitespace itself
+            parts = list(map(float, bbox.split(",")))
         except ValueError:
             return ValidationResult(
                 valid=False,
@@ -269,6 +277,34 @@ def validate_bbox(
     return ValidationResult(valid=True, value=(min_lng, min_lat, max_lng, max_lat))
 
 
+_validate_bbox_cached = lru_cache(maxsize=256)(_validate_bbox)
+
+
+def validate_bbox(
+    bbox: str | list | tuple,
+    field_name: str = "bbox",
+) -> ValidationResult:
+    """
+    Validate a bounding box.
+
+    Accepts:
+    - String format: "minx,miny,maxx,maxy" (e.g., "139.5,35.5,140.0,36.0")
+    - List/tuple format: [minx, miny, maxx, maxy]
+
+    String bounding boxes are memoized; lists and tuples bypass the cache.
+
+    Args:
+        bbox: Bounding box to validate
+        field_name: Name of the field for error messages
+
+    Returns:
+        ValidationResult with tuple (min_lng, min_lat, max_lng, max_lat) if valid
+    """
+    if type(bbox) is str:
+        return _validate_bbox_cached(bbox, field_name)
+    return _validate_bbox(bbox, field_name)
+
+
 def parse_bbox(bbox_str: str) -> tuple[float, float, float, float] | None:
     """
     Parse bbox string to tuple. Returns None if invalid.
@@ -284,24 +320,13 @@ def parse_bbox(bbox_str: str) -> tuple[float, float, float, float] | None:
 # ============================================================
 
 
-def validate_zoom(
+def _validate_zoom(
     value: int | str,
     min_zoom: int = 0,
     max_zoom: int = 22,
     field_name: str = "zoom",
 ) -> ValidationResult:
-    """
-    Validate a map zoom level.
-
-    Args:
-        value: Zoom level to validate
-        min_zoom: Minimum allowed zoom (default: 0)
-        max_zoom: Maximum allowed zoom (default: 22)
-        field_name: Name of the field for error messages
-
-    Returns:
-        ValidationResult with int value if valid
-    """
+    """Uncached implementation of validate_zoom."""
     try:
         zoom = int(value)
     except (ValueError, TypeError):
@@ -321,6 +346,34 @@ def validate_zoom(
     return ValidationResult(valid=True, value=zoom)
 
 
+_validate_zoom_cached = lru_cache(maxsize=256)(_validate_zoom)
+
+
+def validate_zoom(
+    value: int | str,
+    min_zoom: int = 0,
+    max_zoom: int = 22,
+    field_name: str = "zoom",
+) -> ValidationResult:
+    """
+    Validate a map zoom level.
+
+    Integer zoom levels are memoized; other input types bypass the cache.
+
+    Args:
+        value: Zoom level to validate
+        min_zoom: Minimum allowed zoom (default: 0)
+        max_zoom: Maximum allowed zoom (default: 22)
+        field_name: Name of the field for error messages
+
+    Returns:
+        ValidationResult with int value if valid
+    """
+    if type(value) is int:
+        return _validate_zoom_cached(value, min_zoom, max_zoom, field_name)
+    return _validate_zoom(value, min_zoom, max_zoom, field_name)
+
+
 # ============================================================
 # Tile Coordinate Validation
 # ============================================================
@@ -696,24 +749,13 @@ def validate_positive_number(
     return ValidationResult(valid=True, value=num)
 
 
-def validate_range(
+def _validate_range(
     value: float | int | str,
     field_name: str,
     min_value: float | None = None,
     max_value: float | None = None,
 ) -> ValidationResult:
-    """
-    Validate a number is within a range.
-
-    Args:
-        value: Number to validate
-        field_name: Name of the field for error messages
-        min_value: Minimum allowed value (inclusive)
-        max_value: Maximum allowed value (inclusive)
-
-    Returns:
-        ValidationResult with float value if valid
-    """
+    """Uncached implementation of validate_range."""
     try:
         num = float(value)
     except (ValueError, TypeError):
@@ -740,24 +782,41 @@ def validate_range(
     return ValidationResult(valid=True, value=num)
 
 
-def validate_limit(
-    value: int | str,
-    field_name: str = "limit",
-    min_value: int = 1,
-    max_value: int = 1000,
+_validate_range_cached = lru_cache(maxsize=256)(_validate_range)
+
+
+def validate_range(
+    value: float | int | str,
+    field_name: str,
+    min_value: float | None = None,
+    max_value: float | None = None,
 ) -> ValidationResult:
     """
-    Validate a limit/count parameter.
+    Validate a number is within a range.
+
+    Integer values are memoized; floats and strings bypass the cache.
 
     Args:
-        value: Limit value to validate
+        value: Number to validate
         field_name: Name of the field for error messages
-        min_value: Minimum allowed value (default: 1)
-        max_value: Maximum allowed value (default: 1000)
+        min_value: Minimum allowed value (inclusive)
+        max_value: Maximum allowed value (inclusive)
 
     Returns:
-        ValidationResult with int value if valid
+        ValidationResult with float value if valid
     """
+    if type(value) is int:
+        return _validate_range_cached(value, field_name, min_value, max_value)
+    return _validate_range(value, field_name, min_value, max_value)
+
+
+def _validate_limit(
+    value: int | str,
+    field_name: str = "limit",
+    min_value: int = 1,
+    max_value: int = 1000,
+) -> ValidationResult:
+    """Uncached implementation of validate_limit."""
     try:
         limit = int(value)
     except (ValueError, TypeError):
@@ -777,6 +836,34 @@ def validate_limit(
     return ValidationResult(valid=True, value=limit)
 
 
+_validate_limit_cached = lru_cache(maxsize=256)(_validate_limit)
+
+
+def validate_limit(
+    value: int | str,
+    field_name: str = "limit",
+    min_value: int = 1,
+    max_value: int = 1000,
+) -> ValidationResult:
+    """
+    Validate a limit/count parameter.
+
+    Integer values are memoized; other input types bypass the cache.
+
+    Args:
+        value: Limit value to validate
+        field_name: Name of the field for error messages
+        min_value: Minimum allowed value (default: 1)
+        max_value: Maximum allowed value (default: 1000)
+
+    Returns:
+        ValidationResult with int value if valid
+    """
+    if type(value) is int:
+        return _validate_limit_cached(value, field_name, min_value, max_value)
+    return _validate_limit(value, field_name, min_value, max_value)
+
+
 # ============================================================
 # Filter String Validation
 # ============================================================